@@ -6,22 +6,22 @@ from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 
-from typing import Any
+from typing import Any, Optional
 
-from ...database import get_db
+from ...database import get_db, run_db
 from ...models.user import User
 from ...schemas.auth import Token, LoginRequest, PasswordReset
 from ...schemas.user import UserCreate, UserResponse
-from ...utils.security import (
-    verify_password,
-    get_password_hash,
-    create_access_token,
-    verify_token
-)
+from ...utils.security import create_access_token
+from ...utils.password_pool import password_hasher
+from ...utils.auth_cache import get_user_by_subject, invalidate_user, verify_token_cached
+from ...utils.metrics import TimedRoute
 from ...config import settings
+from ...utils.log import get_logger
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+logger = get_logger(__name__, sampled=True)
 
 
 async def get_current_user(
@@ -34,7 +34,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = verify_token(token)
+    payload = verify_token_cached(token)
     if not payload:
         raise credentials_exception
 
@@ -42,19 +42,14 @@ async def get_current_user(
     if username is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.username == username).first()
+    user = await run_db(db, get_user_by_subject, username)
     if user is None:
         raise credentials_exception
 
     return user
 
 
-@router.post("/register", response_model=UserResponse)
-async def register(
-        user_data: UserCreate,
-        db: Session = Depends(get_db)
-) -> Any:
-    """Register a new user"""
+def _check_registration(db: Session, user_data: UserCreate) -> None:
     # Check existing user
     if db.query(User).filter(User.username == user_data.username).first():
         raise HTTPException(
@@ -69,11 +64,15 @@ async def register(
             detail="Email already registered"
         )
 
-    # Create user
+    # Hash hesaplanırken bağlantı havuza dönsün
+    db.rollback()
+
+
+def _create_user(db: Session, user_data: UserCreate, password_hash: str) -> User:
     db_user = User(
         username=user_data.username,
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=password_hash,
         full_name=user_data.full_name,
         daily_goal=user_data.daily_goal
     )
@@ -85,11 +84,27 @@ async def register(
     return db_user
 
 
+@router.post("/register", response_model=UserResponse)
+async def register(
+        user_data: UserCreate,
+        db: Session = Depends(get_db)
+) -> Any:
+    """Register a new user"""
+    await run_db(db, _check_registration, user_data)
+    # Hash, kullanıcı adı/e-posta kontrolünden sonra havuzda hesaplanır
+    password_hash = await password_hasher.hash(user_data.password)
+    return await run_db(db, _create_user, user_data, password_hash)
+
+
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import Any
 
 
+def _get_user_by_email(db: Session, email: str) -> Optional[User]:
+    return db.query(User).filter(User.email == email).first()
+
+
 @router.get("/debug-password")
 async def debug_password(
         email: str = Query(..., description="Email address to check"),
@@ -99,7 +114,7 @@ async def debug_password(
     """Debug password hashing (sadece geliştirme ortamında kullanın!)"""
     try:
         # Kullanıcıyı bul
-        user = db.query(User).filter(User.email == email).first()
+        user = await run_db(db, _get_user_by_email, email)
         if not user:
             return {
                 "status": "error",
@@ -109,7 +124,7 @@ async def debug_password(
             }
 
         # Şifre doğrulamasını kontrol et
-        is_valid = verify_password(password, user.password_hash)
+        is_valid = await password_hasher.verify(password, user.password_hash)
 
         return {
             "status": "info",
@@ -130,6 +145,25 @@ async def debug_password(
         }
 
 
+def _get_login_credentials(db: Session, login: str):
+    credentials = db.query(User.id, User.username, User.email, User.password_hash).filter(
+        (User.username == login) |
+        (User.email == login)
+    ).first()
+    # bcrypt havuzda beklerken bağlantıyı tutmayalım; satır ORM nesnesi
+    # olmadığı için rollback alanları expire etmez
+    db.rollback()
+    return credentials
+
+
+def _update_password_hash(db: Session, user_id: int, password_hash: str) -> None:
+    db.query(User).filter(User.id == user_id).update(
+        {"password_hash": password_hash},
+        synchronize_session=False
+    )
+    db.commit()
+
+
 @router.post("/login", response_model=Token)
 async def login(
         request: Request,
@@ -138,34 +172,35 @@ async def login(
 ) -> Any:
     """Login user"""
     try:
-        # Debug için gelen verileri yazdır
-        print(f"Login attempt - Username: {form_data.username}, Password length: {len(form_data.password)}")
+        logger.debug("Login attempt", extra={"login": form_data.username})
 
         # Kullanıcıyı bul (email veya username ile)
-        user = db.query(User).filter(
-            (User.username == form_data.username) |
-            (User.email == form_data.username)
-        ).first()
+        user = await run_db(db, _get_login_credentials, form_data.username)
 
         if not user:
-            print(f"User not found: {form_data.username}")
+            logger.info("Login failed: unknown user", extra={"login": form_data.username})
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password"
             )
 
-        # Password verification debug
-        print(f"Verifying password for user: {user.username}")
-        print(f"Stored hash: {user.password_hash}")
-        is_valid = verify_password(form_data.password, user.password_hash)
-        print(f"Password verification result: {is_valid}")
-
+        if settings.PASSWORD_REHASH_ON_LOGIN:
+            is_valid, new_hash = await password_hasher.verify_and_update(form_data.password, user.password_hash)
+        else:
+            is_valid, new_hash = await password_hasher.verify(form_data.password, user.password_hash), None
         if not is_valid:
+            logger.info("Login failed: wrong password", extra={"user_id": user.id})
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password"
             )
 
+        # Hash eski şema/round ile üretilmişse düz şifre elimizdeyken yenile;
+        # toplu UPDATE mapper olaylarını tetiklemez, önbelleği elle düşür
+        if new_hash:
+            await run_db(db, _update_password_hash, user.id, new_hash)
+            invalidate_user(user.username)
+
         # Create access token
         access_token = create_access_token(
             data={"sub": user.username}
@@ -179,8 +214,10 @@ async def login(
             "username": user.username,
             "email": user.email
         }
-    except Exception as e:
-        print(f"Login error: {str(e)}")
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Login error")
         raise
 
 # Test endpoint for creating a new password hash
@@ -191,7 +228,7 @@ async def hash_password(
 ) -> Any:
     """Test password hashing"""
     try:
-        hashed = get_password_hash(password)
+        hashed = await password_hasher.hash(password)
         return {
             "password": password,
             "hash": hashed
@@ -205,7 +242,7 @@ async def reset_password(
         db: Session = Depends(get_db)
 ) -> Any:
     """Reset user password"""
-    if not verify_password(password_data.old_password, current_user.password_hash):
+    if not await password_hasher.verify(password_data.old_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect password"
@@ -217,8 +254,10 @@ async def reset_password(
             detail="Passwords do not match"
         )
 
-    current_user.password_hash = get_password_hash(password_data.new_password)
-    db.commit()
+    username = current_user.username
+    current_user.password_hash = await password_hasher.hash(password_data.new_password)
+    await run_db(db, Session.commit)
+    invalidate_user(username)
 
     return {"message": "Password updated successfully"}
 
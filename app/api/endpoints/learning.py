@@ -5,26 +5,24 @@ from sqlalchemy.orm import Session
 from typing import Any, List
 from datetime import datetime, timedelta, timezone
 
-from ...database import get_db
+from ...database import get_db, run_db
 from ...models.user import User
 from ...models.user_word import UserWord
 from ...models.word import Word
 from ..endpoints.auth import get_current_user
 from ...utils.learning import (
     analyze_learning_patterns,
-    calculate_retention_score,
-    identify_problem_areas
+    calculate_retention_score
 )
+from ...utils.statistics import get_progress_summary, get_problem_areas
+from ...utils.log import get_logger
+from ...utils.metrics import TimedRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
+logger = get_logger(__name__)
 
 
-@router.get("/daily-progress")
-async def get_daily_progress(
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
-) -> Any:
-    """Get user's daily learning progress"""
+def _daily_progress(db: Session, current_user: User) -> dict:
     today = datetime.utcnow().date()
 
     today_reviews = db.query(UserWord).filter(
@@ -47,12 +45,16 @@ async def get_daily_progress(
     }
 
 
-@router.get("/streak-info")
-async def get_streak_info(
+@router.get("/daily-progress")
+async def get_daily_progress(
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
 ) -> Any:
-    """Get user's learning streak information"""
+    """Get user's daily learning progress"""
+    return await run_db(db, _daily_progress, current_user)
+
+
+def _streak_info(db: Session, current_user: User) -> dict:
     today = datetime.utcnow().date()
 
     today_activity = db.query(UserWord).filter(
@@ -87,6 +89,15 @@ async def get_streak_info(
     }
 
 
+@router.get("/streak-info")
+async def get_streak_info(
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+) -> Any:
+    """Get user's learning streak information"""
+    return await run_db(db, _streak_info, current_user)
+
+
 def get_weekly_stats_query(user_id: int, week_ago: datetime) -> dict:
     """Helper function to get weekly stats using raw SQL"""
     try:
@@ -109,9 +120,15 @@ def get_weekly_stats_query(user_id: int, week_ago: datetime) -> dict:
                 "week_ago": week_ago
             }
         }
-    except Exception as e:
-        print(f"Query creation error: {str(e)}")
+    except Exception:
+        logger.exception("Query creation error")
         raise
+
+
+def _fetch_all(db: Session, query, params: dict) -> list:
+    return db.execute(query, params).all()
+
+
 @router.get("/weekly-stats")
 async def get_weekly_stats(
         current_user: User = Depends(get_current_user),
@@ -136,7 +153,9 @@ async def get_weekly_stats(
         query_data = get_weekly_stats_query(current_user.id, week_ago)
 
         # Execute query
-        result = db.execute(
+        result = await run_db(
+            db,
+            _fetch_all,
             query_data["query"],
             query_data["params"]
         )
@@ -168,23 +187,14 @@ async def get_weekly_stats(
         }
 
     except Exception as e:
-        print(f"Error in weekly_stats: {str(e)}")
+        logger.exception("Error in weekly_stats")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
 
-@router.get("/weekly-stats-alt")
-async def get_weekly_stats_alt(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-) -> Any:
-    """Get user's weekly learning statistics using SQLAlchemy expressions"""
-    today = datetime.utcnow().date()
-    week_ago = today - timedelta(days=7)
-
-    # Query using SQLAlchemy expressions
-    result = db.query(
+def _weekly_review_rows(db: Session, user_id: int, week_ago) -> list:
+    return db.query(
         func.date(UserWord.last_reviewed).label('review_date'),
         func.count().label('words_reviewed'),
         func.sum(case(
@@ -192,12 +202,25 @@ async def get_weekly_stats_alt(
             else_=0
         )).label('correct_answers')
     ).filter(
-        UserWord.user_id == current_user.id,
+        UserWord.user_id == user_id,
         UserWord.last_reviewed >= week_ago
     ).group_by(
         func.date(UserWord.last_reviewed)
     ).all()
 
+
+@router.get("/weekly-stats-alt")
+async def get_weekly_stats_alt(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> Any:
+    """Get user's weekly learning statistics using SQLAlchemy expressions"""
+    today = datetime.utcnow().date()
+    week_ago = today - timedelta(days=7)
+
+    # Query using SQLAlchemy expressions
+    result = await run_db(db, _weekly_review_rows, current_user.id, week_ago)
+
     daily_stats = {
         (week_ago + timedelta(days=i)).isoformat(): {
             "words_reviewed": 0,
@@ -236,34 +259,24 @@ async def get_performance_analysis(
         db: Session = Depends(get_db)
 ) -> Any:
     """Get detailed analysis of learning performance"""
-    user_words = db.query(UserWord).filter(
-        UserWord.user_id == current_user.id
-    ).all()
+    summary = await run_db(db, get_progress_summary, current_user.id)
+    total_words = summary["total_words"]
 
-    if not user_words:
+    if not total_words:
         return {
             "total_words": 0,
             "performance_metrics": None,
             "problem_areas": []
         }
 
-    total_words = len(user_words)
-    mastered_words = len([w for w in user_words if w.is_learned])
-
-    if total_words > 0:
-        average_retention = sum(w.retention_level for w in user_words) / total_words
-    else:
-        average_retention = 0
-
     return {
         "total_words": total_words,
         "performance_metrics": {
-            "mastery_rate": (mastered_words / total_words * 100) if total_words > 0 else 0,
-            "average_retention": average_retention,
-            "total_reviews": sum(w.times_reviewed for w in user_words)
+            "mastery_rate": summary["learned_words"] / total_words * 100,
+            "average_retention": summary["average_retention"],
+            "total_reviews": summary["total_reviews"]
         },
         "problem_areas": [
-                             w.word.part_of_speech for w in user_words
-                             if w.mistakes_count > 2
-                         ][:3]
-    }
\ No newline at end of file
+            area["value"] for area in await run_db(db, get_problem_areas, current_user.id)
+        ][:3]
+    }
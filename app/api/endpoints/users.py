@@ -4,17 +4,21 @@ from sqlalchemy.orm import Session
 from typing import Any, List
 from datetime import datetime
 
-from ...database import get_db
+from ...database import get_db, run_db
 from ...models.user import User
-from ...models.user_word import UserWord
 from ...schemas.user import UserUpdate, UserResponse, UserStatistics
 from ..endpoints.auth import get_current_user
-from ...utils.learning import analyze_learning_patterns
+from ...config import settings
+from ...utils.auth_cache import invalidate_user
+from ...utils.progress import reset_user_progress
+from ...utils.statistics import get_cached_progress_summary, invalidate_user_statistics
+from ...utils.metrics import TimedRoute
+from ...utils.learning_columns import analyze_learning_patterns, load_user_word_columns
 from fastapi import Body
 from pydantic import BaseModel
 class DailyGoalUpdate(BaseModel):
     goal: int
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("/me/statistics", response_model=UserStatistics)
@@ -23,15 +27,15 @@ async def get_user_statistics(
         db: Session = Depends(get_db)
 ) -> Any:
     """Get current user's learning statistics"""
-    user_words = db.query(UserWord).filter(UserWord.user_id == current_user.id).all()
+    summary = await run_db(db, get_cached_progress_summary, current_user.id)
 
-    total_words = len(user_words)
-    learned_words = len([w for w in user_words if w.is_learned])
+    total_words = summary["total_words"]
+    learned_words = summary["learned_words"]
     words_in_progress = total_words - learned_words
 
     if total_words > 0:
         completion_rate = (learned_words / total_words) * 100
-        average_retention = sum(w.retention_level for w in user_words) / total_words
+        average_retention = summary["average_retention"]
     else:
         completion_rate = 0
         average_retention = 0
@@ -45,6 +49,11 @@ async def get_user_statistics(
     }
 
 
+def _delete_user(db: Session, user: User) -> None:
+    db.delete(user)
+    db.commit()
+
+
 @router.delete("/me")
 async def delete_user(
         response: Response,
@@ -52,12 +61,19 @@ async def delete_user(
         db: Session = Depends(get_db)
 ) -> None:
     """Delete current user's account"""
-    db.delete(current_user)
-    db.commit()
+    user_id, username = current_user.id, current_user.username
+    await run_db(db, _delete_user, current_user)
+    invalidate_user_statistics(user_id)
+    invalidate_user(username)
     response.status_code = status.HTTP_204_NO_CONTENT
     return None
 
 
+def _save_user(db: Session, user: User) -> None:
+    db.commit()
+    db.refresh(user)
+
+
 @router.put("/me", response_model=UserResponse)
 async def update_user(
         user_update: UserUpdate,
@@ -69,8 +85,8 @@ async def update_user(
         setattr(current_user, field, value)
 
     current_user.last_activity = datetime.utcnow()
-    db.commit()
-    db.refresh(current_user)
+    await run_db(db, _save_user, current_user)
+    invalidate_user(current_user.username)
 
     return current_user
 
@@ -89,7 +105,7 @@ async def update_daily_goal(
         )
 
     current_user.daily_goal = update.goal
-    db.commit()
+    await run_db(db, Session.commit)
 
     return {
         "status": "success",
@@ -104,17 +120,18 @@ async def reset_learning_progress(
         db: Session = Depends(get_db)
 ) -> Any:
     """Reset user's learning progress"""
-    user_words = db.query(UserWord).filter(UserWord.user_id == current_user.id).all()
-    for user_word in user_words:
-        user_word.retention_level = 0
-        user_word.confidence_level = 0
-        user_word.is_learned = False
-        user_word.times_reviewed = 0
-        user_word.mistakes_count = 0
-        user_word.next_review = datetime.utcnow()
-
-    db.commit()
-    return {"message": "Learning progress reset successfully"}
+    user_id = current_user.id
+    reset_count = await run_db(
+        db,
+        reset_user_progress,
+        user_id,
+        chunk_size=settings.RESET_PROGRESS_CHUNK_SIZE
+    )
+    invalidate_user_statistics(user_id)
+    return {
+        "message": "Learning progress reset successfully",
+        "reset_count": reset_count
+    }
 
 
 @router.get("/me/learning-patterns")
@@ -123,5 +140,5 @@ async def get_learning_patterns(
         db: Session = Depends(get_db)
 ) -> Any:
     """Get user's learning patterns and analytics"""
-    user_words = db.query(UserWord).filter(UserWord.user_id == current_user.id).all()
-    return analyze_learning_patterns(user_words)
\ No newline at end of file
+    columns = await run_db(db, load_user_word_columns, current_user.id)
+    return analyze_learning_patterns(columns)
\ No newline at end of file
@@ -1,12 +1,12 @@
 # app/api/endpoints/words.py
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from pydantic import BaseModel
 from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import Any, List
+from typing import Any, List, Optional
 from datetime import datetime, timedelta
 
-from ...database import get_db
+from ...database import get_db, run_db
 from ...models.word import Word
 from ...models.user_word import UserWord
 from ...models.user import User
@@ -16,7 +16,7 @@ from ...schemas.word import (
     WordResponse,
     WordWithProgress,
     WordReviewSubmission,
-    WordLearningStatus, WordSuggestionCreate, WordSuggestionResponse, WordSchema, PartOfSpeechEnum
+    WordLearningStatus, WordSuggestionCreate, WordSuggestionResponse, WordSchema
 )
 from ..endpoints.auth import get_current_user
 from ...utils.learning import (
@@ -24,9 +24,20 @@ from ...utils.learning import (
     calculate_retention_score,
     calculate_priority_score
 )
+from ...utils.statistics import invalidate_user_statistics
+from ...utils.progress import add_words_to_deck
+from ...utils import search as search_index
+from ...utils.catalog import word_catalog
+from ...utils.metrics import TimedRoute
+from ...utils.review_queue import (
+    get_review_queue,
+    learned_words_query,
+    difficult_words_query,
+    new_words_query
+)
 class BulkAddRequest(BaseModel):
     word_ids: List[int]
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 from typing import List
@@ -38,7 +49,7 @@ from ...schemas.word import WordResponse, WordWithProgress
 from ..endpoints.auth import get_current_user
 from ...database import get_db
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 @router.get("/next-words", response_model=List[WordWithProgress])
 async def get_next_review_words(
@@ -47,79 +58,44 @@ async def get_next_review_words(
         db: Session = Depends(get_db)
 ) -> Any:
     """Get next words for review based on spaced repetition"""
-    user_words = db.query(UserWord).filter(
-        UserWord.user_id == current_user.id,
-        UserWord.next_review <= datetime.utcnow()
-    ).order_by(UserWord.next_review).limit(limit).all()
-
-    # Fetch the word details for each UserWord
-    word_data = []
-    for uw in user_words:
-        word = db.query(Word).get(uw.word_id)
-        part_of_speech = word.part_of_speech
-        if part_of_speech in PartOfSpeechEnum.__members__:
-            part_of_speech_enum = PartOfSpeechEnum(part_of_speech)
-        else:
-            part_of_speech_enum = None
-
-        word_response = WordResponse(
-            id=word.id,
-            english=word.english,
-            turkish=word.turkish,
-            phonetic=word.phonetic,
-            difficulty_level=word.difficulty_level,
-            part_of_speech=part_of_speech_enum,
-            example_sentence=word.example_sentence,
-            example_sentence_translation=word.example_sentence_translation,
-            audio_url=word.audio_url,
-            image_url=word.image_url,
-            tags=word.tags
-        )
-        word_data.append({
-            **word_response.dict(),
-            "retention_level": uw.retention_level,
-            "confidence_level": uw.confidence_level,
-            "next_review": uw.next_review,
-            "is_learned": uw.is_learned,
-            "mistakes_count": uw.mistakes_count
-        })
+    return await run_db(db, get_review_queue, current_user.id, limit)
+
+def _next_learning_words(
+        db: Session,
+        user_id: int,
+        limit: int,
+        after_level: Optional[int],
+        after_id: Optional[int]
+) -> List[WordSchema]:
+    new_words = new_words_query(
+        db,
+        user_id,
+        after_level=after_level,
+        after_id=after_id
+    ).limit(limit).all()
+
+    # Artık burada UserWord oluşturmuyoruz, sadece kelimeleri dönüyoruz
+    return [WordSchema.from_orm(word) for word in new_words]
 
-    return word_data
 
 @router.get("/next-learning-words", response_model=List[WordSchema])
 async def get_next_learning_words(
         limit: int = Query(default=10, ge=1, le=50),
+        after_level: Optional[int] = Query(default=None, description="difficulty_level of the last word of the previous page"),
+        after_id: Optional[int] = Query(default=None, description="id of the last word of the previous page"),
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
 ) -> Any:
     """Get next words for learning"""
-    # Get words user is already learning
-    learning_word_ids = db.query(UserWord.word_id).filter(
-        UserWord.user_id == current_user.id
-    ).all()
-    learning_word_ids = [w[0] for w in learning_word_ids]
-
-    # Get new words user hasn't started learning yet
-    new_words = db.query(Word).filter(
-        ~Word.id.in_(learning_word_ids) if learning_word_ids else True
-    ).order_by(
-        Word.difficulty_level
-    ).limit(limit).all()
-
-    if not new_words:
-        return []
-
-    # Artık burada UserWord oluşturmuyoruz, sadece kelimeleri dönüyoruz
-    return [WordSchema.from_orm(word) for word in new_words]
-
-@router.post("/suggest", response_model=WordSuggestionResponse)
-async def suggest_word(
-        suggestion: WordSuggestionCreate,
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
-) -> Any:
-    """Submit a word suggestion for admin review"""
+    if (after_level is None) != (after_id is None):
+        # Yarım imleç sessizce yok sayılırsa ilk sayfa tekrar döner
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="after_level and after_id must be given together"
+        )
+    return await run_db(db, _next_learning_words, current_user.id, limit, after_level, after_id)
 
+def _suggest_word(db: Session, user_id: int, suggestion: WordSuggestionCreate) -> WordSuggestion:
     # Check if word already exists
     existing_word = db.query(Word).filter(
         func.lower(Word.english) == func.lower(suggestion.english)
@@ -158,7 +134,7 @@ async def suggest_word(
         turkish=suggestion.turkish,
         part_of_speech=suggestion.part_of_speech.lower(),
         example_sentence=suggestion.example_sentence,
-        suggested_by_user_id=current_user.id,
+        suggested_by_user_id=user_id,
         status="pending"
     )
 
@@ -174,15 +150,21 @@ async def suggest_word(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error creating word suggestion: {str(e)}"
         )
-@router.post("/review")
-async def submit_word_review(
-        review: WordReviewSubmission,
+
+
+@router.post("/suggest", response_model=WordSuggestionResponse)
+async def suggest_word(
+        suggestion: WordSuggestionCreate,
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
 ) -> Any:
-    """Submit a word review and update learning progress"""
+    """Submit a word suggestion for admin review"""
+    return await run_db(db, _suggest_word, current_user.id, suggestion)
+
+
+def _submit_review(db: Session, user_id: int, review: WordReviewSubmission) -> dict:
     user_word = db.query(UserWord).filter(
-        UserWord.user_id == current_user.id,
+        UserWord.user_id == user_id,
         UserWord.word_id == review.word_id
     ).first()
 
@@ -220,15 +202,22 @@ async def submit_word_review(
     }
 
 
-@router.get("/progress/{word_id}")
-async def get_word_progress(
-        word_id: int,
+@router.post("/review")
+async def submit_word_review(
+        review: WordReviewSubmission,
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
 ) -> Any:
-    """Get learning progress for a specific word"""
+    """Submit a word review and update learning progress"""
+    user_id = current_user.id
+    result = await run_db(db, _submit_review, user_id, review)
+    invalidate_user_statistics(user_id)
+    return result
+
+
+def _word_progress(db: Session, user_id: int, word_id: int) -> dict:
     user_word = db.query(UserWord).filter(
-        UserWord.user_id == current_user.id,
+        UserWord.user_id == user_id,
         UserWord.word_id == word_id
     ).first()
 
@@ -247,56 +236,32 @@ async def get_word_progress(
         "mastered": user_word.retention_level >= 5
     }
 
+
+@router.get("/progress/{word_id}")
+async def get_word_progress(
+        word_id: int,
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+) -> Any:
+    """Get learning progress for a specific word"""
+    return await run_db(db, _word_progress, current_user.id, word_id)
+
 @router.get("/search")
 async def search_words(
+        response: Response,
         query: str = Query(..., min_length=1),
+        limit: int = Query(default=20, ge=1, le=100),
+        offset: int = Query(default=0, ge=0),
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
 ) -> Any:
-    """Search for words in the database"""
-    words = db.query(Word).filter(
-        Word.english.ilike(f"%{query}%") |
-        Word.turkish.ilike(f"%{query}%")
-    ).all()
-
-    # Get learning progress for found words
-    result = []
-    for word in words:
-        user_word = db.query(UserWord).filter(
-            UserWord.user_id == current_user.id,
-            UserWord.word_id == word.id
-        ).first()
-
-        word_data = {
-            "id": word.id,
-            "english": word.english,
-            "turkish": word.turkish,
-            "difficulty_level": word.difficulty_level,
-            "example_sentence": word.example_sentence,
-            "part_of_speech": word.part_of_speech,
-            "learning_status": None
-        }
-
-        if user_word:
-            word_data["learning_status"] = {
-                "retention_level": user_word.retention_level,
-                "confidence_level": user_word.confidence_level,
-                "is_learned": user_word.is_learned,
-                "next_review": user_word.next_review
-            }
-
-        result.append(word_data)
-
-    return result
+    """Search for words in the database; X-Total-Count holds the number of matches"""
+    total, words = await run_db(db, search_index.search_words, current_user.id, query, limit=limit, offset=offset)
+    response.headers["X-Total-Count"] = str(total)
+    return words
 
 
-@router.post("/add-to-learning")
-async def add_word_to_learning(
-        word_id: int,
-        current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
-) -> Any:
-    """Add a word to user's learning list"""
+def _add_word_to_learning(db: Session, user_id: int, word_id: int) -> dict:
     # Check if word exists
     word = db.query(Word).filter(Word.id == word_id).first()
     if not word:
@@ -307,7 +272,7 @@ async def add_word_to_learning(
 
     # Check if word is already in learning list
     existing = db.query(UserWord).filter(
-        UserWord.user_id == current_user.id,
+        UserWord.user_id == user_id,
         UserWord.word_id == word_id
     ).first()
 
@@ -319,7 +284,7 @@ async def add_word_to_learning(
 
     # Add word to learning list
     user_word = UserWord(
-        user_id=current_user.id,
+        user_id=user_id,
         word_id=word_id,
         next_review=datetime.utcnow()
     )
@@ -334,15 +299,22 @@ async def add_word_to_learning(
     }
 
 
-@router.delete("/remove-from-learning/{word_id}")
-async def remove_word_from_learning(
+@router.post("/add-to-learning")
+async def add_word_to_learning(
         word_id: int,
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
 ) -> Any:
-    """Remove a word from user's learning list"""
+    """Add a word to user's learning list"""
+    user_id = current_user.id
+    result = await run_db(db, _add_word_to_learning, user_id, word_id)
+    invalidate_user_statistics(user_id)
+    return result
+
+
+def _remove_word_from_learning(db: Session, user_id: int, word_id: int) -> None:
     user_word = db.query(UserWord).filter(
-        UserWord.user_id == current_user.id,
+        UserWord.user_id == user_id,
         UserWord.word_id == word_id
     ).first()
 
@@ -355,21 +327,24 @@ async def remove_word_from_learning(
     db.delete(user_word)
     db.commit()
 
-    return {"message": "Word removed from learning list"}
-
 
-@router.get("/difficult-words")
-async def get_difficult_words(
+@router.delete("/remove-from-learning/{word_id}")
+async def remove_word_from_learning(
+        word_id: int,
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
 ) -> Any:
-    """Get user's difficult words"""
-    difficult_words = db.query(UserWord).filter(
-        UserWord.user_id == current_user.id,
-        UserWord.mistakes_count > 0
-    ).order_by(
-        UserWord.mistakes_count.desc()
-    ).limit(10).all()
+    """Remove a word from user's learning list"""
+    user_id = current_user.id
+    await run_db(db, _remove_word_from_learning, user_id, word_id)
+    invalidate_user_statistics(user_id)
+
+    return {"message": "Word removed from learning list"}
+
+
+def _difficult_words(db: Session, user_id: int) -> list:
+    difficult_words = difficult_words_query(db, user_id).limit(10).all()
+    words = word_catalog.lookup(db, [uw.word_id for uw in difficult_words])
 
     return [
         {
@@ -378,33 +353,32 @@ async def get_difficult_words(
             "retention_level": uw.retention_level,
             "last_reviewed": uw.last_reviewed,
             "word": {
-                "english": uw.word.english,
-                "turkish": uw.word.turkish,
-                "difficulty_level": uw.word.difficulty_level
+                "english": words[uw.word_id].english,
+                "turkish": words[uw.word_id].turkish,
+                "difficulty_level": words[uw.word_id].difficulty_level
             }
         }
         for uw in difficult_words
+        if uw.word_id in words
     ]
 
 
-@router.get("/learned-words", response_model=List[WordWithProgress])
-async def get_learned_words(
-        limit: int = Query(default=50, ge=1, le=100),
-        offset: int = Query(default=0, ge=0),
+@router.get("/difficult-words")
+async def get_difficult_words(
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
 ) -> Any:
-    """Get user's learned words"""
-    learned_words = db.query(UserWord).filter(
-        UserWord.user_id == current_user.id,
-        UserWord.is_learned == True
-    ).order_by(
-        UserWord.last_reviewed.desc()
-    ).offset(offset).limit(limit).all()
+    """Get user's difficult words"""
+    return await run_db(db, _difficult_words, current_user.id)
+
+
+def _learned_words(db: Session, user_id: int, limit: int, offset: int) -> list:
+    learned_words = learned_words_query(db, user_id).offset(offset).limit(limit).all()
+    words = word_catalog.lookup(db, [uw.word_id for uw in learned_words])
 
     return [
         {
-            **WordResponse.model_validate(uw.word).dict(),
+            **WordResponse.model_validate(words[uw.word_id]).dict(),
             "retention_level": uw.retention_level,
             "confidence_level": uw.confidence_level,
             "next_review": uw.next_review,
@@ -412,9 +386,21 @@ async def get_learned_words(
             "mistakes_count": uw.mistakes_count
         }
         for uw in learned_words
+        if uw.word_id in words
     ]
 
 
+@router.get("/learned-words", response_model=List[WordWithProgress])
+async def get_learned_words(
+        limit: int = Query(default=50, ge=1, le=100),
+        offset: int = Query(default=0, ge=0),
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+) -> Any:
+    """Get user's learned words"""
+    return await run_db(db, _learned_words, current_user.id, limit, offset)
+
+
 @router.post("/bulk-add")
 async def add_multiple_words(
         data: BulkAddRequest,
@@ -422,32 +408,14 @@ async def add_multiple_words(
         db: Session = Depends(get_db)
 ) -> Any:
     """Add multiple words to user's learning list"""
-    existing_words = db.query(UserWord.word_id).filter(
-        UserWord.user_id == current_user.id,
-        UserWord.word_id.in_(data.word_ids)
-    ).all()
-    existing_word_ids = [w[0] for w in existing_words]
-
-    new_words = []
-    for word_id in data.word_ids:
-        if word_id not in existing_word_ids:
-            word = db.query(Word).get(word_id)
-            if word:
-                user_word = UserWord(
-                    user_id=current_user.id,
-                    word_id=word_id,
-                    next_review=datetime.utcnow()
-                )
-                new_words.append(user_word)
-
-    if new_words:
-        db.add_all(new_words)
-        db.commit()
+    user_id = current_user.id
+    added_count = await run_db(db, add_words_to_deck, user_id, data.word_ids)
+    if added_count:
+        invalidate_user_statistics(user_id)
 
     return {
         "status": "success",
-        "added_count": len(new_words),
-        "skipped_count": len(data.word_ids) - len(new_words),
-        "message": f"Added {len(new_words)} new words to learning list"
+        "added_count": added_count,
+        "skipped_count": len(data.word_ids) - added_count,
+        "message": f"Added {added_count} new words to learning list"
     }
-
@@ -2,6 +2,7 @@
 from pydantic_settings import BaseSettings
 from typing import Any, Dict, Optional, List
 from pydantic import validator
+import os
 import secrets
 
 
@@ -16,11 +17,22 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_NAME: str
     DB_PORT: str
+    DATABASE_URL: Optional[str] = None  # overrides the mysql+pymysql URL built from DB_*
+    ASYNC_DATABASE_URL: Optional[str] = None  # overrides the mysql+aiomysql URL built from DB_*
+    USE_ASYNC_DB: bool = False  # endpoints get an AsyncSession instead of a Session
 
     # Security
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
     ALGORITHM: str = "HS256"
+    PASSWORD_HASH_WORKERS: int = max(1, (os.cpu_count() or 2) - 1)  # bcrypt threads, 0 = hash on the event loop
+    PASSWORD_HASH_QUEUE_LIMIT: int = 128  # hashes queued or running before new ones get 503
+    PASSWORD_HASH_SCHEME: str = "bcrypt"  # "bcrypt" or "argon2" (needs argon2-cffi)
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # pick with `python calibrate_hash.py`
+    PASSWORD_ARGON2_TIME_COST: int = 2
+    PASSWORD_ARGON2_MEMORY_COST: int = 19456  # KiB
+    PASSWORD_ARGON2_PARALLELISM: int = 1
+    PASSWORD_REHASH_ON_LOGIN: bool = True  # rewrite hashes that do not match the settings above
 
     # CORS Settings
     BACKEND_CORS_ORIGINS: List[str] = [
@@ -32,6 +44,30 @@ class Settings(BaseSettings):
     # API Settings
     MAX_WORDS_PER_DAY: int = 20
     MIN_WORDS_PER_DAY: int = 5
+    RESET_PROGRESS_CHUNK_SIZE: int = 5000  # rows per UPDATE, 0 = single statement
+
+    # Cache Settings
+    WORD_CATALOG_REFRESH_INTERVAL: int = 60  # seconds between updated_at checks of the word catalog
+    USER_STATISTICS_CACHE_TTL: int = 0  # seconds, 0 disables the cache
+    USER_STATISTICS_CACHE_SIZE: int = 10000
+    AUTH_USER_CACHE_TTL: int = 30  # seconds a user snapshot serves get_current_user, 0 disables
+    AUTH_USER_CACHE_SIZE: int = 10000
+    AUTH_TOKEN_CACHE_TTL: int = 300  # seconds a verified JWT payload is reused (capped at exp)
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+
+    # Instrumentation
+    REQUEST_METRICS_ENABLED: bool = True  # Server-Timing headers and /metrics
+    QUERY_DETECTOR_SAMPLE_RATE: float = 0.0  # share of requests checked for repeated SQL (1.0 in development)
+    QUERY_DETECTOR_REPEAT_THRESHOLD: int = 5  # identical statements per request reported as N+1
+    QUERY_DETECTOR_SLOW_MS: float = 200  # statements slower than this are logged, 0 disables
+    QUERY_DETECTOR_RAISE: bool = False  # raise NPlusOneDetected instead of only logging (tests)
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: Dict[str, str] = {"multipart": "INFO"}  # per-logger levels; python-multipart logs every form field at DEBUG
+    LOG_JSON: bool = True  # one JSON object per line, False = plain text
+    LOG_SAMPLE_RATE: float = 5.0  # records/sec per call site on hot-path loggers, 0 disables sampling
+    LOG_SAMPLE_BURST: int = 20
 
     @validator("BACKEND_CORS_ORIGINS", pre=True)
     def assemble_cors_origins(cls, v: str | list[str]) -> list[str]:
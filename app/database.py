@@ -1,7 +1,10 @@
 # app/database.py
+from typing import Any, Callable, Optional, Union
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from .config import settings
 import logging
 import pymysql
@@ -10,10 +13,14 @@ import pymysql
 pymysql.install_as_MySQLdb()
 
 # Database URL construction
-SQLALCHEMY_DATABASE_URL = (
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL or (
     f"mysql+pymysql://{settings.DB_USER}:{settings.DB_PASSWORD}@"
     f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
 )
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL or (
+    f"mysql+aiomysql://{settings.DB_USER}:{settings.DB_PASSWORD}@"
+    f"{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
+)
 
 # Engine configuration
 engine = create_engine(
@@ -25,23 +32,75 @@ engine = create_engine(
     echo=False,
     connect_args={
         'charset': 'utf8mb4'
-    }
+    } if SQLALCHEMY_DATABASE_URL.startswith("mysql") else {}
 )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine yalnızca USE_ASYNC_DB açıkken (ilk istekte) kurulur; sürücü
+# (aiomysql / aiosqlite) senkron kurulumda yüklü olmak zorunda değil.
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+            echo=False
+        )
+    return _async_engine
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    global _async_session_factory
+    if _async_session_factory is None:
+        # expire_on_commit=False: commit sonrası current_user gibi nesnelerin
+        # alanları event loop üzerinde lazy load tetiklemeden okunabilsin
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _async_session_factory()
+
+
 # Base class for models
 Base = declarative_base()
 
-# Database dependency
-def get_db():
+
+def get_sync_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Database dependency
+get_db = get_async_db if settings.USE_ASYNC_DB else get_sync_db
+
+
+async def run_db(db: Union[Session, AsyncSession], fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run synchronous ORM code `fn(session, *args, **kwargs)` on either session type.
+
+    With an AsyncSession the function runs through run_sync(), so every round
+    trip goes through the async driver and the event loop is never blocked.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return fn(db, *args, **kwargs)
+
+
 # Database health check
 def check_db_connection():
     try:
@@ -52,4 +111,4 @@ def check_db_connection():
         logging.error(f"Database connection failed: {str(e)}")
         return False
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -2,12 +2,21 @@
 import signal
 import sys
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 import uvicorn
 from .config import settings
 from .api.endpoints import auth, users, words, learning
 from .database import engine, Base
+from .utils.auth_cache import auth_cache_stats
+from .utils.password_pool import PasswordHasherBusy, password_hasher
+from .utils.statistics import user_statistics_cache
+from .utils.log import get_logger, setup_logging
+from .utils.metrics import RequestMetricsMiddleware, TimedRoute, render_metrics
+
+setup_logging()
+logger = get_logger(__name__)
 
 # Create tables
 Base.metadata.create_all(bind=engine)
@@ -17,6 +26,7 @@ app = FastAPI(
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json"
 )
+app.router.route_class = TimedRoute
 
 
 # Configure CORS
@@ -28,6 +38,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.REQUEST_METRICS_ENABLED:
+    app.add_middleware(RequestMetricsMiddleware)
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Too many authentication requests, please retry"},
+        headers={"Retry-After": "1"}
+    )
+
+
 # Include routers
 app.include_router(
     auth.router,
@@ -53,7 +75,7 @@ app.include_router(
     tags=["learning"]
 )
 def signal_handler(sig, frame):
-    print("\nShutting down gracefully...")
+    logger.info("Shutting down gracefully...")
     sys.exit(0)
 signal.signal(signal.SIGINT, signal_handler)
 
@@ -61,6 +83,23 @@ signal.signal(signal.SIGINT, signal_handler)
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "version": settings.VERSION}
+@app.get("/cache-stats")
+async def get_cache_stats():
+    """Hit/miss counters of the in-process caches"""
+    return {
+        **auth_cache_stats(),
+        "user_statistics": user_statistics_cache.stats()
+    }
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Per-route request, SQL and serialization histograms in Prometheus text format"""
+    return PlainTextResponse(
+        render_metrics({
+            "app_cache": {**auth_cache_stats(), "user_statistics": user_statistics_cache.stats()},
+            "password_hasher": {"default": password_hasher.stats()}
+        }),
+        media_type="text/plain; version=0.0.4"
+    )
 @app.get("/routes")
 async def get_routes():
     routes = []
@@ -1,5 +1,5 @@
 # app/models/user_word.py
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean, func, Float
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean, func, Float, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from ..database import Base
 from datetime import datetime, timedelta
@@ -7,6 +7,15 @@ from datetime import datetime, timedelta
 
 class UserWord(Base):
     __tablename__ = "user_words"
+    __table_args__ = (
+        UniqueConstraint("user_id", "word_id", name="uq_user_word"),
+        # Tekrar kuyruğu: user_id = ? AND next_review <= ? ORDER BY next_review
+        Index("idx_user_next_review", "user_id", "next_review"),
+        # Öğrenilmiş kelimeler: user_id = ? AND is_learned = 1 ORDER BY last_reviewed DESC
+        Index("idx_user_learned_reviewed", "user_id", "is_learned", "last_reviewed"),
+        # Zor kelimeler: user_id = ? AND mistakes_count > 0 ORDER BY mistakes_count DESC
+        Index("idx_user_mistakes", "user_id", "mistakes_count"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
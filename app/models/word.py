@@ -1,17 +1,23 @@
 # app/models/word.py
-from sqlalchemy import Column, Integer, String, Text, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, DateTime, func, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 
 
 class Word(Base):
     __tablename__ = "words"
+    __table_args__ = (
+        # Yeni kelime kuyruğu: ORDER BY difficulty_level, id (keyset sayfalama)
+        Index("idx_difficulty_id", "difficulty_level", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     english = Column(String(100), unique=True, nullable=False, index=True)
     turkish = Column(String(100), nullable=False)
     phonetic = Column(String(100), nullable=True)  # IPA pronunciation
-    difficulty_level = Column(Integer, default=1)  # 1: Easy, 2: Medium, 3: Hard
+    # NOT NULL: (difficulty_level, id) keyset sayfalamasında NULL seviye
+    # imleci bir önceki sayfaya döndürürdü
+    difficulty_level = Column(Integer, nullable=False, default=1, server_default="1")  # 1: Easy, 2: Medium, 3: Hard
     part_of_speech = Column(String(20), nullable=True)  # noun, verb, adjective, etc.
     example_sentence = Column(Text, nullable=True)
     example_sentence_translation = Column(Text, nullable=True)
@@ -0,0 +1,93 @@
+# app/utils/auth_cache.py
+"""
+get_current_user için iki süreç içi önbellek:
+
+- token_cache: doğrulanmış JWT payload'ları (imza kontrolü her istekte tekrar
+  edilmez; kayıt token'ın exp süresini aşmaz)
+- user_cache: token subject'ine (username) göre kullanıcı satırının anlık
+  görüntüsü; isabette users tablosuna SELECT atılmaz
+
+User satırı ORM üzerinden güncellendiğinde/silindiğinde (şifre, profil,
+is_active ...) mapper olayları ilgili kaydı düşürür.
+"""
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from ..config import settings
+from ..models.user import User
+from .cache import TTLCache
+from .security import verify_token
+
+token_cache = TTLCache(maxsize=settings.AUTH_TOKEN_CACHE_SIZE, ttl=settings.AUTH_TOKEN_CACHE_TTL)
+user_cache = TTLCache(maxsize=settings.AUTH_USER_CACHE_SIZE, ttl=settings.AUTH_USER_CACHE_TTL)
+
+_USER_COLUMNS = [column.key for column in User.__table__.columns]
+
+
+def verify_token_cached(token: str) -> Optional[dict]:
+    """utils.security.verify_token with the result memoized until the token expires"""
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+
+    payload = verify_token(token)
+    if payload is None:
+        return None
+
+    expires_in = payload.get("exp", 0) - time.time()
+    if expires_in > 0:
+        token_cache.set(token, payload, ttl=expires_in)
+    return payload
+
+
+def _snapshot(user: User) -> Dict:
+    return {key: getattr(user, key) for key in _USER_COLUMNS}
+
+
+def get_user_by_subject(db: Session, username: str) -> Optional[User]:
+    """The user for a token subject, rebuilt from the cached snapshot when possible.
+
+    A cached snapshot is attached to `db` as a persistent, unmodified instance
+    (no SELECT), so endpoints can still change and commit it as usual.
+    """
+    snapshot = user_cache.get(username)
+    if snapshot is None:
+        user = db.query(User).filter(User.username == username).first()
+        if user is not None:
+            user_cache.set(username, _snapshot(user))
+        return user
+
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def invalidate_user(username: str) -> None:
+    user_cache.invalidate(username)
+
+
+def clear_auth_caches() -> None:
+    token_cache.clear()
+    user_cache.clear()
+
+
+def auth_cache_stats() -> Dict[str, Dict[str, int]]:
+    return {
+        "tokens": token_cache.stats(),
+        "users": user_cache.stats()
+    }
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: User) -> None:
+    # Flush anında düşür; commit sonrası uç noktalar bir kez daha düşürüyor.
+    # Silinen satır için username yüklenmemişse tekrar okunamaz: hepsini düşür.
+    username = inspect(target).attrs.username.loaded_value
+    if isinstance(username, str):
+        invalidate_user(username)
+    else:
+        user_cache.clear()
@@ -0,0 +1,157 @@
+# app/utils/catalog.py
+"""
+words tablosunun süreç içi kopyası.
+
+words tablosu word_collector.py çalıştırmaları arasında fiilen salt okunur;
+kullanıcı ilerlemesi (user_words) her istekte veritabanından okunur, kelime
+ayrıntıları ise bu katalogdan eşlenir. Katalog ilk kullanımda yüklenir ve
+WORD_CATALOG_REFRESH_INTERVAL saniyede bir updated_at yüksek su işaretiyle
+artımlı olarak yenilenir.
+"""
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.word import Word
+
+
+class WordRecord:
+    """Read-only, slot-based copy of a Word row (attribute-compatible with Word)"""
+    __slots__ = (
+        "id", "english", "turkish", "phonetic", "difficulty_level", "part_of_speech",
+        "example_sentence", "example_sentence_translation", "audio_url", "image_url",
+        "tags", "updated_at"
+    )
+
+    def __init__(self, id, english, turkish, phonetic, difficulty_level, part_of_speech,
+                 example_sentence, example_sentence_translation, audio_url, image_url,
+                 tags, updated_at):
+        self.id = id
+        self.english = english
+        self.turkish = turkish
+        self.phonetic = phonetic
+        self.difficulty_level = difficulty_level
+        # Az sayıda farklı değer var; her kayıtta aynı str nesnesini paylaş
+        self.part_of_speech = sys.intern(part_of_speech) if part_of_speech else part_of_speech
+        self.example_sentence = example_sentence
+        self.example_sentence_translation = example_sentence_translation
+        self.audio_url = audio_url
+        self.image_url = image_url
+        self.tags = tags
+        self.updated_at = updated_at
+
+    def __repr__(self):
+        return f"<WordRecord {self.english} ({self.turkish})>"
+
+
+_COLUMNS = [getattr(Word, name) for name in WordRecord.__slots__]
+
+
+class WordCatalog:
+    """All Word rows keyed by id, refreshed incrementally by updated_at"""
+
+    def __init__(self, refresh_interval: Optional[float] = None):
+        self.refresh_interval = refresh_interval
+        self.records: Dict[int, WordRecord] = {}
+        self.high_water: Optional[datetime] = None
+        self.version = 0
+        self.loaded = False
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def _interval(self) -> float:
+        if self.refresh_interval is not None:
+            return self.refresh_interval
+        return settings.WORD_CATALOG_REFRESH_INTERVAL
+
+    def _store(self, records: Dict[int, WordRecord], rows) -> bool:
+        """Store rows into records; True if any of them was new or different"""
+        changed = False
+        for row in rows:
+            current = records.get(row[0])
+            if current is not None and tuple(getattr(current, name) for name in WordRecord.__slots__) == tuple(row):
+                continue
+            record = WordRecord(*row)
+            records[record.id] = record
+            changed = True
+            if record.updated_at is not None and (self.high_water is None or record.updated_at > self.high_water):
+                self.high_water = record.updated_at
+        return changed
+
+    def _load(self, db: Session) -> None:
+        # Okuyucular yarım dolu sözlüğü görmesin: önce yerelde kur, sonra değiştir
+        records: Dict[int, WordRecord] = {}
+        self.high_water = None
+        self._store(records, db.query(*_COLUMNS))
+        self.records = records
+        self.loaded = True
+        self.version += 1
+
+    def _refresh(self, db: Session) -> None:
+        count = db.query(func.count(Word.id)).scalar()
+
+        # updated_at saniye çözünürlüğünde: yüksek su işaretiyle aynı saniyede
+        # yazılan satırlar MAX(updated_at)'i değiştirmez. Bu yüzden >= ile her
+        # seferinde çekilir; yalnızca gerçekten değişen kayıt sürümü artırır
+        query = db.query(*_COLUMNS)
+        if self.high_water is not None:
+            query = query.filter(Word.updated_at >= self.high_water)
+        changed = self._store(self.records, query)
+
+        # Silinen satırlar updated_at ile görülemez; sayı tutmuyorsa baştan yükle
+        if len(self.records) != count:
+            self._load(db)
+        elif changed:
+            self.version += 1
+
+    def ensure_fresh(self, db: Session, force: bool = False) -> "WordCatalog":
+        """Load on first use, then check the high-water mark at most once per interval"""
+        if self.loaded and not force and time.monotonic() - self._checked_at < self._interval:
+            return self
+
+        with self._lock:
+            if not self.loaded:
+                self._load(db)
+            elif force or time.monotonic() - self._checked_at >= self._interval:
+                self._refresh(db)
+            self._checked_at = time.monotonic()
+        return self
+
+    def lookup(self, db: Session, word_ids: Iterable[int]) -> Dict[int, WordRecord]:
+        """Records for the given ids; refreshes once if some id is not in the catalog yet"""
+        self.ensure_fresh(db)
+        word_ids = list(word_ids)
+        if any(word_id not in self.records for word_id in word_ids):
+            self.ensure_fresh(db, force=True)
+
+        records = self.records
+        return {word_id: records[word_id] for word_id in word_ids if word_id in records}
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.records = {}
+            self.high_water = None
+            self.loaded = False
+
+
+word_catalog = WordCatalog()
+
+
+def get_word_catalog(db: Session) -> WordCatalog:
+    """The process-wide catalog, loaded or refreshed as needed"""
+    return word_catalog.ensure_fresh(db)
+
+
+def invalidate_word_catalog() -> None:
+    word_catalog.invalidate()
+
@@ -0,0 +1,170 @@
+# app/utils/learning_columns.py
+"""
+utils/learning analizlerinin sütun tabanlı (NumPy) sürümü.
+
+learning.py içindeki fonksiyonlar ORM nesneleri üzerinde kart başına çalışır ve
+referans uygulama olarak kalır; buradaki fonksiyonlar aynı sonuçları
+user_words sütunlarından oluşan diziler üzerinde vektörel olarak hesaplar.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models.user_word import UserWord
+from ..models.word import Word
+
+SECONDS_PER_DAY = 86400
+
+
+@dataclass
+class UserWordColumns:
+    """The user_words columns used by the analytics, one array per column"""
+    times_reviewed: np.ndarray
+    consecutive_correct: np.ndarray
+    confidence_level: np.ndarray
+    is_learned: np.ndarray
+    mistakes_count: np.ndarray
+    last_reviewed: np.ndarray  # datetime64[us], NaT when never reviewed
+    pos_codes: np.ndarray  # index into pos_labels
+    pos_labels: List[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.times_reviewed)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple]) -> "UserWordColumns":
+        """Build columns from (times_reviewed, consecutive_correct, confidence_level,
+        is_learned, mistakes_count, last_reviewed, part_of_speech) tuples"""
+        pos_index: Dict[Optional[str], int] = {}
+        pos_codes = np.fromiter(
+            (pos_index.setdefault(row[6], len(pos_index)) for row in rows),
+            dtype=np.int64,
+            count=len(rows)
+        )
+        columns = list(zip(*rows)) if rows else [()] * 7
+
+        return cls(
+            times_reviewed=np.array(columns[0], dtype=np.int64),
+            consecutive_correct=np.array(columns[1], dtype=np.int64),
+            confidence_level=np.array(columns[2], dtype=np.float64),
+            is_learned=np.array(columns[3], dtype=bool),
+            mistakes_count=np.array(columns[4], dtype=np.int64),
+            last_reviewed=np.array(columns[5], dtype="datetime64[us]"),
+            pos_codes=pos_codes,
+            pos_labels=list(pos_index)
+        )
+
+    @classmethod
+    def from_user_words(cls, user_words: List[UserWord]) -> "UserWordColumns":
+        """Build columns from already loaded UserWord objects"""
+        return cls.from_rows([
+            (
+                uw.times_reviewed,
+                uw.consecutive_correct,
+                uw.confidence_level,
+                uw.is_learned,
+                uw.mistakes_count,
+                uw.last_reviewed,
+                uw.word.part_of_speech if uw.word else None
+            )
+            for uw in user_words
+        ])
+
+
+def load_user_word_columns(db: Session, user_id: int) -> UserWordColumns:
+    """Load the analytics columns for a user with a single query"""
+    rows = db.query(
+        func.coalesce(UserWord.times_reviewed, 0),
+        func.coalesce(UserWord.consecutive_correct, 0),
+        func.coalesce(UserWord.confidence_level, 0),
+        func.coalesce(UserWord.is_learned, False),
+        func.coalesce(UserWord.mistakes_count, 0),
+        UserWord.last_reviewed,
+        Word.part_of_speech
+    ).outerjoin(
+        Word, Word.id == UserWord.word_id
+    ).filter(
+        UserWord.user_id == user_id
+    ).all()
+    return UserWordColumns.from_rows(rows)
+
+
+def calculate_retention_scores(columns: UserWordColumns, now: Optional[datetime] = None) -> np.ndarray:
+    """Vectorized calculate_retention_score"""
+    now = np.datetime64(now or datetime.utcnow(), "us")
+
+    reviewed = ~np.isnat(columns.last_reviewed)
+    elapsed = (now - columns.last_reviewed[reviewed]).astype(np.int64)
+    days_since_review = np.floor_divide(elapsed, SECONDS_PER_DAY * 1_000_000)
+
+    time_factor = np.ones(len(columns))
+    time_factor[reviewed] = np.exp(-0.1 * days_since_review)
+
+    base_score = columns.consecutive_correct * 0.2
+    confidence_factor = columns.confidence_level / 100.0
+    scores = np.minimum(1.0, (base_score + confidence_factor) * time_factor)
+    return np.where(columns.times_reviewed != 0, scores, 0.0)
+
+
+def identify_problem_areas(columns: UserWordColumns) -> List[Dict]:
+    """Vectorized identify_problem_areas: mistake totals per part of speech"""
+    problem = columns.mistakes_count > 2
+    if not problem.any():
+        return []
+
+    codes = columns.pos_codes[problem]
+    mistakes = columns.mistakes_count[problem]
+    counts = np.bincount(codes, minlength=len(columns.pos_labels))
+    totals = np.bincount(codes, weights=mistakes, minlength=len(columns.pos_labels))
+
+    # Referans uygulamayla aynı sıra: ilk görülme sırası, ardından kararlı sıralama
+    present, first_seen = np.unique(codes, return_index=True)
+    patterns = [
+        {
+            "type": "part_of_speech",
+            "value": columns.pos_labels[code],
+            "count": int(counts[code]),
+            "total_mistakes": int(totals[code])
+        }
+        for code in present[np.argsort(first_seen)]
+    ]
+    return sorted(patterns, key=lambda x: x["total_mistakes"], reverse=True)
+
+
+def calculate_best_review_time(columns: UserWordColumns) -> Optional[Dict]:
+    """Vectorized calculate_best_review_time from an hour histogram"""
+    review_times = columns.last_reviewed[~np.isnat(columns.last_reviewed)]
+    if not len(review_times):
+        return None
+
+    hours = (review_times.astype("datetime64[h]") - review_times.astype("datetime64[D]")).astype(np.int64)
+    hour_counts = np.bincount(hours, minlength=24)
+    peak_hours = [int(h) for h in np.argsort(-hour_counts, kind="stable")[:3]]
+
+    return {
+        "peak_hours": peak_hours,
+        "recommended_time": peak_hours[0] if peak_hours else 9
+    }
+
+
+def analyze_learning_patterns(columns: UserWordColumns, now: Optional[datetime] = None) -> Dict:
+    """Vectorized analyze_learning_patterns"""
+    total_words = len(columns)
+    if not total_words:
+        return {
+            "average_retention": 0,
+            "learning_rate": 0,
+            "problem_areas": [],
+            "best_time_to_review": None
+        }
+
+    return {
+        "average_retention": float(calculate_retention_scores(columns, now).sum() / total_words),
+        "learning_rate": float(np.count_nonzero(columns.is_learned) / total_words),
+        "problem_areas": identify_problem_areas(columns),
+        "best_time_to_review": calculate_best_review_time(columns)
+    }
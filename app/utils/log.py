@@ -0,0 +1,134 @@
+# app/utils/log.py
+"""
+Uygulama genelinde yapılandırılmış loglama.
+
+- Kayıtlar bir QueueHandler ile kuyruğa atılır; biçimlendirme ve stdout'a
+  yazma QueueListener iş parçacığında yapılır (istek yolu I/O beklemez)
+- LOG_LEVEL kök seviyeyi, LOG_LEVELS modül bazında seviyeleri belirler:
+  LOG_LEVELS='{"app.api.endpoints.auth": "DEBUG"}'
+- get_logger(..., sampled=True) ile alınan sıcak yol logger'larında WARNING
+  altı kayıtlar çağrı noktası başına LOG_SAMPLE_RATE/sn ile sınırlanır;
+  atlanan kayıt sayısı bir sonraki kayda `suppressed` alanı olarak eklenir
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from ..config import settings
+
+# LogRecord'un kendi alanları; geri kalanlar extra={...} ile gelen alanlardır
+_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and extra fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per call site (logger, template, line) for records below WARNING"""
+
+    def __init__(self, rate: float, burst: int):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[Tuple[str, str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, str(record.msg), record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            # [token, son güncelleme, atlanan kayıt]
+            bucket = self._buckets.setdefault(key, [float(self.burst), now, 0])
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            suppressed, bucket[2] = bucket[2], 0
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process queue: formatting is left to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Pickle edilmeyecek; mesaj ve traceback dinleyicide biçimlendirilir
+        return record
+
+
+_sample_filter = RateLimitFilter(rate=settings.LOG_SAMPLE_RATE, burst=settings.LOG_SAMPLE_BURST)
+
+
+def get_logger(name: str, sampled: bool = False) -> logging.Logger:
+    """logging.getLogger; `sampled` loggers drop sub-WARNING records above LOG_SAMPLE_RATE"""
+    logger = logging.getLogger(name)
+    if sampled and settings.LOG_SAMPLE_RATE > 0 and _sample_filter not in logger.filters:
+        logger.addFilter(_sample_filter)
+    return logger
+
+
+def setup_logging(stream=None) -> logging.handlers.QueueListener:
+    """Route the root logger through a queue to `stream` (stdout) and apply the levels in Settings"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    if settings.LOG_JSON:
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)]:
+        root.removeHandler(handler)
+    root.addHandler(LocalQueueHandler(log_queue))
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    for name, level in settings.LOG_LEVELS.items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+@atexit.register
+def _flush_logs() -> None:
+    global _listener
+    # Kuyrukta kalan kayıtlar çıkışta yazılsın
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,274 @@
+# app/utils/metrics.py
+"""
+İstek başına SQL ve süre ölçümü.
+
+RequestMetricsMiddleware her istek için bir RequestStats açar (contextvar);
+SQLAlchemy cursor olayları ifade sayısını, toplam DB süresini ve en yavaş
+ifadeyi, TimedRoute da endpoint döndükten yanıt hazır olana kadar geçen
+süreyi (response_model doğrulama + serileştirme) buna ekler. Sonuçlar:
+
+- Server-Timing başlığı: db, db-slowest, serialize, app
+- route başına histogramlar -> /metrics (Prometheus text formatı)
+
+Olaylar Engine sınıfına bağlı; hem app.database.engine hem de async
+engine'in sync_engine'i (ve testlerin engine'i) ölçülür.
+"""
+import asyncio
+import bisect
+import functools
+import random
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..config import settings
+from .log import get_logger
+from .query_detector import QueryDetector, report_slow_statement
+
+logger = get_logger(__name__, sampled=True)
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class RequestStats:
+    """SQL and serialization timings collected while one request is handled"""
+
+    __slots__ = (
+        "scope", "statements", "db_time", "slowest", "slowest_statement", "serialize_time", "returned_at", "detector"
+    )
+
+    def __init__(self, scope: Optional[Dict] = None, detector: Optional[QueryDetector] = None):
+        self.scope = scope
+        self.statements = 0
+        self.db_time = 0.0
+        self.slowest = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.serialize_time = 0.0
+        self.returned_at: Optional[float] = None
+        self.detector = detector
+
+    def server_timing(self, total: float) -> str:
+        return ", ".join([
+            f'db;dur={self.db_time * 1000:.2f};desc="{self.statements} statements"',
+            f"db-slowest;dur={self.slowest * 1000:.2f}",
+            f"serialize;dur={self.serialize_time * 1000:.2f}",
+            f"app;dur={total * 1000:.2f}"
+        ])
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+# Başlangıç zamanı bağlantıda değil ifadenin execution context'inde tutulur:
+# hata veren ifadede after_cursor_execute çalışmaz, havuzdaki bağlantıda
+# artık değer birikmesin
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.statements += 1
+    stats.db_time += elapsed
+    if elapsed > stats.slowest:
+        stats.slowest = elapsed
+        stats.slowest_statement = statement
+    if elapsed * 1000 >= settings.QUERY_DETECTOR_SLOW_MS > 0:
+        report_slow_statement(stats.scope, statement, elapsed)
+    if stats.detector is not None:
+        stats.detector.observe(statement)
+
+
+def _mark_return(endpoint: Callable) -> Callable:
+    """Wrap endpoint so the current RequestStats records when it returned"""
+    def mark():
+        stats = _current.get()
+        if stats is not None:
+            stats.returned_at = time.perf_counter()
+
+    # FastAPI async endpoint'i doğrudan, sync olanı threadpool'da çağırır;
+    # sarmalayıcı aynı türde olmalı
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def call(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            mark()
+            return result
+    else:
+        @functools.wraps(endpoint)
+        def call(*args, **kwargs):
+            result = endpoint(*args, **kwargs)
+            mark()
+            return result
+    return call
+
+
+class TimedRoute(APIRoute):
+    """APIRoute adding response_model validation + serialization time to the current RequestStats"""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _mark_return(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            response = await handler(request)
+            stats = _current.get()
+            if stats is not None and stats.returned_at is not None:
+                stats.serialize_time += time.perf_counter() - stats.returned_at
+                stats.returned_at = None
+            return response
+
+        return timed_handler
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram keyed by label tuples"""
+
+    def __init__(self, name: str, documentation: str, buckets: Iterable[float], labels: Tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.labels = labels
+        # label değerleri -> [kova sayaçları..., +Inf, toplam]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, label_values: Tuple[str, ...], value: float) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for label_values, series in sorted(self._series.items()):
+            labels = ",".join(f'{key}="{value}"' for key, value in zip(self.labels, label_values))
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            cumulative += series[len(self.buckets)]
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {series[-1]}")
+            lines.append(f"{self.name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+LABELS = ("method", "route")
+request_duration = Histogram("http_request_duration_seconds", "Time to handle a request", DURATION_BUCKETS, LABELS)
+request_db_time = Histogram("http_request_db_seconds", "Time spent in SQL per request", DURATION_BUCKETS, LABELS)
+request_statements = Histogram("http_request_db_statements", "SQL statements per request", STATEMENT_BUCKETS, LABELS)
+request_serialize_time = Histogram(
+    "http_request_serialize_seconds", "Time spent validating and serializing response models",
+    DURATION_BUCKETS, LABELS
+)
+HISTOGRAMS = (request_duration, request_db_time, request_statements, request_serialize_time)
+
+
+def clear_metrics() -> None:
+    for histogram in HISTOGRAMS:
+        histogram.clear()
+
+
+def render_metrics(gauges: Dict[str, Dict[str, Dict[str, float]]]) -> str:
+    """Histograms plus `gauges` ({prefix: {name: {field: value}}}) in Prometheus text format.
+
+    Each field becomes its own gauge, e.g. app_cache_hits{name="users"}.
+    """
+    lines = []
+    for histogram in HISTOGRAMS:
+        lines.extend(histogram.render())
+
+    series: Dict[str, List[str]] = {}
+    for prefix, sources in gauges.items():
+        for name, fields in sources.items():
+            for field, value in fields.items():
+                series.setdefault(f"{prefix}_{field}", []).append(f'{prefix}_{field}{{name="{name}"}} {value}')
+    for metric, samples in series.items():
+        lines.append(f"# TYPE {metric} gauge")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
+
+
+# Tamamlanan her istek için (route, RequestStats) ile çağrılır; testlerin
+# sorgu bütçesi kontrolü bunu kullanır
+request_observers: List[Callable[[str, RequestStats], None]] = []
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware adding Server-Timing headers and recording per-route histograms"""
+
+    def __init__(self, app):
+        self.app = app
+        self._routes: Dict[Callable, str] = {}
+
+    def _route_path(self, scope) -> str:
+        # Starlette 0.27 kapsamda route'u değil endpoint'i bırakıyor; şablon
+        # yol (path parametresiz) etiket kardinalitesini sabit tutar
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if endpoint not in self._routes:
+            for route in scope["app"].routes:
+                self._routes.setdefault(getattr(route, "endpoint", None), route.path)
+        return self._routes.get(endpoint, "unmatched")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sampled = random.random() < settings.QUERY_DETECTOR_SAMPLE_RATE
+        stats = RequestStats(scope, QueryDetector(scope) if sampled else None)
+        token = _current.set(stats)
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing(time.perf_counter() - start).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            total = time.perf_counter() - start
+            labels = (scope["method"], self._route_path(scope))
+            request_duration.observe(labels, total)
+            request_db_time.observe(labels, stats.db_time)
+            request_statements.observe(labels, stats.statements)
+            request_serialize_time.observe(labels, stats.serialize_time)
+            for observer in request_observers:
+                observer(labels[1], stats)
+            if stats.slowest_statement is not None:
+                logger.debug(
+                    "Request SQL",
+                    extra={
+                        "route": labels[1],
+                        "statements": stats.statements,
+                        "db_ms": round(stats.db_time * 1000, 2),
+                        "slowest_ms": round(stats.slowest * 1000, 2),
+                        "slowest_statement": stats.slowest_statement[:500]
+                    }
+                )
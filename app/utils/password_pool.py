@@ -0,0 +1,75 @@
+# app/utils/password_pool.py
+"""
+bcrypt işlemleri için ayrı iş parçacığı havuzu.
+
+12 round bcrypt ~250 ms CPU harcar; event loop üzerinde çalışınca o süre
+boyunca işçideki diğer tüm istekler bekler. bcrypt hesaplama sırasında GIL'i
+bıraktığı için iş parçacıkları yeterli. Kuyrukta PASSWORD_HASH_QUEUE_LIMIT
+iş birikmişse yeni istek beklemek yerine PasswordHasherBusy (503) alır.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..config import settings
+from .security import get_password_hash, verify_and_update_password, verify_password
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing queue is full; mapped to 503 by the app"""
+
+
+class PasswordHasher:
+    """Bounded executor for password hashing; workers=0 runs inline on the caller"""
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.pending = 0
+        self.rejected = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def _run(self, fn: Callable[..., Any], *args) -> Any:
+        with self._lock:
+            if self.pending >= self.queue_limit:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self.pending += 1
+
+        try:
+            if self.workers <= 0:
+                return fn(*args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return await self._run(verify_and_update_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "rejected": self.rejected
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT
+)
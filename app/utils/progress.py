@@ -0,0 +1,88 @@
+# app/utils/progress.py
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from ..models.user_word import UserWord
+from ..models.word import Word
+
+# Tek bir IN listesi / çok satırlı INSERT içindeki en fazla değer sayısı
+BULK_CHUNK_SIZE = 1000
+
+
+def _chunks(values: List, size: int = BULK_CHUNK_SIZE) -> Iterable[List]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def add_words_to_deck(db: Session, user_id: int, word_ids: List[int]) -> int:
+    """Add words to a user's learning list in a few set-based statements.
+
+    Unknown ids are dropped after a single IN lookup per chunk, and rows are
+    written with multi-row INSERT IGNORE so words the user already has, including
+    ones added by a concurrent request, are skipped by the (user_id, word_id)
+    unique constraint. Returns the number of rows actually inserted.
+    """
+    requested = list(dict.fromkeys(word_ids))
+    existing = set()
+    for chunk in _chunks(requested):
+        existing.update(word_id for (word_id,) in db.query(Word.id).filter(Word.id.in_(chunk)))
+
+    now = datetime.utcnow()
+    rows = [
+        {"user_id": user_id, "word_id": word_id, "next_review": now}
+        for word_id in requested
+        if word_id in existing
+    ]
+
+    statement = insert(UserWord).prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+    added_count = 0
+    for chunk in _chunks(rows):
+        added_count += db.execute(statement.values(chunk)).rowcount
+    db.commit()
+    return added_count
+
+
+def reset_user_progress(db: Session, user_id: int, chunk_size: Optional[int] = None) -> int:
+    """Reset every learning metric of a user's deck with set-based UPDATEs.
+
+    Without chunk_size a single UPDATE ... WHERE user_id = :id is issued. With it
+    the deck is walked in primary-key ranges of chunk_size rows, committing after
+    each range so row locks are held only briefly. Returns the number of rows reset.
+    """
+    values = {
+        UserWord.retention_level: 0,
+        UserWord.confidence_level: 0,
+        UserWord.is_learned: False,
+        UserWord.times_reviewed: 0,
+        UserWord.mistakes_count: 0,
+        UserWord.next_review: datetime.utcnow()
+    }
+    user_words = db.query(UserWord).filter(UserWord.user_id == user_id)
+
+    if not chunk_size:
+        reset_count = user_words.update(values, synchronize_session=False)
+        db.commit()
+        return reset_count
+
+    reset_count = 0
+    last_id = 0
+    while True:
+        # Bu aralığın son satırının id'si; None ise kalan satırlar son parçadır
+        upper_id = db.query(UserWord.id).filter(
+            UserWord.user_id == user_id,
+            UserWord.id > last_id
+        ).order_by(UserWord.id).offset(chunk_size - 1).limit(1).scalar()
+
+        chunk = user_words.filter(UserWord.id > last_id)
+        if upper_id is not None:
+            chunk = chunk.filter(UserWord.id <= upper_id)
+
+        reset_count += chunk.update(values, synchronize_session=False)
+        db.commit()
+
+        if upper_id is None:
+            return reset_count
+        last_id = upper_id
@@ -0,0 +1,125 @@
+# app/utils/query_detector.py
+"""
+Tekrarlanan (N+1) ve yavaş SQL ifadelerinin tespiti.
+
+RequestMetricsMiddleware isteklerin QUERY_DETECTOR_SAMPLE_RATE kadarını
+örnekler; örneklenen istekte her ifade parametre ve IN listelerinden
+arındırılmış bir parmak izine indirgenir. Aynı parmak izi bir istekte
+QUERY_DETECTOR_REPEAT_THRESHOLD kez görülünce uç nokta ve ifadeyi üreten
+kod satırıyla birlikte loglanır; QUERY_DETECTOR_RAISE açıksa (testler)
+NPlusOneDetected fırlatılır. QUERY_DETECTOR_SLOW_MS'i aşan ifadeler
+örneklemeden bağımsız olarak loglanır.
+"""
+import os
+import re
+import sys
+from collections import Counter
+from typing import Dict, List, Optional
+
+from ..config import settings
+from .log import get_logger
+
+logger = get_logger(__name__, sampled=True)
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Konum ararken atlanan altyapı modülleri
+_SKIPPED_FILES = {
+    os.path.join(APP_DIR, "database.py"),
+    os.path.join(APP_DIR, "utils", "metrics.py"),
+    os.path.abspath(__file__),
+}
+
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\?|:\w+|\b\d+(\.\d+)?\b|'(?:[^']|'')*'")
+_PLACEHOLDER_LIST = re.compile(r"\?(\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class NPlusOneDetected(Exception):
+    """Raised (when QUERY_DETECTOR_RAISE is set) on the first repeated statement of a request"""
+
+
+class QueryFinding:
+    """A statement shape repeated within one request"""
+
+    __slots__ = ("fingerprint", "endpoint", "location", "count")
+
+    def __init__(self, fingerprint: str, endpoint: str, location: str, count: int):
+        self.fingerprint = fingerprint
+        self.endpoint = endpoint
+        self.location = location
+        self.count = count
+
+    def __repr__(self) -> str:
+        return f"{self.count}x at {self.location} ({self.endpoint}): {self.fingerprint[:200]}"
+
+
+class QueryDetector:
+    """Per-request fingerprint counter; created only for sampled requests"""
+
+    __slots__ = ("scope", "counts", "findings")
+
+    def __init__(self, scope: Dict):
+        self.scope = scope
+        self.counts: Counter = Counter()
+        self.findings: Dict[str, QueryFinding] = {}
+
+    def endpoint(self) -> str:
+        endpoint = self.scope.get("endpoint")
+        if endpoint is None:
+            return self.scope.get("path", "?")
+        return f"{endpoint.__module__}.{endpoint.__qualname__}"
+
+    def observe(self, statement: str) -> None:
+        key = fingerprint(statement)
+        self.counts[key] += 1
+        count = self.counts[key]
+
+        finding = self.findings.get(key)
+        if finding is not None:
+            finding.count = count
+            return
+        if count < settings.QUERY_DETECTOR_REPEAT_THRESHOLD:
+            return
+
+        finding = self.findings[key] = QueryFinding(key, self.endpoint(), caller_location(), count)
+        logger.warning(
+            "Repeated SQL statement (possible N+1)",
+            extra={"endpoint": finding.endpoint, "location": finding.location, "statement": key[:500]}
+        )
+        if settings.QUERY_DETECTOR_RAISE:
+            raise NPlusOneDetected(repr(finding))
+
+
+def fingerprint(statement: str) -> str:
+    """`statement` with literals and bind parameters replaced and IN lists collapsed"""
+    normalized = _PLACEHOLDER.sub("?", statement)
+    normalized = _PLACEHOLDER_LIST.sub("?...", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def caller_location() -> str:
+    """file:line of the innermost app frame outside the DB/metrics plumbing"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_DIR) and filename not in _SKIPPED_FILES:
+            return f"{os.path.relpath(filename, os.path.dirname(APP_DIR))}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def report_slow_statement(scope: Optional[Dict], statement: str, elapsed: float) -> None:
+    endpoint = QueryDetector(scope).endpoint() if scope is not None else "?"
+    logger.warning(
+        "Slow SQL statement",
+        extra={
+            "endpoint": endpoint,
+            "location": caller_location(),
+            "duration_ms": round(elapsed * 1000, 2),
+            "statement": statement[:500]
+        }
+    )
+
+
+def findings_summary(findings: List[QueryFinding]) -> str:
+    return "\n".join(f"  {finding!r}" for finding in findings)
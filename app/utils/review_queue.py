@@ -0,0 +1,155 @@
+# app/utils/review_queue.py
+from datetime import datetime
+from typing import List, Optional, Union
+
+from sqlalchemy import DateTime, Integer, and_, bindparam, case, exists, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, Query
+from sqlalchemy.sql.expression import ColumnElement, FunctionElement
+
+from ..models.user_word import UserWord
+from ..models.word import Word
+from ..schemas.word import WordWithProgress, PartOfSpeechEnum
+from .catalog import WordRecord, word_catalog
+
+
+# Bu sorgular user_words üzerindeki bileşik indekslere göre yazıldı
+# (bkz. UserWord.__table_args__): filtre ve sıralama aynı indeksten okunur,
+# böylece MySQL filesort yapmadan LIMIT kadar satır tarar.
+
+def due_words_query(db: Session, user_id: int, now: Optional[datetime] = None) -> Query:
+    """Due UserWord rows joined with their Word (idx_user_next_review)"""
+    now = now or datetime.utcnow()
+    return db.query(UserWord, Word).join(
+        Word, Word.id == UserWord.word_id
+    ).filter(
+        UserWord.user_id == user_id,
+        UserWord.next_review <= now
+    ).order_by(UserWord.next_review)
+
+
+class days_between(FunctionElement):
+    """Whole days from `start` to `end` (timedelta.days for non-negative spans)"""
+    type = Integer()
+    inherit_cache = True
+    name = "days_between"
+
+
+@compiles(days_between)
+def _days_between_default(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return "TIMESTAMPDIFF(DAY, %s, %s)" % (compiler.process(start, **kw), compiler.process(end, **kw))
+
+
+@compiles(days_between, "sqlite")
+def _days_between_sqlite(element, compiler, **kw):
+    start, end = list(element.clauses)
+    return "CAST(julianday(%s) - julianday(%s) AS INTEGER)" % (
+        compiler.process(end, **kw), compiler.process(start, **kw)
+    )
+
+
+def priority_score_expression(now: datetime) -> ColumnElement:
+    """SQL version of utils.learning.calculate_priority_score"""
+    days_overdue = days_between(UserWord.next_review, bindparam("now", now, type_=DateTime()))
+    priority = (
+            (days_overdue * 1.5) +  # Overdue factor
+            ((5 - UserWord.retention_level) * 0.8) +  # Lower retention = higher priority
+            (UserWord.mistakes_count * 0.3) +  # More mistakes = higher priority
+            ((100 - UserWord.confidence_level) * 0.01)  # Lower confidence = higher priority
+    )
+    return case((priority > 0, priority), else_=0)
+
+
+def priority_due_words_query(db: Session, user_id: int, now: Optional[datetime] = None) -> Query:
+    """Due UserWord rows ranked by priority score, computed and sorted by the database"""
+    # Skor hesaplanmış bir ifade olduğu için sıralama indeksten gelmez; ancak
+    # filtre yine idx_user_next_review aralığını kullanır ve yalnızca vadesi
+    # gelmiş satırlar veritabanında sıralanıp LIMIT ile kesilir.
+    now = now or datetime.utcnow()
+    priority = priority_score_expression(now).label("priority")
+    return db.query(UserWord, priority).filter(
+        UserWord.user_id == user_id,
+        UserWord.next_review <= now
+    ).order_by(priority.desc(), UserWord.next_review, UserWord.id)
+
+
+def learned_words_query(db: Session, user_id: int) -> Query:
+    """Learned words, most recently reviewed first (idx_user_learned_reviewed)"""
+    return db.query(UserWord).filter(
+        UserWord.user_id == user_id,
+        UserWord.is_learned == True
+    ).order_by(UserWord.last_reviewed.desc())
+
+
+def difficult_words_query(db: Session, user_id: int) -> Query:
+    """Words with mistakes, most mistakes first (idx_user_mistakes)"""
+    return db.query(UserWord).filter(
+        UserWord.user_id == user_id,
+        UserWord.mistakes_count > 0
+    ).order_by(UserWord.mistakes_count.desc())
+
+
+def new_words_query(
+        db: Session,
+        user_id: int,
+        after_level: Optional[int] = None,
+        after_id: Optional[int] = None
+) -> Query:
+    """Words the user has not started yet, easiest first (idx_difficulty_id).
+
+    Uses a NOT EXISTS anti-join against uq_user_word instead of a NOT IN list,
+    and keyset pagination on (difficulty_level, id): pass the last row's values
+    as after_level/after_id to get the next page at constant cost. Both must be
+    given; difficulty_level is NOT NULL so the cursor is always complete.
+    """
+    already_learning = exists().where(
+        UserWord.user_id == user_id,
+        UserWord.word_id == Word.id
+    )
+    query = db.query(Word).filter(~already_learning)
+
+    if after_level is not None and after_id is not None:
+        query = query.filter(or_(
+            Word.difficulty_level > after_level,
+            and_(Word.difficulty_level == after_level, Word.id > after_id)
+        ))
+
+    return query.order_by(Word.difficulty_level, Word.id)
+
+
+def to_word_with_progress(user_word: UserWord, word: Union[Word, WordRecord]) -> WordWithProgress:
+    """Serialize a UserWord and its Word (or catalog record) straight into WordWithProgress"""
+    part_of_speech = word.part_of_speech
+    if part_of_speech not in PartOfSpeechEnum.__members__:
+        part_of_speech = None
+
+    return WordWithProgress(
+        id=word.id,
+        english=word.english,
+        turkish=word.turkish,
+        phonetic=word.phonetic,
+        difficulty_level=word.difficulty_level,
+        part_of_speech=part_of_speech,
+        example_sentence=word.example_sentence,
+        example_sentence_translation=word.example_sentence_translation,
+        audio_url=word.audio_url,
+        image_url=word.image_url,
+        tags=word.tags,
+        retention_level=user_word.retention_level,
+        confidence_level=user_word.confidence_level,
+        next_review=user_word.next_review,
+        is_learned=user_word.is_learned,
+        mistakes_count=user_word.mistakes_count
+    )
+
+
+def get_review_queue(db: Session, user_id: int, limit: int = 10) -> List[WordWithProgress]:
+    """Get the user's top-priority due words with progress"""
+    rows = priority_due_words_query(db, user_id).limit(limit).all()
+    words = word_catalog.lookup(db, [user_word.word_id for user_word, _ in rows])
+    return [
+        to_word_with_progress(user_word, words[user_word.word_id])
+        for user_word, _ in rows
+        if user_word.word_id in words
+    ]
@@ -0,0 +1,159 @@
+# app/utils/search.py
+"""
+words tablosu için süreç içi trigram arama indeksi.
+
+ilike('%q%') hiçbir indeksi kullanamaz; burada english/turkish alanları
+katlanmış (case-folded) hâlleriyle trigramlara bölünür, sorgu trigramlarının
+kesişimi aday kümesini verir ve adaylar gerçek alt dize kontrolüyle doğrulanır.
+Böylece hem önek hem de iç (infix) eşleşme desteklenir.
+"""
+import heapq
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..models.user_word import UserWord
+from .catalog import get_word_catalog, word_catalog
+
+# Türkçe'de I/ı ve İ/i ayrı harflerdir; str.lower() "İ" için "i̇" (i + birleşik
+# nokta) üretir. Kullanıcının klavye düzeninden bağımsız eşleşme için dört
+# biçimi de "i" harfine katlıyoruz.
+_TURKISH_FOLD = str.maketrans({"İ": "i", "I": "i", "ı": "i"})
+
+
+def fold(text: Optional[str]) -> str:
+    """Turkish-aware case folding used for both indexing and querying"""
+    if not text:
+        return ""
+    return text.translate(_TURKISH_FOLD).casefold()
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class WordSearchIndex:
+    """Trigram index over (id, english, turkish) rows"""
+
+    def __init__(self, rows: Iterable[Tuple[int, str, str]] = ()):
+        self.ids: List[int] = []
+        self.keys: List[Tuple[str, str]] = []  # folded (english, turkish)
+        self.postings: Dict[str, List[int]] = {}
+        for row in rows:
+            self.add(*row)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, word_id: int, english: str, turkish: str) -> None:
+        position = len(self.ids)
+        key = (fold(english), fold(turkish))
+        self.ids.append(word_id)
+        self.keys.append(key)
+        for gram in trigrams(key[0]) | trigrams(key[1]):
+            self.postings.setdefault(gram, []).append(position)
+
+    def _candidates(self, query: str) -> Sequence[int]:
+        grams = trigrams(query)
+        if not grams:
+            # 1-2 karakterlik sorgularda trigram yok; doğrudan tarama yeterince ucuz
+            return range(len(self.ids))
+
+        postings = sorted((self.postings.get(gram, []) for gram in grams), key=len)
+        if not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return candidates
+
+    def search(self, query: str, limit: int = 20, offset: int = 0) -> Tuple[int, List[int]]:
+        """Return (total matches, word ids of the requested page).
+
+        Exact matches rank first, then prefix matches, then infix matches;
+        ties are broken by length and then alphabetically.
+        """
+        query = fold(query).strip()
+        if not query:
+            return 0, []
+
+        ranked = []
+        for position in self._candidates(query):
+            english, turkish = self.keys[position]
+            if query in english or query in turkish:
+                if query == english or query == turkish:
+                    rank = 0
+                elif english.startswith(query) or turkish.startswith(query):
+                    rank = 1
+                else:
+                    rank = 2
+                ranked.append((rank, len(english), english, position))
+
+        # Sayfa küçük, eşleşme kümesi büyük olabilir: tamamını sıralamaya gerek yok
+        page = heapq.nsmallest(offset + limit, ranked)[offset:]
+        return len(ranked), [self.ids[position] for *_, position in page]
+
+
+_index: Optional[WordSearchIndex] = None
+_index_version = -1
+_lock = threading.Lock()
+
+
+def get_search_index(db: Session) -> WordSearchIndex:
+    """Process-wide index, rebuilt whenever the word catalog changes"""
+    global _index, _index_version
+
+    catalog = get_word_catalog(db)
+    if _index is not None and _index_version == catalog.version:
+        return _index
+
+    with _lock:
+        if _index is None or _index_version != catalog.version:
+            version = catalog.version
+            _index = WordSearchIndex(
+                (record.id, record.english, record.turkish) for record in list(catalog.records.values())
+            )
+            _index_version = version
+        return _index
+
+
+def search_words(db: Session, user_id: int, query: str, limit: int = 20, offset: int = 0) -> Tuple[int, List[Dict]]:
+    """(total matches, page of words with the user's learning status) using one batched query"""
+    total, word_ids = get_search_index(db).search(query, limit=limit, offset=offset)
+    if not word_ids:
+        return total, []
+
+    words = word_catalog.lookup(db, word_ids)
+    progress = {
+        user_word.word_id: user_word
+        for user_word in db.query(UserWord).filter(
+            UserWord.user_id == user_id,
+            UserWord.word_id.in_(word_ids)
+        )
+    }
+
+    result = []
+    for word_id in word_ids:
+        word = words.get(word_id)
+        if word is None:
+            continue  # indeks yenilenmeden silinmiş kelime
+
+        user_word = progress.get(word_id)
+        result.append({
+            "id": word.id,
+            "english": word.english,
+            "turkish": word.turkish,
+            "difficulty_level": word.difficulty_level,
+            "example_sentence": word.example_sentence,
+            "part_of_speech": word.part_of_speech,
+            "learning_status": {
+                "retention_level": user_word.retention_level,
+                "confidence_level": user_word.confidence_level,
+                "is_learned": user_word.is_learned,
+                "next_review": user_word.next_review
+            } if user_word else None
+        })
+    return total, result
@@ -1,50 +1,73 @@
 # app/utils/security.py
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from passlib.hash import argon2
 from ..config import settings
+from .log import get_logger
 
-# Özel bcrypt konfigürasyonu
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12,  # Hash round sayısı
-    bcrypt__salt_size=16,  # Salt boyutu
-)
+logger = get_logger(__name__, sampled=True)
+
+PASSWORD_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_password_context(
+        scheme: str = settings.PASSWORD_HASH_SCHEME,
+        bcrypt_rounds: int = settings.PASSWORD_BCRYPT_ROUNDS,
+        argon2_time_cost: int = settings.PASSWORD_ARGON2_TIME_COST,
+        argon2_memory_cost: int = settings.PASSWORD_ARGON2_MEMORY_COST,
+        argon2_parallelism: int = settings.PASSWORD_ARGON2_PARALLELISM
+) -> CryptContext:
+    """CryptContext hashing with `scheme`; other schemes and costs verify but need an update"""
+    if scheme not in PASSWORD_SCHEMES:
+        raise ValueError(f"Unknown password hash scheme: {scheme}")
+    if scheme == "argon2" and not argon2.has_backend():
+        raise RuntimeError("PASSWORD_HASH_SCHEME=argon2 requires the argon2-cffi package")
+
+    # İlk şema yeni hash'ler için kullanılır; "auto" diğerlerini deprecated
+    # sayar. Round/maliyet ayarından farklı hash'ler de needs_update döner.
+    return CryptContext(
+        schemes=[scheme] + [other for other in PASSWORD_SCHEMES if other != scheme],
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        argon2__time_cost=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,  # KiB
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+pwd_context = build_password_context()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash"""
     try:
-        # Debug bilgileri
-        print(f"Password verification attempt:")
-        print(f"Plain password length: {len(plain_password)}")
-        print(f"Hash length: {len(hashed_password)}")
-
-        # Şifre doğrulama
         is_valid = pwd_context.verify(plain_password, hashed_password)
-        print(f"Verification result: {is_valid}")
-
+        logger.debug("Password verified", extra={"valid": is_valid})
         return is_valid
     except Exception as e:
-        print(f"Password verification error: {str(e)}")
+        logger.warning("Password verification error: %s", e)
         return False
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password; also return a new hash when the stored one does not match the policy"""
+    try:
+        return pwd_context.verify_and_update(plain_password, hashed_password)
+    except Exception as e:
+        logger.warning("Password verification error: %s", e)
+        return False, None
+
+
 def get_password_hash(password: str) -> str:
     """Generate password hash"""
     try:
-        # Debug bilgileri
-        print(f"Generating hash for password length: {len(password)}")
-
-        # Hash oluştur
         hashed = pwd_context.hash(password)
-        print(f"Generated hash length: {len(hashed)}")
-
+        logger.debug("Password hashed", extra={"hash_length": len(hashed)})
         return hashed
-    except Exception as e:
-        print(f"Password hashing error: {str(e)}")
+    except Exception:
+        logger.exception("Password hashing error")
         raise
 
 
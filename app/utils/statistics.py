@@ -0,0 +1,79 @@
+# app/utils/statistics.py
+from typing import Dict, List
+
+from sqlalchemy import func, case
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.user_word import UserWord
+from ..models.word import Word
+from .cache import TTLCache
+
+# Kullanıcı başına istatistik önbelleği; tekrar, ekleme/çıkarma ve sıfırlama
+# uç noktaları invalidate_user_statistics() ile ilgili kaydı düşürür.
+user_statistics_cache = TTLCache(
+    maxsize=settings.USER_STATISTICS_CACHE_SIZE,
+    ttl=settings.USER_STATISTICS_CACHE_TTL
+)
+
+
+def get_progress_summary(db: Session, user_id: int) -> Dict:
+    """Deck-wide counters for a user computed by a single aggregate query"""
+    total_words, learned_words, average_retention, total_reviews = db.query(
+        func.count(UserWord.id),
+        func.sum(case((UserWord.is_learned == True, 1), else_=0)),
+        func.avg(UserWord.retention_level),
+        func.sum(UserWord.times_reviewed)
+    ).filter(
+        UserWord.user_id == user_id
+    ).one()
+
+    return {
+        "total_words": total_words,
+        "learned_words": int(learned_words or 0),
+        "average_retention": float(average_retention or 0),
+        "total_reviews": int(total_reviews or 0)
+    }
+
+
+def get_cached_progress_summary(db: Session, user_id: int) -> Dict:
+    """Progress summary for /users/me/statistics, served from the cache when enabled"""
+    summary = user_statistics_cache.get(user_id)
+    if summary is None:
+        summary = get_progress_summary(db, user_id)
+        user_statistics_cache.set(user_id, summary)
+    return summary
+
+
+def invalidate_user_statistics(user_id: int) -> None:
+    """Drop the cached statistics after the user's deck or progress changed"""
+    user_statistics_cache.invalidate(user_id)
+
+
+def get_problem_areas(db: Session, user_id: int) -> List[Dict]:
+    """Aggregate version of utils.learning.identify_problem_areas"""
+    total_mistakes = func.sum(UserWord.mistakes_count).label("total_mistakes")
+    rows = db.query(
+        Word.part_of_speech,
+        func.count(UserWord.id),
+        total_mistakes
+    ).join(
+        Word, Word.id == UserWord.word_id
+    ).filter(
+        UserWord.user_id == user_id,
+        UserWord.mistakes_count > 2
+    ).group_by(
+        Word.part_of_speech
+    ).order_by(
+        total_mistakes.desc()
+    ).all()
+
+    return [
+        {
+            "type": "part_of_speech",
+            "value": part_of_speech,
+            "count": count,
+            "total_mistakes": int(mistakes)
+        }
+        for part_of_speech, count, mistakes in rows
+    ]
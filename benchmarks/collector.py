@@ -0,0 +1,75 @@
+# benchmarks/collector.py
+"""
+word_collector verimi: eski sıralı döngü (process_word + kelime başına
+sleep(1)) ile CollectorPipeline karşılaştırması. Dış servislerin yerine
+gecikmeli (ve istenirse hata döndüren) yerel mock sunucu kullanılır; hız
+limitleri gerçek varsayılanlardadır (çeviri/sözlük 5 istek/s).
+
+    python -m benchmarks.collector
+"""
+import argparse
+import itertools
+import logging
+import shutil
+import string
+import tempfile
+import time
+
+from collector.mock_server import MockUpstreamServer
+from collector.pipeline import CollectorPipeline
+from word_collector import WordCollector
+
+
+def synthetic_words(count: int):
+    letters = itertools.product(string.ascii_lowercase, repeat=3)
+    return ["bench" + "".join(next(letters)) for _ in range(count)]
+
+
+def sequential(collector: WordCollector, words, delay: float) -> int:
+    processed = 0
+    for word in words:
+        if collector.process_word(word):
+            processed += 1
+        time.sleep(delay)
+    return processed
+
+
+def pipelined(collector: WordCollector, words, max_in_flight: int) -> int:
+    return sum(1 for _ in CollectorPipeline(collector, max_in_flight=max_in_flight).run(words))
+
+
+def run(count: int, latency: float, error_rate: float, rate: float, max_in_flight: int, delay: float):
+    words = synthetic_words(count)
+    print(f"{count} words, {latency * 1000:.0f} ms upstream latency, {error_rate:.0%} errors, {rate:g} req/s per upstream")
+    print(f"{'mode':>12} {'words':>6} {'seconds':>8} {'words/s':>8} {'requests':>9} {'errors':>7}")
+
+    modes = [
+        ("sequential", lambda c: sequential(c, words, delay)),
+        ("pipeline", lambda c: pipelined(c, words, max_in_flight)),
+    ]
+    for mode, fn in modes:
+        cache_dir = tempfile.mkdtemp(prefix="bench_collector_")
+        with MockUpstreamServer(latency=latency, error_rate=error_rate) as server:
+            collector = WordCollector(upstreams=server.upstreams(rate=rate, burst=int(rate)), cache_dir=cache_dir)
+            start = time.perf_counter()
+            processed = fn(collector)
+            elapsed = time.perf_counter() - start
+        shutil.rmtree(cache_dir)
+        print(
+            f"{mode:>12} {processed:>6} {elapsed:>8.2f} {processed / elapsed:>8.2f} "
+            f"{sum(server.requests.values()):>9} {sum(server.errors.values()):>7}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=150)
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--rate", type=float, default=5, help="requests/sec allowed per upstream")
+    parser.add_argument("--max-in-flight", type=int, default=16)
+    parser.add_argument("--sequential-delay", type=float, default=1.0, help="old per-word sleep")
+    args = parser.parse_args()
+    # Kelime başına hata satırları tabloyu bozmasın
+    logging.getLogger("WordCollector").disabled = True
+    run(args.words, args.latency_ms / 1000, args.error_rate, args.rate, args.max_in_flight, args.sequential_delay)
@@ -0,0 +1,105 @@
+# benchmarks/collector_cache.py
+"""
+word_collector önbelleği: kelime başına JSON dosyası (eski cache/ düzeni)
+ile collector.cache_store.CacheStore karşılaştırması. Yazma, "işlendi mi?"
+kontrolü (yarısı isabet) ve okuma süreleri ile disk kullanımı ölçülür.
+
+    python -m benchmarks.collector_cache --words 100000
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from collector.cache_store import CacheStore, migrate_json_cache
+
+
+def example(i: int):
+    return {"english": f"This is example {i}.", "turkish": f"Bu {i}. örnek."}
+
+
+def disk_usage(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.stat(os.path.join(root, name)).st_blocks * 512 for name in files)
+    return total
+
+
+def json_files(cache_dir: str, count: int):
+    timings = {}
+    start = time.perf_counter()
+    for i in range(count):
+        with open(os.path.join(cache_dir, f"example_w{i}.json"), "w") as f:
+            json.dump(example(i), f)
+    timings["write"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hits = sum(os.path.exists(os.path.join(cache_dir, f"example_w{i}.json")) for i in range(0, 2 * count, 2))
+    timings["exists"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(count):
+        with open(os.path.join(cache_dir, f"example_w{i}.json")) as f:
+            json.load(f)
+    timings["read"] = time.perf_counter() - start
+    return timings, hits
+
+
+def cache_store(cache_dir: str, count: int, batch: int):
+    store = CacheStore(os.path.join(cache_dir, "collector.db"))
+    timings = {}
+    start = time.perf_counter()
+    if batch > 1:
+        for offset in range(0, count, batch):
+            store.put_many("example", {f"w{i}": example(i) for i in range(offset, min(count, offset + batch))})
+    else:
+        for i in range(count):
+            store.put("example", f"w{i}", example(i))
+    timings["write"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hits = sum(store.contains("example", f"w{i}") for i in range(0, 2 * count, 2))
+    timings["exists"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(count):
+        store.get("example", f"w{i}")
+    timings["read"] = time.perf_counter() - start
+    store.close()
+    return timings, hits
+
+
+def run(count: int):
+    print(f"{count} cached examples")
+    print(f"{'mode':>18} {'write s':>8} {'exists s':>9} {'read s':>8} {'hits':>7} {'disk MB':>8}")
+    modes = [
+        ("json files", json_files),
+        ("store put", lambda d, n: cache_store(d, n, 1)),
+        ("store put_many", lambda d, n: cache_store(d, n, 1000)),
+    ]
+    for mode, fn in modes:
+        cache_dir = tempfile.mkdtemp(prefix="bench_collector_cache_")
+        timings, hits = fn(cache_dir, count)
+        print(
+            f"{mode:>18} {timings['write']:>8.2f} {timings['exists']:>9.2f} {timings['read']:>8.2f} "
+            f"{hits:>7} {disk_usage(cache_dir) / 1e6:>8.1f}"
+        )
+        if mode == "json files":
+            store = CacheStore(os.path.join(tempfile.gettempdir(), "bench_collector_cache_migrate.db"))
+            start = time.perf_counter()
+            migrate_json_cache(store, cache_dir)
+            print(f"{'migrate':>18} {time.perf_counter() - start:>8.2f}")
+            store.close()
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(store.path + suffix):
+                    os.remove(store.path + suffix)
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.words)
@@ -0,0 +1,68 @@
+# benchmarks/collector_http.py
+"""
+Upstream bağlantı yeniden kullanımının kelime başına gecikmeye etkisi.
+Kelimeler sıralı işlenir (process_word); mock sunucu her yeni bağlantıyı
+--handshake-ms kadar bekletir (TCP + TLS el sıkışması yerine).
+
+    no keep-alive   her istek yeni bağlantı (eski requests.get)
+    keep-alive      upstream başına requests.Session havuzu
+    revalidate      aynı kelimeler yeniden: sözlük yanıtları ETag ile 304
+
+    python -m benchmarks.collector_http
+"""
+import argparse
+import logging
+import shutil
+import statistics
+import tempfile
+import time
+
+from collector.mock_server import MockUpstreamServer
+from word_collector import WordCollector
+from .collector import synthetic_words
+
+
+def process(collector: WordCollector, words):
+    timings = []
+    for word in words:
+        start = time.perf_counter()
+        collector.process_word(word)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run(count: int, latency: float, handshake: float):
+    words = synthetic_words(count)
+    print(f"{count} words, {latency * 1000:.0f} ms response latency, {handshake * 1000:.0f} ms per new connection")
+    print(f"{'mode':>14} {'p50 ms/word':>12} {'mean ms/word':>13} {'requests':>9} {'connections':>12} {'304s':>6}")
+
+    modes = [("no keep-alive", False, False), ("keep-alive", True, False), ("revalidate", True, True)]
+    for mode, keep_alive, revalidate in modes:
+        cache_dir = tempfile.mkdtemp(prefix="bench_collector_http_")
+        with MockUpstreamServer(latency=latency, handshake_latency=handshake) as server:
+            collector = WordCollector(upstreams=server.upstreams(keep_alive=keep_alive), cache_dir=cache_dir)
+            if revalidate:
+                process(collector, words)
+                # Kelime önbelleği boşaltılır; HTTP önbelleği (ETag) kalır
+                for word in words:
+                    for namespace in ("phonetic", "example"):
+                        collector.cache.delete(namespace, word)
+                server.requests.clear()
+                server.connections = 0
+            timings = process(collector, words)
+            collector.close()
+        shutil.rmtree(cache_dir)
+        print(
+            f"{mode:>14} {statistics.median(timings) * 1000:>12.1f} {statistics.mean(timings) * 1000:>13.1f} "
+            f"{sum(server.requests.values()):>9} {server.connections:>12} {server.not_modified:>6}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--handshake-ms", type=float, default=60, help="simulated TCP + TLS setup per connection")
+    args = parser.parse_args()
+    logging.getLogger("WordCollector").disabled = True
+    run(args.words, args.latency_ms / 1000, args.handshake_ms / 1000)
@@ -0,0 +1,67 @@
+# benchmarks/collector_import.py
+"""
+collector.bulk_import verimi: sentetik, önceden zenginleştirilmiş JSONL
+(varsayılan 100k kelime) SQLite stand-in'e yüklenir; ardından aynı dosya
+tekrar yüklenerek tekrar ayıklamanın (words tablosuna karşı) maliyeti ölçülür.
+
+    python -m benchmarks.collector_import --words 100000
+"""
+import argparse
+import io
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+
+from collector.bulk_import import BulkImporter
+from collector.db_writer import WordWriter
+from word_collector import WordCollector
+from .common import sqlite_sessionmaker
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "bench_collector_import.db")
+
+
+def write_jsonl(path: str, count: int) -> None:
+    with open(path, "w") as f:
+        for i in range(count):
+            word = "w" + "".join(chr(97 + int(digit)) for digit in str(i))
+            f.write(json.dumps({
+                "english": word,
+                "turkish": f"kelime {i}",
+                "phonetic": f"/{word}/",
+                "example_sentence": f"This is {word}.",
+                "example_sentence_translation": f"Bu {word}.",
+            }) + "\n")
+
+
+def run(count: int, batch_size: int):
+    workdir = tempfile.mkdtemp(prefix="bench_collector_import_")
+    source = os.path.join(workdir, "words.jsonl")
+    write_jsonl(source, count)
+    sqlite_sessionmaker(DB_PATH)
+
+    print(f"{count} JSONL records, batch size {batch_size}")
+    print(f"{'run':>12} {'imported':>9} {'duplicates':>11} {'seconds':>8} {'lines/s':>9}")
+    for name in ("fresh", "reimport"):
+        writer = WordWriter(lambda: sqlite3.connect(DB_PATH), dialect="sqlite", batch_size=batch_size, flush_interval=None)
+        collector = WordCollector(cache_dir=os.path.join(workdir, "cache"), writer=writer)
+        stats = BulkImporter(collector, writer, batch_size=batch_size, out=io.StringIO()).run(source)
+        collector.close()
+        print(
+            f"{name:>12} {stats.imported:>9} {stats.duplicates:>11} {stats.elapsed:>8.2f} "
+            f"{stats.read / stats.elapsed:>9.0f}"
+        )
+
+    shutil.rmtree(workdir)
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    logging.getLogger("WordCollector.writer").setLevel(logging.WARNING)
+    run(args.words, args.batch_size)
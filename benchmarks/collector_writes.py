@@ -0,0 +1,104 @@
+# benchmarks/collector_writes.py
+"""
+word_collector'ın veritabanı yazma maliyeti: eski kelime başına bağlantı
+(bağlan, tek satır upsert, commit, kapat) ile WordWriter'ın kalıcı bağlantı +
+toplu executemany upsert'ü karşılaştırılır. Varsayılan olarak SQLite stand-in
+kullanılır; --mysql ile .env'deki DB_* ayarlarıyla MySQL'e yazılır (words
+tablosu dolu olabilir, kelimeler bench_ önekiyle yazılıp sonra silinir).
+
+    python -m benchmarks.collector_writes
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from collector.db_writer import UPSERT_SQL, WordWriter, mysql_connection_factory, word_row
+from word_collector import Word
+from .common import sqlite_sessionmaker
+
+DB_PATH = os.path.join(tempfile.gettempdir(), "bench_collector_writes.db")
+
+
+def synthetic_words(count: int, prefix: str):
+    return [
+        Word(
+            english=f"{prefix}{i}", turkish=f"kelime{i}", phonetic=f"/w{i}/", difficulty_level=1 + i % 3,
+            part_of_speech="noun", example_sentence=f"This is word {i}.",
+            example_sentence_translation=f"Bu {i}. kelime.", image_url=None,
+            audio_url=f"https://translate.google.com/translate_tts?q=w{i}", tags=["basic", "noun"]
+        )
+        for i in range(count)
+    ]
+
+
+def per_word_connection(connect, dialect: str, words) -> None:
+    # word_collector'ın eski save_to_database'i
+    for word in words:
+        conn = connect()
+        cursor = conn.cursor()
+        cursor.execute(UPSERT_SQL[dialect], word_row(word))
+        conn.commit()
+        cursor.close()
+        conn.close()
+
+
+def batched(connect, dialect: str, words, batch_size: int) -> None:
+    with WordWriter(connect, dialect=dialect, batch_size=batch_size, flush_interval=None) as writer:
+        for word in words:
+            writer.add(word)
+
+
+def run(count: int, batch_sizes, use_mysql: bool):
+    if use_mysql:
+        import mysql.connector
+
+        dialect = "mysql"
+        settings = dict(
+            host=os.getenv('DB_HOST'), port=int(os.getenv('DB_PORT', 3306)), user=os.getenv('DB_USER'),
+            password=os.getenv('DB_PASSWORD'), database=os.getenv('DB_NAME'), ssl_disabled=True
+        )
+        direct = lambda: mysql.connector.connect(**settings)
+        pooled = mysql_connection_factory()
+
+        def reset():
+            conn = direct()
+            conn.cursor().execute("DELETE FROM words WHERE english LIKE 'bench\\_%'")
+            conn.commit()
+            conn.close()
+    else:
+        dialect = "sqlite"
+        direct = pooled = lambda: sqlite3.connect(DB_PATH)
+
+        def reset():
+            sqlite_sessionmaker(DB_PATH)
+
+    modes = [("per-word connection", lambda words: per_word_connection(direct, dialect, words))]
+    modes += [
+        (f"writer batch={size}", lambda words, size=size: batched(pooled, dialect, words, size))
+        for size in batch_sizes
+    ]
+
+    print(f"{count} words -> {dialect}")
+    print(f"{'mode':>22} {'seconds':>8} {'words/s':>9} {'ms/word':>8}")
+    for mode, fn in modes:
+        reset()
+        words = synthetic_words(count, "bench_")
+        start = time.perf_counter()
+        fn(words)
+        elapsed = time.perf_counter() - start
+        print(f"{mode:>22} {elapsed:>8.2f} {count / elapsed:>9.0f} {elapsed / count * 1000:>8.3f}")
+
+    reset()
+    if not use_mysql:
+        os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=2000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 500])
+    parser.add_argument("--mysql", action="store_true", help="write to the DB_* MySQL database instead of SQLite")
+    args = parser.parse_args()
+    run(args.words, args.batch_sizes, args.mysql)
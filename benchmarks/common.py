@@ -0,0 +1,90 @@
+# benchmarks/common.py
+import os
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+from app.models import user, word_suggestion  # noqa: F401  (mapper'ların tamamı yüklensin)
+from app.models.user_word import UserWord
+from app.models.word import Word
+
+PARTS_OF_SPEECH = ["noun", "verb", "adjective", "adverb", "preposition", None]
+
+
+def synthetic_user_words(count: int, seed: int = 42) -> List[UserWord]:
+    """Transient UserWord objects (each with its Word) with random review history"""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+
+    return [
+        UserWord(
+            word=Word(english=f"word-{i}", turkish=f"kelime-{i}", part_of_speech=rng.choice(PARTS_OF_SPEECH)),
+            times_reviewed=rng.randint(0, 10),
+            consecutive_correct=rng.randint(0, 6),
+            confidence_level=rng.randint(0, 100),
+            is_learned=rng.random() > 0.7,
+            mistakes_count=rng.randint(0, 8),
+            last_reviewed=now - timedelta(days=rng.randint(0, 60), minutes=rng.randint(0, 1439))
+        )
+        for i in range(count)
+    ]
+
+
+def sqlite_sessionmaker(path: str):
+    """Session factory for a fresh SQLite stand-in database with the app schema"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.database import Base
+
+    if os.path.exists(path):
+        os.remove(path)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def seed_words(db, count: int, seed: int = 42) -> List[int]:
+    """Insert `count` synthetic words and return their ids"""
+    rng = random.Random(seed)
+    start = db.query(Word).count()
+    db.execute(Word.__table__.insert(), [
+        {
+            "english": f"word{start + i}",
+            "turkish": f"kelime{start + i}",
+            "difficulty_level": rng.randint(1, 3),
+            "part_of_speech": rng.choice(PARTS_OF_SPEECH)
+        }
+        for i in range(count)
+    ])
+    db.commit()
+    return [row[0] for row in db.query(Word.id).order_by(Word.id).offset(start)]
+
+
+def seed_user(db, username: str, word_ids: List[int], seed: int = 42) -> int:
+    """Insert a user whose deck contains every word in `word_ids`; return the user id"""
+    from app.models.user import User
+
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    owner = User(username=username, email=f"{username}@example.com", password_hash="x")
+    db.add(owner)
+    db.commit()
+
+    for chunk_start in range(0, len(word_ids), 10_000):
+        db.execute(UserWord.__table__.insert(), [
+            {
+                "user_id": owner.id,
+                "word_id": word_id,
+                "retention_level": rng.randint(0, 5),
+                "times_reviewed": rng.randint(0, 10),
+                "consecutive_correct": rng.randint(0, 6),
+                "confidence_level": rng.randint(0, 100),
+                "is_learned": rng.random() > 0.7,
+                "mistakes_count": rng.randint(0, 8),
+                "last_reviewed": now - timedelta(days=rng.randint(0, 60), minutes=rng.randint(0, 1439)),
+                "next_review": now + timedelta(days=rng.randint(-30, 30), minutes=rng.randint(0, 1439))
+            }
+            for word_id in word_ids[chunk_start:chunk_start + 10_000]
+        ])
+    db.commit()
+    return owner.id
@@ -0,0 +1,169 @@
+# benchmarks/concurrency.py
+"""
+Senkron Session ile AsyncSession (USE_ASYNC_DB) yolunun eşzamanlı istek altında
+karşılaştırması: /api/v1/words/next-words için req/s ve p50/p99 gecikme.
+
+SQLite'ta ağ gidiş-dönüşü olmadığı için her SQL ifadesine --latency-ms kadar
+yapay gecikme eklenir (MySQL round trip'i). Senkron yolda bu bekleme event
+loop üzerinde (PyMySQL gibi), async yolda aiosqlite'ın iş parçacığında olur.
+
+    python -m benchmarks.concurrency
+"""
+import os
+import tempfile
+
+# app.database engine'i import sırasında kurar; MySQL yerine SQLite kullan
+DB_PATH = os.path.join(tempfile.gettempdir(), "bench_concurrency.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+import argparse
+import asyncio
+import sqlite3
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import aiosqlite
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.database import get_db
+from app.main import app
+from app.models.user_word import UserWord
+from app.utils.catalog import get_word_catalog
+from app.utils.security import create_access_token
+from .common import sqlite_sessionmaker, seed_words, seed_user
+
+LATENCY = 0.0
+
+
+class LatencyCursor(sqlite3.Cursor):
+    def execute(self, *args, **kwargs):
+        time.sleep(LATENCY)
+        return super().execute(*args, **kwargs)
+
+
+class LatencyConnection(sqlite3.Connection):
+    """sqlite3 connection whose cursors wait LATENCY seconds per statement"""
+
+    def cursor(self, factory=LatencyCursor):
+        return super().cursor(factory)
+
+
+def sync_dependency(max_overflow: int):
+    engine = create_engine(
+        "sqlite://",
+        creator=lambda: sqlite3.connect(DB_PATH, factory=LatencyConnection, check_same_thread=False),
+        poolclass=QueuePool,
+        pool_size=20,
+        max_overflow=max_overflow
+    )
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_sync_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    return get_sync_db
+
+
+def async_dependency(max_overflow: int):
+    async def connect():
+        return await aiosqlite.connect(DB_PATH, factory=LatencyConnection)
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        async_creator=connect,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=20,
+        max_overflow=max_overflow
+    )
+    AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    async def get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    return get_async_db, engine
+
+
+def seed(cards: int) -> str:
+    SessionLocal = sqlite_sessionmaker(DB_PATH)
+    db = SessionLocal()
+    word_ids = seed_words(db, cards)
+    user_id = seed_user(db, "concurrency", word_ids)
+    # Tüm kartlar vadesi gelmiş olsun
+    db.query(UserWord).filter(UserWord.user_id == user_id).update(
+        {"next_review": datetime.utcnow() - timedelta(days=1)}
+    )
+    db.commit()
+    get_word_catalog(db)
+    db.close()
+    return create_access_token({"sub": "concurrency"})
+
+
+async def load(clients: int, requests_per_client: int, token: str):
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies = []
+
+    async def worker(http: httpx.AsyncClient):
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            response = await http.get("/api/v1/words/next-words?limit=10", headers=headers)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.text
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(http) for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return len(latencies) / elapsed, statistics.median(latencies) * 1000, p99 * 1000
+
+
+async def run_all(concurrency, requests_per_client: int, token: str):
+    # Senkron yolda havuz dolduğunda checkout event loop'u bloklar ve bağlantıyı
+    # geri verecek dependency teardown'u da çalışamaz (30 sn zaman aşımı);
+    # karşılaştırma adil olsun diye havuz her istemciye yetecek kadar büyük
+    max_overflow = max(concurrency)
+    get_async_db, async_engine = async_dependency(max_overflow)
+    dependencies = {"sync": sync_dependency(max_overflow), "async": get_async_db}
+
+    print(f"{'mode':>6} {'clients':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    try:
+        for clients in concurrency:
+            for mode, dependency in dependencies.items():
+                app.dependency_overrides[get_db] = dependency
+                rps, p50, p99 = await load(clients, requests_per_client, token)
+                print(f"{mode:>6} {clients:>8} {rps:>8.0f} {p50:>8.1f} {p99:>8.1f}")
+    finally:
+        app.dependency_overrides.clear()
+        # aiosqlite bağlantı iş parçacıkları kapatılmazsa süreç çıkmaz
+        await async_engine.dispose()
+
+
+def run(concurrency, requests_per_client: int, latency_ms: float, cards: int):
+    global LATENCY
+    token = seed(cards)
+    LATENCY = latency_ms / 1000
+    asyncio.run(run_all(concurrency, requests_per_client, token))
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--requests", type=int, default=10, help="requests per client")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="simulated round trip per statement")
+    parser.add_argument("--cards", type=int, default=200)
+    args = parser.parse_args()
+    run(args.concurrency, args.requests, args.latency_ms, args.cards)
@@ -0,0 +1,46 @@
+# benchmarks/learning_analytics.py
+"""
+utils/learning (kart başına ORM) ile utils/learning_columns (NumPy) analizlerini
+kullanıcı başına 1k, 10k ve 100k kart için karşılaştırır.
+
+    python -m benchmarks.learning_analytics
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Callable
+
+from app.utils import learning, learning_columns
+from app.utils.learning_columns import UserWordColumns
+from .common import synthetic_user_words
+
+
+def best_of(fn: Callable, repeat: int) -> float:
+    """Best wall-clock time of `repeat` runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(sizes, repeat: int):
+    print(f"{'cards':>8} {'reference (ms)':>15} {'columnar (ms)':>14} {'speedup':>8}")
+    for size in sizes:
+        user_words = synthetic_user_words(size)
+        columns = UserWordColumns.from_user_words(user_words)
+        now = datetime.utcnow()
+
+        reference = best_of(lambda: learning.analyze_learning_patterns(user_words), repeat)
+        columnar = best_of(lambda: learning_columns.analyze_learning_patterns(columns, now), repeat)
+
+        print(f"{size:>8} {reference * 1000:>15.2f} {columnar * 1000:>14.2f} {reference / columnar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
@@ -0,0 +1,273 @@
+# benchmarks/load_test.py
+"""
+Gerçek FastAPI uygulamasına süreç içi ASGI istemcisiyle eşzamanlı yük.
+
+Sentetik kelime, kullanıcı ve user_words satırları (10³–10⁶) üretilir, ardından
+her senaryo --concurrency işçiyle koşturulur:
+
+    review     next-words + 3 review
+    search     rastgele önek/ara metin ile /words/search
+    dashboard  statistics + daily-progress + streak-info + performance-analysis
+    bulk_add   desteye 20 rastgele kelime
+
+Senaryo ve uç nokta başına p50/p95/p99, req/s ve istek başına SQL ifadesi
+(RequestMetricsMiddleware) bir JSON dosyasına yazılır; --compare ile önceki
+bir commit'in dosyasıyla karşılaştırılır.
+
+    python -m benchmarks.load_test --words 100000 --users 100 --user-words 1000000
+    python -m benchmarks.load_test --compare load_test_abc1234.json
+
+Varsayılan veritabanı geçici bir SQLite dosyasıdır. MySQL için DATABASE_URL
+verilir; tablolar silinip yeniden kurulduğu için --reset-database gerekir:
+
+    DATABASE_URL=mysql+pymysql://u:p@localhost/bench python -m benchmarks.load_test --reset-database
+"""
+import os
+import tempfile
+
+# app.database engine'i import sırasında kurar; verilmediyse MySQL yerine SQLite
+DB_PATH = os.path.join(tempfile.gettempdir(), "bench_load_test.db")
+if "DATABASE_URL" not in os.environ:
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
+    os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List
+
+import httpx
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.utils import metrics
+from app.utils.security import create_access_token
+from .common import seed_user, seed_words
+
+SCENARIOS = ["review", "search", "dashboard", "bulk_add"]
+SEARCH_TERMS = ["word1", "kelime2", "ord3", "45", "word99", "lime7"]
+
+
+class Recorder:
+    """Client-side latencies plus server-side statement counts for one scenario"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statements: Dict[str, List[int]] = defaultdict(list)
+        self.errors = 0
+
+    def observe(self, route: str, stats) -> None:
+        # RequestMetricsMiddleware her istek sonunda çağırır
+        self.statements[route].append(stats.statements)
+
+    async def request(self, http: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+        start = time.perf_counter()
+        response = await http.request(method, url, **kwargs)
+        self.latencies[url.split("?")[0]].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.errors += 1
+        return response
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+
+    def at(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000
+
+    return {"p50_ms": round(at(0.50), 2), "p95_ms": round(at(0.95), 2), "p99_ms": round(at(0.99), 2)}
+
+
+def seed(words: int, users: int, user_words: int, reset: bool) -> Dict:
+    if engine.url.get_backend_name() != "sqlite":
+        if not reset:
+            sys.exit(f"{engine.url!r} is not SQLite; pass --reset-database to drop and reseed its tables")
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+
+    start = time.perf_counter()
+    db = SessionLocal()
+    word_ids = seed_words(db, words)
+    rng = random.Random(7)
+    deck = min(words, max(1, user_words // users))
+    tokens = []
+    for i in range(users):
+        seed_user(db, f"load{i}", rng.sample(word_ids, deck), seed=i)
+        tokens.append(create_access_token({"sub": f"load{i}"}))
+    db.close()
+    return {
+        "word_ids": word_ids,
+        "tokens": tokens,
+        "seconds": round(time.perf_counter() - start, 1),
+        "rows": {"words": words, "users": users, "user_words": deck * users}
+    }
+
+
+async def review(http, recorder: Recorder, headers: dict, rng: random.Random, word_ids: List[int]):
+    response = await recorder.request(http, "GET", "/api/v1/words/next-words?limit=10", headers=headers)
+    cards = response.json() if response.status_code == 200 else []
+    for card in cards[:3]:
+        correct = rng.random() > 0.3
+        await recorder.request(http, "POST", "/api/v1/words/review", headers=headers, json={
+            "word_id": card["id"],
+            "quality": rng.randint(3, 5) if correct else rng.randint(0, 2),
+            "response_time": rng.uniform(500, 5000),
+            "was_correct": correct
+        })
+
+
+async def search(http, recorder: Recorder, headers: dict, rng: random.Random, word_ids: List[int]):
+    query = rng.choice(SEARCH_TERMS)
+    await recorder.request(http, "GET", f"/api/v1/words/search?query={query}&limit=20", headers=headers)
+
+
+async def dashboard(http, recorder: Recorder, headers: dict, rng: random.Random, word_ids: List[int]):
+    for url in (
+        "/api/v1/users/me/statistics",
+        "/api/v1/learning/daily-progress",
+        "/api/v1/learning/streak-info",
+        "/api/v1/learning/performance-analysis"
+    ):
+        await recorder.request(http, "GET", url, headers=headers)
+
+
+async def bulk_add(http, recorder: Recorder, headers: dict, rng: random.Random, word_ids: List[int]):
+    await recorder.request(http, "POST", "/api/v1/words/bulk-add", headers=headers, json={
+        "word_ids": rng.sample(word_ids, 20)
+    })
+
+
+async def run_scenario(name: str, concurrency: int, operations: int, seeded: Dict) -> Dict:
+    scenario = globals()[name]
+    tokens, word_ids = seeded["tokens"], seeded["word_ids"]
+
+    async def worker(http, recorder: Recorder, seed: int, count: int):
+        rng = random.Random(seed)
+        for _ in range(count):
+            headers = {"Authorization": f"Bearer {rng.choice(tokens)}"}
+            await scenario(http, recorder, headers, rng, word_ids)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as http:
+        # Isınma: katalog, arama indeksi ve auth önbellekleri dolsun
+        await asyncio.gather(*(worker(http, Recorder(), -i, 1) for i in range(concurrency)))
+
+        recorder = Recorder()
+        metrics.request_observers.append(recorder.observe)
+        try:
+            per_worker = max(1, operations // concurrency)
+            start = time.perf_counter()
+            await asyncio.gather(*(worker(http, recorder, i, per_worker) for i in range(concurrency)))
+            elapsed = time.perf_counter() - start
+        finally:
+            metrics.request_observers.remove(recorder.observe)
+
+    all_latencies = [value for values in recorder.latencies.values() for value in values]
+    all_statements = [value for values in recorder.statements.values() for value in values]
+    return {
+        "requests": len(all_latencies),
+        "errors": recorder.errors,
+        "req_per_s": round(len(all_latencies) / elapsed, 1),
+        **percentiles(all_latencies),
+        "queries_per_request": round(statistics.mean(all_statements), 2) if all_statements else 0,
+        "endpoints": {
+            route: {
+                "requests": len(latencies),
+                **percentiles(latencies),
+                "queries_per_request": round(statistics.mean(recorder.statements.get(route, [0])), 2)
+            }
+            for route, latencies in sorted(recorder.latencies.items())
+        }
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: Dict, baseline_path: str) -> None:
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+
+    print(f"\nvs {baseline['meta']['commit']} ({baseline_path})")
+    print(f"{'scenario':>10} {'req/s':>16} {'p95 ms':>18} {'queries/req':>14}")
+    for name, result in current["scenarios"].items():
+        old = baseline["scenarios"].get(name)
+        if old is None:
+            continue
+
+        def delta(key: str) -> str:
+            change = (result[key] - old[key]) / old[key] * 100 if old[key] else 0
+            return f"{old[key]:>7} -> {result[key]:<7}" + (f" {change:+.0f}%" if old[key] else "")
+
+        print(f"{name:>10} {delta('req_per_s'):>16} {delta('p95_ms'):>18} {delta('queries_per_request'):>14}")
+
+
+def run(args) -> Dict:
+    # İstemcinin her istek için attığı INFO kaydı ölçümü bozmasın
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    seeded = seed(args.words, args.users, args.user_words, args.reset_database)
+    print(f"seeded {seeded['rows']} in {seeded['seconds']} s")
+
+    result = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+            "database": engine.url.get_backend_name(),
+            "rows": seeded["rows"],
+            "concurrency": args.concurrency,
+            "operations": args.operations
+        },
+        "scenarios": {}
+    }
+
+    print(f"{'scenario':>10} {'requests':>9} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'errors':>7}")
+    for name in args.scenarios:
+        summary = asyncio.run(run_scenario(name, args.concurrency, args.operations, seeded))
+        result["scenarios"][name] = summary
+        print(
+            f"{name:>10} {summary['requests']:>9} {summary['req_per_s']:>8} {summary['p50_ms']:>8} "
+            f"{summary['p95_ms']:>8} {summary['p99_ms']:>8} {summary['queries_per_request']:>8} {summary['errors']:>7}"
+        )
+
+    output = args.output or f"load_test_{result['meta']['commit']}.json"
+    with open(output, "w") as f:
+        json.dump(result, f, indent=2)
+    print(f"\nwrote {output}")
+
+    if args.compare:
+        compare(result, args.compare)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--user-words", type=int, default=50_000, help="total user_words rows")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--operations", type=int, default=400, help="scenario runs per scenario")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--output", help="JSON artifact path (default load_test_<commit>.json)")
+    parser.add_argument("--compare", help="earlier JSON artifact to diff against")
+    parser.add_argument("--reset-database", action="store_true", help="allow dropping tables of a non-SQLite DATABASE_URL")
+    args = parser.parse_args()
+    run(args)
+    if engine.url.get_backend_name() == "sqlite" and os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
@@ -0,0 +1,124 @@
+# benchmarks/login_logging.py
+"""
+Login throughput'unun loglama ayarına göre değişimi. bcrypt maliyeti loglama
+maliyetini gölgelemesin diye hash'ler 4 round ile üretilir. Kayıtlar, her
+yazmada --write-delay-ms bekleyen bir dosyaya yazılır (terminal, pipe ya da
+log toplayıcı arkasındaki yavaş stdout).
+
+Modlar:
+    off            LOG_LEVEL=WARNING, login yolunda kayıt üretilmez
+    info           varsayılan ayar
+    debug          DEBUG, kuyruk + örnekleme (LOG_SAMPLE_RATE)
+    debug-nosample DEBUG, kuyruk, örnekleme yok
+    debug-sync     DEBUG, kuyruk yok: her kayıt istek içinde dosyaya yazılır
+
+    python -m benchmarks.login_logging
+"""
+import os
+import tempfile
+
+# app.database engine'i import sırasında kurar; MySQL yerine SQLite kullan
+DB_PATH = os.path.join(tempfile.gettempdir(), "bench_login_logging.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+
+from app.config import settings
+from app.database import engine
+from app.main import app
+from app.models.user import User
+from app.utils import log, security
+from app.utils.log import JsonFormatter, setup_logging
+from app.utils.password_pool import password_hasher
+from app.utils.security import build_password_context
+from .common import sqlite_sessionmaker
+
+PASSWORD = "logging-password"
+MODES = ["off", "info", "debug", "debug-nosample", "debug-sync"]
+
+
+def seed():
+    SessionLocal = sqlite_sessionmaker(DB_PATH)
+    db = SessionLocal()
+    db.add(User(username="logger", email="logger@example.com", password_hash=security.pwd_context.hash(PASSWORD)))
+    db.commit()
+    db.close()
+    # app.main import sırasında silinen eski dosyaya bağlanmıştı
+    engine.dispose()
+
+
+class SlowStream:
+    """File wrapper whose writes take `delay` seconds, like a congested stdout pipe"""
+
+    def __init__(self, stream, delay: float):
+        self.stream = stream
+        self.delay = delay
+
+    def write(self, text: str) -> int:
+        time.sleep(self.delay)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def configure(mode: str, stream) -> None:
+    settings.LOG_LEVEL = {"off": "WARNING", "info": "INFO"}.get(mode, "DEBUG")
+    log._sample_filter.burst = settings.LOG_SAMPLE_BURST if mode == "debug" else 10 ** 9
+    log._sample_filter._buckets.clear()
+    setup_logging(stream)
+
+    if mode == "debug-sync":
+        root = logging.getLogger()
+        root.handlers.clear()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(JsonFormatter())
+        root.addHandler(handler)
+
+
+async def logins(count: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        start = time.perf_counter()
+        for _ in range(count):
+            response = await http.post("/api/v1/auth/login", data={"username": "logger", "password": PASSWORD})
+            assert response.status_code == 200, response.text
+        return count / (time.perf_counter() - start)
+
+
+def run(count: int, modes, write_delay_ms: float):
+    # Yalnızca uygulamanın kayıtları sayılsın; istemci kütüphanesininkiler değil
+    for name in ("httpx", "httpcore"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    security.pwd_context = build_password_context("bcrypt", bcrypt_rounds=4)
+    # Ölçülen şey loglama; hash çağrıları istek iş parçacığında kalsın
+    password_hasher.workers = 0
+    seed()
+
+    print(f"{'mode':>15} {'logins/s':>9} {'lines':>7}")
+    for mode in modes:
+        path = os.path.join(tempfile.gettempdir(), f"bench_login_logging_{mode}.log")
+        with open(path, "w") as stream:
+            configure(mode, SlowStream(stream, write_delay_ms / 1000))
+            rate = asyncio.run(logins(count))
+            setup_logging(open(os.devnull, "w"))
+        with open(path) as written:
+            lines = sum(1 for _ in written)
+        os.remove(path)
+        print(f"{mode:>15} {rate:>9.0f} {lines:>7}")
+
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=500)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--write-delay-ms", type=float, default=0.5, help="time each log write blocks")
+    args = parser.parse_args()
+    run(args.logins, args.modes, args.write_delay_ms)
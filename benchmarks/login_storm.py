@@ -0,0 +1,100 @@
+# benchmarks/login_storm.py
+"""
+Eşzamanlı login fırtınası altında event loop'un tepkisi: bcrypt event loop
+üzerinde (--workers 0) ile password_hasher iş parçacığı havuzunun
+karşılaştırması. Loginler sürerken /health periyodik olarak çağrılır; havuz
+yokken her bcrypt doğrulaması bu çağrıları da bekletir.
+
+    python -m benchmarks.login_storm
+"""
+import os
+import tempfile
+
+# app.database engine'i import sırasında kurar; MySQL yerine SQLite kullan
+DB_PATH = os.path.join(tempfile.gettempdir(), "bench_login_storm.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.database import engine
+from app.main import app
+from app.models.user import User
+from app.utils.password_pool import PasswordHasher, password_hasher
+from app.utils.security import get_password_hash
+from .common import sqlite_sessionmaker
+
+PASSWORD = "storm-password"
+
+
+def seed():
+    SessionLocal = sqlite_sessionmaker(DB_PATH)
+    db = SessionLocal()
+    db.add(User(username="storm", email="storm@example.com", password_hash=get_password_hash(PASSWORD)))
+    db.commit()
+    db.close()
+    # app.main import sırasında silinen eski dosyaya bağlanmıştı
+    engine.dispose()
+
+
+async def storm(logins: int, probe_interval: float):
+    probes = []
+    statuses = {}
+    done = asyncio.Event()
+
+    async def login(http: httpx.AsyncClient):
+        response = await http.post("/api/v1/auth/login", data={"username": "storm", "password": PASSWORD})
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    async def probe(http: httpx.AsyncClient):
+        # Gecikme, isteğin planlandığı andan ölçülür: event loop bloklanmışken
+        # uyanamayan probe'un bekleyişi de sayılsın
+        scheduled = time.perf_counter()
+        while not done.is_set():
+            await http.get("/health")
+            probes.append(time.perf_counter() - scheduled)
+            scheduled = time.perf_counter() + probe_interval
+            await asyncio.sleep(probe_interval)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        prober = asyncio.create_task(probe(http))
+        start = time.perf_counter()
+        await asyncio.gather(*(login(http) for _ in range(logins)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await prober
+
+    probes.sort()
+    p99 = probes[min(len(probes) - 1, int(len(probes) * 0.99))]
+    return logins / elapsed, statistics.median(probes) * 1000, p99 * 1000, statuses
+
+
+async def run_all(logins: int, workers, queue_limit: int, probe_interval: float):
+    print(f"{'workers':>8} {'logins/s':>9} {'probe p50':>10} {'probe p99':>10}  statuses")
+    for count in workers:
+        hasher = PasswordHasher(workers=count, queue_limit=queue_limit)
+        # Uç noktalar modül düzeyindeki nesneyi kullanıyor; ayarlarını değiştir
+        password_hasher.__dict__.update(hasher.__dict__)
+        rps, p50, p99, statuses = await storm(logins, probe_interval)
+        print(f"{count:>8} {rps:>9.1f} {p50:>10.1f} {p99:>10.1f}  {statuses}")
+
+
+def run(logins: int, workers, queue_limit: int, probe_interval: float):
+    seed()
+    asyncio.run(run_all(logins, workers, queue_limit, probe_interval))
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 4])
+    parser.add_argument("--queue-limit", type=int, default=128)
+    parser.add_argument("--probe-interval", type=float, default=0.01, help="seconds between /health probes")
+    args = parser.parse_args()
+    run(args.logins, args.workers, args.queue_limit, args.probe_interval)
@@ -0,0 +1,76 @@
+# benchmarks/search.py
+"""
+/words/search: eski ilike('%q%') + kelime başına UserWord sorgusu ile trigram
+indeksi + toplu ilerleme sorgusunun karşılaştırması (SQLite stand-in).
+
+    python -m benchmarks.search
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from sqlalchemy import or_
+
+from app.models.user_word import UserWord
+from app.models.word import Word
+from app.utils import search
+from .common import sqlite_sessionmaker, seed_words, seed_user
+
+QUERIES = ["word12", "kelime9", "ord777", "99"]
+
+
+def ilike_search(db, user_id: int, query: str, limit: int = 20) -> list:
+    """The pre-index implementation: full scan plus one progress query per hit"""
+    words = db.query(Word).filter(
+        or_(Word.english.ilike(f"%{query}%"), Word.turkish.ilike(f"%{query}%"))
+    ).limit(limit).all()
+    return [
+        (word, db.query(UserWord).filter(UserWord.user_id == user_id, UserWord.word_id == word.id).first())
+        for word in words
+    ]
+
+
+def best_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def run(sizes, repeat: int):
+    path = os.path.join(tempfile.gettempdir(), "bench_search.db")
+    SessionLocal = sqlite_sessionmaker(path)
+    db = SessionLocal()
+
+    print(f"{'words':>8} {'query':>8} {'ilike ms':>9} {'index ms':>9} {'build ms':>9}")
+    seeded = 0
+    user_id = None
+    for size in sizes:
+        word_ids = seed_words(db, size - seeded)
+        seeded = size
+        if user_id is None:
+            user_id = seed_user(db, "searcher", word_ids[:1000])
+
+        search.invalidate_search_index()
+        start = time.perf_counter()
+        search.get_search_index(db)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        for query in QUERIES:
+            ilike_ms = best_ms(lambda: ilike_search(db, user_id, query), repeat)
+            index_ms = best_ms(lambda: search.search_words(db, user_id, query), repeat)
+            print(f"{size:>8} {query:>8} {ilike_ms:>9.2f} {index_ms:>9.2f} {build_ms:>9.0f}")
+
+    db.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
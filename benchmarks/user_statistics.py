@@ -0,0 +1,74 @@
+# benchmarks/user_statistics.py
+"""
+/users/me/statistics: eski .all() + Python sayımı ile tek aggregate sorgu ve
+önbellekli yolun gecikme ve bellek karşılaştırması (SQLite stand-in).
+
+    python -m benchmarks.user_statistics
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from app.models.user_word import UserWord
+from app.utils.cache import TTLCache
+from app.utils import statistics
+from .common import sqlite_sessionmaker, seed_words, seed_user
+
+
+def python_statistics(db, user_id: int) -> dict:
+    """The pre-aggregate implementation: load every row and count in Python"""
+    user_words = db.query(UserWord).filter(UserWord.user_id == user_id).all()
+    total_words = len(user_words)
+    learned_words = len([w for w in user_words if w.is_learned])
+    average_retention = sum(w.retention_level for w in user_words) / total_words if total_words else 0
+    return {"total_words": total_words, "learned_words": learned_words, "average_retention": average_retention}
+
+
+def measure(fn, repeat: int):
+    """(best time in ms, peak traced memory in KiB)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings) * 1000, peak / 1024
+
+
+def run(sizes, repeat: int):
+    path = os.path.join(tempfile.gettempdir(), "bench_user_statistics.db")
+    SessionLocal = sqlite_sessionmaker(path)
+    db = SessionLocal()
+
+    word_ids = seed_words(db, max(sizes))
+    users = {size: seed_user(db, f"user{size}", word_ids[:size]) for size in sizes}
+
+    statistics.user_statistics_cache = TTLCache(maxsize=1024, ttl=60)
+
+    print(f"{'cards':>8} {'python ms':>10} {'python KiB':>11} {'aggregate ms':>13} {'aggregate KiB':>14} {'cached ms':>10}")
+    for size, user_id in users.items():
+        db.expunge_all()
+        python_ms, python_kib = measure(lambda: python_statistics(db, user_id), repeat)
+        db.expunge_all()
+        aggregate_ms, aggregate_kib = measure(lambda: statistics.get_progress_summary(db, user_id), repeat)
+        statistics.get_cached_progress_summary(db, user_id)
+        cached_ms, _ = measure(lambda: statistics.get_cached_progress_summary(db, user_id), repeat)
+
+        print(f"{size:>8} {python_ms:>10.2f} {python_kib:>11.0f} {aggregate_ms:>13.2f} {aggregate_kib:>14.0f} {cached_ms:>10.4f}")
+
+    db.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
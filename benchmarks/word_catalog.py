@@ -0,0 +1,90 @@
+# benchmarks/word_catalog.py
+"""
+Kelime kataloğu: 100k kelime başına bellek (WordRecord ile ORM Word nesneleri)
+ve 50 kartlık bir listede kelime ayrıntılarını JOIN yerine katalogdan eşlemenin
+gecikmesi (SQLite stand-in).
+
+    python -m benchmarks.word_catalog
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from app.models.user_word import UserWord
+from app.models.word import Word
+from app.utils.catalog import WordCatalog
+from .common import sqlite_sessionmaker, seed_words, seed_user
+
+
+def traced_kib(fn):
+    """(result, traced memory still held after fn returns, in KiB)"""
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1024
+
+
+def best_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def run(sizes, repeat: int, cards: int):
+    path = os.path.join(tempfile.gettempdir(), "bench_word_catalog.db")
+    SessionLocal = sqlite_sessionmaker(path)
+    db = SessionLocal()
+
+    print(f"{'words':>8} {'orm KiB':>9} {'catalog KiB':>12} {'B/word':>7} {'load ms':>8} {'join ms':>8} {'catalog ms':>11}")
+    seeded = 0
+    user_id = None
+    for size in sizes:
+        word_ids = seed_words(db, size - seeded)
+        seeded = size
+        if user_id is None:
+            user_id = seed_user(db, "catalog", word_ids[:cards])
+
+        db.expunge_all()
+        _, orm_kib = traced_kib(lambda: db.query(Word).all())
+        db.expunge_all()
+
+        catalog, catalog_kib = traced_kib(lambda: WordCatalog(refresh_interval=3600).ensure_fresh(db))
+        load_ms = best_ms(lambda: WordCatalog().ensure_fresh(db), 1)
+
+        def joined():
+            db.expunge_all()
+            return db.query(UserWord, Word).join(Word, Word.id == UserWord.word_id).filter(
+                UserWord.user_id == user_id
+            ).limit(cards).all()
+
+        def from_catalog():
+            db.expunge_all()
+            user_words = db.query(UserWord).filter(UserWord.user_id == user_id).limit(cards).all()
+            words = catalog.lookup(db, [uw.word_id for uw in user_words])
+            return [(uw, words[uw.word_id]) for uw in user_words]
+
+        join_ms = best_ms(joined, repeat)
+        catalog_ms = best_ms(from_catalog, repeat)
+        per_word = catalog_kib * 1024 / size
+        print(f"{size:>8} {orm_kib:>9.0f} {catalog_kib:>12.0f} {per_word:>7.0f} {load_ms:>8.0f} {join_ms:>8.2f} {catalog_ms:>11.2f}")
+
+    db.close()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cards", type=int, default=50)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat, args.cards)
@@ -0,0 +1,82 @@
+# calibrate_hash.py
+"""
+Bu makinede şifre doğrulamasının hedef süreye en yakın (aşmadan) maliyetini
+bulur ve .env için ayar satırını yazdırır.
+
+    python calibrate_hash.py --target-ms 250
+    python calibrate_hash.py --scheme argon2 --target-ms 100 --memory-cost 19456
+
+Yeni ayarla uygulama yeniden başladığında eski hash'ler kullanıcılar giriş
+yaptıkça (PASSWORD_REHASH_ON_LOGIN) yeni maliyete taşınır.
+"""
+import argparse
+import statistics
+import time
+
+from app.utils.security import build_password_context
+
+PASSWORD = "calibration-password"
+
+
+def measure_verify(context, samples: int) -> float:
+    """Median verify time in milliseconds for a hash produced by `context`"""
+    hashed = context.hash(PASSWORD)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify(PASSWORD, hashed)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def calibrate_bcrypt(target_ms: float, samples: int) -> int:
+    # Her round süreyi ikiye katlar; hedefi aşınca dur
+    best = 4
+    for rounds in range(4, 32):
+        elapsed = measure_verify(build_password_context("bcrypt", bcrypt_rounds=rounds), samples)
+        print(f"bcrypt rounds={rounds:>2}: {elapsed:8.1f} ms")
+        if elapsed > target_ms:
+            break
+        best = rounds
+    return best
+
+
+def calibrate_argon2(target_ms: float, samples: int, memory_cost: int, parallelism: int) -> int:
+    best = 1
+    for time_cost in range(1, 64):
+        context = build_password_context(
+            "argon2",
+            argon2_time_cost=time_cost,
+            argon2_memory_cost=memory_cost,
+            argon2_parallelism=parallelism
+        )
+        elapsed = measure_verify(context, samples)
+        print(f"argon2 time_cost={time_cost:>2} memory_cost={memory_cost}: {elapsed:8.1f} ms")
+        if elapsed > target_ms:
+            break
+        best = time_cost
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default="bcrypt")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="verify time to stay under")
+    parser.add_argument("--samples", type=int, default=3, help="verifications per setting")
+    parser.add_argument("--memory-cost", type=int, default=19456, help="argon2 memory in KiB")
+    parser.add_argument("--parallelism", type=int, default=1, help="argon2 lanes")
+    args = parser.parse_args()
+
+    if args.scheme == "bcrypt":
+        rounds = calibrate_bcrypt(args.target_ms, args.samples)
+        print(f"\nPASSWORD_HASH_SCHEME=bcrypt\nPASSWORD_BCRYPT_ROUNDS={rounds}")
+    else:
+        time_cost = calibrate_argon2(args.target_ms, args.samples, args.memory_cost, args.parallelism)
+        print(
+            f"\nPASSWORD_HASH_SCHEME=argon2\nPASSWORD_ARGON2_TIME_COST={time_cost}"
+            f"\nPASSWORD_ARGON2_MEMORY_COST={args.memory_cost}\nPASSWORD_ARGON2_PARALLELISM={args.parallelism}"
+        )
+
+
+if __name__ == "__main__":
+    main()
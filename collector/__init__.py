@@ -0,0 +1,4 @@
+# collector/__init__.py
+"""
+word_collector için eşzamanlı, hız limitli toplama altyapısı.
+"""
@@ -0,0 +1,272 @@
+# collector/bulk_import.py
+"""
+Yerel dosyadan toplu kelime yükleme (yeni kurulumu doldurmak için).
+
+Girdi iki biçimde olabilir:
+
+  *.jsonl  Önceden zenginleştirilmiş kayıtlar; her satırda en az "english"
+           ve "turkish". phonetic, example_sentence, image_url ... gibi
+           alanlar varsa kullanılır, yoksa yerel olarak üretilir (zorluk,
+           tür, etiketler, ses adresi). Ağ isteği yapılmaz.
+  diğer    Satır başına bir kelime. Kelimeler CollectorPipeline ile
+           zenginleştirilir; hız upstream limitleriyle sınırlıdır.
+
+Girdi `batch_size` satırlık parçalar halinde okunur. Her parçada:
+1. Girdinin kendi içindeki tekrarlar atılır.
+2. words tablosunda olanlar atılır (--update ile üzerine yazılır).
+3. Kalanlar tek transaction'da upsert edilir.
+4. Kontrol noktası dosyasına girdideki bayt konumu yazılır.
+Yarıda kalan yükleme aynı komutla kaldığı yerden devam eder.
+
+    python -m collector.bulk_import words.jsonl
+    python -m collector.bulk_import words.txt --sqlite /tmp/words.db
+"""
+import argparse
+import dataclasses
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .db_writer import WordWriter, mysql_connection_factory
+from .ledger import SUCCEEDED, WordLedger
+from .pipeline import CollectorPipeline
+
+# JSONL kayıtlarında doğrudan Word alanına aktarılanlar
+OPTIONAL_FIELDS = ("difficulty_level", "part_of_speech", "audio_url", "tags")
+
+
+@dataclass
+class ImportStats:
+    read: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    failed: int = 0
+    offset: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Imported words per second"""
+        return self.imported / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"read {self.read}, imported {self.imported}, duplicates {self.duplicates}, "
+            f"invalid {self.invalid}, failed {self.failed} - {self.rate:.0f} words/s"
+        )
+
+
+def read_chunks(path: str, size: int, offset: int = 0) -> Iterator[Tuple[List[str], int]]:
+    """(lines, byte offset after them) in chunks of `size` non-empty lines, starting at offset"""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        lines = []
+        for raw in f:
+            offset += len(raw)
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                lines.append(line)
+            if len(lines) >= size:
+                yield lines, offset
+                lines = []
+        if lines:
+            yield lines, offset
+
+
+class BulkImporter:
+    """Streams a local word list or JSONL file into the words table"""
+
+    def __init__(
+            self,
+            collector,
+            writer: WordWriter,
+            ledger: Optional[WordLedger] = None,
+            batch_size: int = 1000,
+            update: bool = False,
+            progress_every: float = 5.0,
+            out=sys.stdout
+    ):
+        self.collector = collector
+        self.writer = writer
+        self.ledger = ledger
+        self.batch_size = batch_size
+        self.update = update
+        self.progress_every = progress_every
+        self.out = out
+        self._seen = set()
+
+    def word_from_record(self, record: Dict):
+        """collector Word for a JSONL record, or None when it lacks english/turkish"""
+        english = str(record.get("english") or "").strip().lower()
+        turkish = str(record.get("turkish") or "").strip()
+        if not english or not turkish:
+            return None
+
+        example = {
+            "english": record.get("example_sentence") or "",
+            "turkish": record.get("example_sentence_translation") or ""
+        }
+        word = self.collector.build_word(
+            english,
+            turkish,
+            record.get("phonetic") or self.collector.generate_basic_phonetic(english),
+            example,
+            record.get("image_url")
+        )
+        if word is None:
+            return None
+        overrides = {field: record[field] for field in OPTIONAL_FIELDS if record.get(field) is not None}
+        if isinstance(overrides.get("tags"), str):
+            overrides["tags"] = [tag for tag in overrides["tags"].split(",") if tag]
+        return dataclasses.replace(word, **overrides)
+
+    def _parse_records(self, lines: List[str], stats: ImportStats) -> List:
+        words = []
+        for line in lines:
+            try:
+                word = self.word_from_record(json.loads(line))
+            except (ValueError, TypeError, AttributeError):
+                word = None
+            if word is None:
+                stats.invalid += 1
+            else:
+                words.append(word)
+        return words
+
+    def _enrich(self, lines: List[str], stats: ImportStats) -> List:
+        candidates = self._dedupe([line.split()[0].lower() for line in lines], stats)
+        outcomes = []
+        pipeline = CollectorPipeline(
+            self.collector,
+            on_outcome=lambda word, status, reason: outcomes.append((word, status, reason))
+        )
+        words = list(pipeline.run(candidates))
+        for word, status, reason in outcomes:
+            if self.ledger is not None:
+                self.ledger.record(word, status, reason)
+            # Tekrarlar yalnızca _dedupe'da (girdi + words tablosu) sayılır;
+            # önbellekte olup tabloda olmayan kelime önbellekten zenginleştirilir
+            if reason == "not a word":
+                stats.invalid += 1
+            else:
+                stats.failed += 1
+        return words
+
+    def _dedupe(self, english: List[str], stats: ImportStats) -> List[str]:
+        unique = []
+        for word in english:
+            if word in self._seen:
+                stats.duplicates += 1
+            else:
+                self._seen.add(word)
+                unique.append(word)
+        if self.update:
+            return unique
+        existing = self.writer.existing(unique)
+        stats.duplicates += len(existing)
+        return [word for word in unique if word not in existing]
+
+    def _process(self, lines: List[str], jsonl: bool, stats: ImportStats) -> None:
+        if jsonl:
+            parsed = self._parse_records(lines, stats)
+            by_english = {}
+            for word in parsed:
+                # Aynı kelimenin tekrar eden kayıtlarından ilki alınır
+                by_english.setdefault(word.english, word)
+            words = [by_english[english] for english in self._dedupe([word.english for word in parsed], stats)]
+        else:
+            words = self._enrich(lines, stats)
+
+        failed_before = self.writer.failed
+        for word in words:
+            self.writer.add(word)
+        self.writer.flush()
+        if self.writer.failed > failed_before:
+            raise RuntimeError(f"Database write failed at byte {stats.offset}; rerun to resume")
+        stats.imported += len(words)
+        if self.ledger is not None:
+            self.ledger.record_many([word.english for word in words], SUCCEEDED)
+
+    def _load_checkpoint(self, path: str, checkpoint: Optional[str]) -> ImportStats:
+        if checkpoint and os.path.exists(checkpoint):
+            with open(checkpoint, "r") as f:
+                saved = json.load(f)
+            if saved.get("input") == os.path.abspath(path):
+                stats = ImportStats(**saved["stats"])
+                print(f"Resuming {path} from byte {stats.offset} ({stats.summary()})", file=self.out)
+                return stats
+        return ImportStats()
+
+    def _save_checkpoint(self, path: str, checkpoint: Optional[str], stats: ImportStats) -> None:
+        if not checkpoint:
+            return
+        tmp = f"{checkpoint}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"input": os.path.abspath(path), "stats": dataclasses.asdict(stats)}, f)
+        os.replace(tmp, checkpoint)
+
+    def run(self, path: str, checkpoint: Optional[str] = None) -> ImportStats:
+        """Import path; resumes from and updates checkpoint, which is removed once the import completes"""
+        jsonl = path.endswith(".jsonl")
+        stats = self._load_checkpoint(path, checkpoint)
+        started = time.perf_counter() - stats.elapsed
+        last_report = time.perf_counter()
+
+        for lines, offset in read_chunks(path, self.batch_size, stats.offset):
+            self._process(lines, jsonl, stats)
+            stats.read += len(lines)
+            stats.offset = offset
+            stats.elapsed = time.perf_counter() - started
+            self._save_checkpoint(path, checkpoint, stats)
+
+            if time.perf_counter() - last_report >= self.progress_every:
+                print(stats.summary(), file=self.out)
+                last_report = time.perf_counter()
+
+        stats.elapsed = time.perf_counter() - started
+        if checkpoint and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+        print(f"Done in {stats.elapsed:.1f}s: {stats.summary()}", file=self.out)
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="word list (one per line) or .jsonl with pre-fetched data")
+    parser.add_argument("--sqlite", metavar="PATH", help="write to an SQLite stand-in instead of the DB_* MySQL database")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--update", action="store_true", help="overwrite words that already exist")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: <input>.checkpoint.json)")
+    parser.add_argument("--no-ledger", action="store_true", help="do not record imported words in processed_words.db")
+    args = parser.parse_args()
+
+    # word_collector bu paketi import ettiği için burada, çalışma anında
+    from word_collector import WordCollector
+
+    if args.sqlite:
+        import sqlite3
+        writer = WordWriter(lambda: sqlite3.connect(args.sqlite), dialect="sqlite",
+                            batch_size=args.batch_size, flush_interval=None)
+    else:
+        writer = WordWriter(mysql_connection_factory(), batch_size=args.batch_size, flush_interval=None)
+    ledger = None if args.no_ledger else WordLedger()
+    collector = WordCollector(writer=writer, ledger=ledger)
+    # Batch başına "Saved N words" satırları yerine ilerleme raporu yeterli
+    logging.getLogger("WordCollector.writer").setLevel(logging.WARNING)
+
+    importer = BulkImporter(collector, writer, ledger, batch_size=args.batch_size, update=args.update)
+    try:
+        importer.run(args.input, args.checkpoint or f"{args.input}.checkpoint.json")
+    except KeyboardInterrupt:
+        print("\nStopped; rerun the same command to resume from the checkpoint.")
+    finally:
+        collector.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# collector/cache_store.py
+"""
+word_collector önbelleği için tek dosyalık SQLite anahtar-değer deposu.
+
+Eskiden her kelime için cache/phonetic_<kelime>.json ve
+cache/example_<kelime>.json dosyaları yazılıyor, her aramada os.path.exists
+ile stat yapılıyordu; yüz binlerce kelimede milyonlarca küçük dosya demek.
+Kayıtlar artık (namespace, key) birincil anahtarlı tek tabloda, değerler
+JSON; isteğe bağlı TTL süresi dolan kayıtları okumada gizler, compact()
+siler ve dosyayı küçültür.
+
+    python -m collector.cache_store migrate --cache-dir cache
+    python -m collector.cache_store compact
+    python -m collector.cache_store stats
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+DEFAULT_FILENAME = "collector.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID
+"""
+
+# SQLite tek ifadede en fazla 999 parametre kabul eder (eski sürümler)
+_CHUNK = 500
+
+
+class CacheStore:
+    """Namespaced key-value cache in one SQLite file, with optional per-entry TTL"""
+
+    def __init__(self, path: str, clock=time.time):
+        self.path = path
+        self._clock = clock
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Pipeline iş parçacıkları aynı bağlantıyı kilitle paylaşır
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def _expiry(self, ttl: Optional[float]) -> Optional[float]:
+        return None if ttl is None else self._clock() + ttl
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Cached value, or default when missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, self._clock())
+            ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def contains(self, namespace: str, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM entries WHERE namespace = ? AND key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, self._clock())
+            ).fetchone()
+        return row is not None
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """{key: value} for the keys that are cached and not expired"""
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            now = self._clock()
+            for i in range(0, len(keys), _CHUNK):
+                chunk = keys[i:i + _CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM entries WHERE namespace = ? "
+                    f"AND key IN ({', '.join('?' * len(chunk))}) "
+                    f"AND (expires_at IS NULL OR expires_at > ?)",
+                    (namespace, *chunk, now)
+                )
+                found.update((key, json.loads(value)) for key, value in rows)
+        return found
+
+    def put(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.put_many(namespace, {key: value}, ttl)
+
+    def put_many(self, namespace: str, items: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store every item in one transaction; ttl in seconds, None keeps them forever"""
+        expires_at = self._expiry(ttl)
+        rows = [(namespace, key, json.dumps(value), expires_at) for key, value in items.items()]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def stats(self) -> Dict[str, int]:
+        """Number of live entries per namespace"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT namespace, COUNT(*) FROM entries "
+                "WHERE expires_at IS NULL OR expires_at > ? GROUP BY namespace",
+                (self._clock(),)
+            )
+            return dict(rows)
+
+    def compact(self) -> int:
+        """Delete expired entries and rebuild the file; returns the number deleted"""
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (self._clock(),)
+            ).rowcount
+            self._conn.execute("VACUUM")
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def migrate_json_cache(store: CacheStore, cache_dir: str, batch_size: int = 1000) -> Dict[str, int]:
+    """Import cache/<namespace>_<word>.json files into store; returns counts per namespace"""
+    batches: Dict[str, Dict[str, Any]] = {}
+    counts: Dict[str, int] = {}
+
+    def flush(namespace: str) -> None:
+        store.put_many(namespace, batches.pop(namespace))
+
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not entry.is_file() or not name.endswith(".json") or "_" not in name:
+                continue
+            namespace, key = name[:-len(".json")].split("_", 1)
+            try:
+                with open(entry.path, "r") as f:
+                    value = json.load(f)
+            except (OSError, ValueError):
+                continue
+            # phonetic_<kelime>.json {"phonetic": ...} sarmalıyla yazılıyordu
+            if namespace == "phonetic" and isinstance(value, dict):
+                value = value.get("phonetic")
+            batches.setdefault(namespace, {})[key] = value
+            counts[namespace] = counts.get(namespace, 0) + 1
+            if len(batches[namespace]) >= batch_size:
+                flush(namespace)
+
+    for namespace in list(batches):
+        flush(namespace)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["migrate", "compact", "stats"])
+    parser.add_argument("--cache-dir", default="cache")
+    parser.add_argument("--db", help=f"store path (default: <cache-dir>/{DEFAULT_FILENAME})")
+    args = parser.parse_args()
+
+    store = CacheStore(args.db or os.path.join(args.cache_dir, DEFAULT_FILENAME))
+    if args.command == "migrate":
+        for namespace, count in sorted(migrate_json_cache(store, args.cache_dir).items()):
+            print(f"{namespace}: {count} entries imported")
+        print("The JSON files were left in place; delete them once the import is verified.")
+    elif args.command == "compact":
+        print(f"{store.compact()} expired entries removed")
+    else:
+        for namespace, count in sorted(store.stats().items()):
+            print(f"{namespace}: {count}")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+# collector/db_writer.py
+"""
+İşlenen kelimeleri tamponlayıp toplu yazan veritabanı yazıcısı.
+
+Eskiden her kelime için yeni bir mysql.connector bağlantısı açılıp tek satır
+yazılıyor, commit edilip bağlantı kapatılıyordu; maliyetin çoğu bağlantı
+kurulumuydu. WordWriter tek bir kalıcı (havuzdan alınan) bağlantı tutar,
+kelimeleri biriktirir ve `batch_size`'a ulaşınca ya da en eski kelime
+`flush_interval` saniyedir beklerken hepsini tek transaction içinde
+executemany upsert ile yazar. close() (veya with bloğundan çıkış) kalanları
+yazar.
+
+Aynı arayüz sqlite3 bağlantısıyla da çalışır (dialect="sqlite"); testler ve
+benchmarks.collector_writes bunu kullanır.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Callable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger("WordCollector.writer")
+
+COLUMNS = (
+    "english", "turkish", "phonetic", "difficulty_level",
+    "part_of_speech", "example_sentence", "example_sentence_translation",
+    "image_url", "audio_url", "tags"
+)
+
+_UPDATES = {
+    "mysql": ",\n    ".join(f"{column} = VALUES({column})" for column in COLUMNS[1:]),
+    "sqlite": ",\n    ".join(f"{column} = excluded.{column}" for column in COLUMNS[1:]),
+}
+
+UPSERT_SQL = {
+    "mysql": (
+        f"INSERT INTO words ({', '.join(COLUMNS)})\n"
+        f"VALUES ({', '.join(['%s'] * len(COLUMNS))})\n"
+        f"ON DUPLICATE KEY UPDATE\n    {_UPDATES['mysql']}"
+    ),
+    "sqlite": (
+        f"INSERT INTO words ({', '.join(COLUMNS)})\n"
+        f"VALUES ({', '.join(['?'] * len(COLUMNS))})\n"
+        f"ON CONFLICT(english) DO UPDATE SET\n    {_UPDATES['sqlite']}"
+    ),
+}
+
+PLACEHOLDER = {"mysql": "%s", "sqlite": "?"}
+
+
+def word_row(word) -> Tuple:
+    """words table row for a collector Word"""
+    return (
+        word.english,
+        word.turkish,
+        word.phonetic,
+        word.difficulty_level,
+        word.part_of_speech,
+        word.example_sentence,
+        word.example_sentence_translation,
+        word.image_url,
+        word.audio_url,
+        ','.join(word.tags)
+    )
+
+
+def mysql_connection_factory(pool_size: int = 2) -> Callable:
+    """connect() for WordWriter backed by a mysql.connector pool configured from DB_* env vars"""
+    from mysql.connector import pooling
+
+    pool = pooling.MySQLConnectionPool(
+        pool_name="word_collector",
+        pool_size=pool_size,
+        host=os.getenv('DB_HOST'),
+        port=int(os.getenv('DB_PORT', 3306)),
+        user=os.getenv('DB_USER'),
+        password=os.getenv('DB_PASSWORD'),
+        database=os.getenv('DB_NAME'),
+        ssl_disabled=True
+    )
+    return pool.get_connection
+
+
+class WordWriter:
+    """Buffers collector Words and upserts them in batches over one persistent connection"""
+
+    def __init__(
+            self,
+            connect: Callable,
+            dialect: str = "mysql",
+            batch_size: int = 100,
+            flush_interval: Optional[float] = 2.0
+    ):
+        if dialect not in UPSERT_SQL:
+            raise ValueError(f"Unknown dialect: {dialect}")
+        self._connect = connect
+        self._sql = UPSERT_SQL[dialect]
+        self._placeholder = PLACEHOLDER[dialect]
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._buffer: List[Tuple] = []
+        self._oldest: Optional[float] = None
+        self._buffer_lock = threading.Lock()
+        # Aynı anda tek flush; bağlantı iş parçacıkları arasında paylaşılmaz
+        self._flush_lock = threading.Lock()
+        self._conn = None
+
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+
+        self._closed = threading.Event()
+        self._timer = None
+        if flush_interval:
+            self._timer = threading.Thread(target=self._flush_periodically, name="word-writer", daemon=True)
+            self._timer.start()
+
+    def add(self, word) -> None:
+        """Queue a Word; flushes when the batch is full"""
+        if self._closed.is_set():
+            raise RuntimeError("WordWriter is closed")
+        with self._buffer_lock:
+            if not self._buffer:
+                self._oldest = time.monotonic()
+            self._buffer.append(word_row(word))
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def _take_batch(self) -> List[Tuple]:
+        with self._buffer_lock:
+            rows, self._buffer, self._oldest = self._buffer, [], None
+        return rows
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval / 4):
+            with self._buffer_lock:
+                due = self._oldest is not None and time.monotonic() - self._oldest >= self.flush_interval
+            if due:
+                self.flush()
+
+    def _write(self, rows: Sequence[Tuple]) -> None:
+        if self._conn is None:
+            self._conn = self._connect()
+        cursor = self._conn.cursor()
+        try:
+            cursor.executemany(self._sql, rows)
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def _drop_connection(self) -> None:
+        try:
+            if self._conn is not None:
+                self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+
+    def flush(self) -> int:
+        """Write every buffered Word in one transaction; returns the number written"""
+        with self._flush_lock:
+            rows = self._take_batch()
+            if not rows:
+                return 0
+
+            # Kopmuş bağlantı bir kez yeniden kurulur; ikinci hatada batch düşer
+            for attempt in range(2):
+                try:
+                    self._write(rows)
+                    break
+                except Exception as e:
+                    self._drop_connection()
+                    if attempt == 1:
+                        self.failed += len(rows)
+                        logger.error(
+                            f"Database error for {len(rows)} words "
+                            f"({rows[0][0]} .. {rows[-1][0]}): {str(e)}"
+                        )
+                        return 0
+
+            self.written += len(rows)
+            self.batches += 1
+            logger.info(f"Saved {len(rows)} words")
+            return len(rows)
+
+    def existing(self, words: Sequence[str]) -> Set[str]:
+        """Which of these english words are already in the words table"""
+        if not words:
+            return set()
+        with self._flush_lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            cursor = self._conn.cursor()
+            try:
+                cursor.execute(
+                    f"SELECT english FROM words WHERE english IN ({', '.join([self._placeholder] * len(words))})",
+                    tuple(words)
+                )
+                found = {row[0] for row in cursor.fetchall()}
+            finally:
+                cursor.close()
+                # Okuma transaction'ı açık kalmasın
+                self._conn.rollback()
+        return found
+
+    def close(self) -> None:
+        """Stop the flush timer, write what is left and release the connection"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._timer is not None:
+            self._timer.join()
+        self.flush()
+        self._drop_connection()
+
+    def __enter__(self) -> "WordWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
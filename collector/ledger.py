@@ -0,0 +1,178 @@
+# collector/ledger.py
+"""
+İşlenen kelimelerin kalıcı defteri (processed_words.txt yerine).
+
+processed_words.txt her main() turunda baştan okunup kümeye çevriliyor ve
+sınırsız büyüyordu. Defter, kelime birincil anahtarlı bir SQLite tablosudur;
+üyelik kontrolü indeks araması, dosya her turda yeniden okunmaz. Her kelime
+için durum tutulur: succeeded, failed (hata mesajı ve deneme sayısıyla) veya
+skipped (nedeniyle). failed kelimeler max_attempts'e kadar yeniden denenir.
+
+    python -m collector.ledger import processed_words.txt
+    python -m collector.ledger stats
+    python -m collector.ledger failed
+"""
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_PATH = "processed_words.db"
+
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+SKIPPED = "skipped"
+STATUSES = (SUCCEEDED, FAILED, SKIPPED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed_words (
+    word TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    reason TEXT,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+_CHUNK = 500
+
+
+class WordLedger:
+    """Per-word processing status in an SQLite table"""
+
+    def __init__(self, path: str = DEFAULT_PATH, max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def status(self, word: str) -> Optional[Tuple[str, Optional[str], int]]:
+        """(status, reason, attempts) of a word, or None if it was never recorded"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT status, reason, attempts FROM processed_words WHERE word = ?", (word,)
+            ).fetchone()
+
+    def __contains__(self, word: str) -> bool:
+        return self.status(word) is not None
+
+    def filter_new(self, words: Iterable[str]) -> List[str]:
+        """Words still worth processing: never recorded, or failed fewer than max_attempts times"""
+        words = list(dict.fromkeys(words))
+        done = set()
+        with self._lock:
+            for i in range(0, len(words), _CHUNK):
+                chunk = words[i:i + _CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT word FROM processed_words WHERE word IN ({', '.join('?' * len(chunk))}) "
+                    f"AND (status != ? OR attempts >= ?)",
+                    (*chunk, FAILED, self.max_attempts)
+                )
+                done.update(word for word, in rows)
+        return [word for word in words if word not in done]
+
+    def record(self, word: str, status: str, reason: Optional[str] = None) -> None:
+        self.record_many([word], status, reason)
+
+    def record_many(self, words: Iterable[str], status: str, reason: Optional[str] = None) -> None:
+        """Set the status of every word in one transaction; attempts counts repeated failures"""
+        if status not in STATUSES:
+            raise ValueError(f"Unknown status: {status}")
+        now = time.time()
+        rows = [(word, status, reason, now) for word in words]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT INTO processed_words (word, status, reason, attempts, updated_at) "
+                    "VALUES (?, ?, ?, 1, ?) "
+                    "ON CONFLICT(word) DO UPDATE SET "
+                    "attempts = CASE WHEN processed_words.status = excluded.status "
+                    "THEN processed_words.attempts + 1 ELSE 1 END, "
+                    "status = excluded.status, reason = excluded.reason, updated_at = excluded.updated_at",
+                    rows
+                )
+
+    def failed(self, limit: Optional[int] = None) -> List[Tuple[str, Optional[str], int]]:
+        """Failed words that can still be retried, oldest first: (word, reason, attempts)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT word, reason, attempts FROM processed_words WHERE status = ? AND attempts < ? "
+                "ORDER BY updated_at LIMIT ?",
+                (FAILED, self.max_attempts, -1 if limit is None else limit)
+            ).fetchall()
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM processed_words GROUP BY status"))
+
+    def import_text_file(self, path: str, batch_size: int = 5000) -> int:
+        """Record every line of a processed_words.txt as succeeded; returns the number of words read"""
+        total = 0
+        batch = []
+        # Eski dosya platformun varsayılan kodlamasıyla yazıldı; UTF-8 olmayan
+        # satırlar Latin-1 okunur
+        with open(path, "rb") as f:
+            for raw in f:
+                try:
+                    line = raw.decode("utf-8")
+                except UnicodeDecodeError:
+                    line = raw.decode("latin-1")
+                word = line.strip()
+                if not word:
+                    continue
+                batch.append(word)
+                total += 1
+                if len(batch) >= batch_size:
+                    self._import(batch)
+                    batch = []
+        if batch:
+            self._import(batch)
+        return total
+
+    def _import(self, words: List[str]) -> None:
+        # Mevcut durumların üstüne yazılmaz
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO processed_words (word, status, reason, attempts, updated_at) "
+                    "VALUES (?, ?, 'imported', 1, ?)",
+                    [(word, SUCCEEDED, now) for word in words]
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["import", "stats", "failed"])
+    parser.add_argument("file", nargs="?", default="processed_words.txt", help="text file for import")
+    parser.add_argument("--db", default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    ledger = WordLedger(args.db)
+    if args.command == "import":
+        if not os.path.exists(args.file):
+            parser.error(f"{args.file} not found")
+        print(f"{ledger.import_text_file(args.file)} words read from {args.file}")
+        print(ledger.counts())
+    elif args.command == "stats":
+        for status, count in sorted(ledger.counts().items()):
+            print(f"{status}: {count}")
+    else:
+        for word, reason, attempts in ledger.failed():
+            print(f"{word}\t{attempts}\t{reason}")
+    ledger.close()
+
+
+if __name__ == "__main__":
+    main()
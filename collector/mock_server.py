@@ -0,0 +1,197 @@
+# collector/mock_server.py
+"""
+word_collector'ın dış servislerini taklit eden yerel HTTP sunucusu (testler
+ve benchmarks.collector için).
+
+    /translate/m?q=...          Google Translate mobil sayfası (<div class="t0">;
+                                `translate_page` verilirse her istekte o sayfa)
+    /dictionary/entries/en/<w>  dictionaryapi.dev girdisi
+    /pexels/search?query=...    Pexels araması
+    /datamuse/words?...         Datamuse kelime listesi
+
+Her yanıt `latency` saniye gecikir; `error_rate` olasılıkla 429 (Retry-After: 0)
+veya 503 döner. `fail_first` ile her farklı URL'nin ilk isteği hata alır
+(tekrar denemeyi belirlenimci sınamak için).
+
+Sunucu HTTP/1.1 keep-alive konuşur. Her yeni bağlantı `handshake_latency`
+saniye bekletilir (TCP + TLS el sıkışmasının yerine). JSON yanıtlar ETag ve
+Last-Modified taşır; If-None-Match eşleşirse 304 döner. İstemci kabul
+ediyorsa gövde gzip'lenir. Açılan bağlantılar, 304'ler ve gzip'li yanıtlar
+sayılır. Servis başına istek sayısı ve en yüksek eşzamanlılık tutulur.
+"""
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from .upstreams import Upstream
+
+
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "MockUpstreamServer"
+    protocol_version = "HTTP/1.1"
+    # Başlık ve gövde ayrı yazılıyor; keep-alive bağlantıda Nagle + gecikmeli
+    # ACK her yanıta ~40 ms eklemesin
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        mock = self.server.mock
+        with mock.lock:
+            mock.connections += 1
+        time.sleep(mock.handshake_latency)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        headers = dict(headers or {})
+        if body and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+            with self.server.mock.lock:
+                self.server.mock.gzipped += 1
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        service = url.path.strip("/").split("/")[0]
+        params = parse_qs(url.query)
+        mock = self.server.mock
+
+        with mock.lock:
+            mock.requests[service] += 1
+            mock.active += 1
+            mock.max_active = max(mock.max_active, mock.active)
+        try:
+            time.sleep(mock.latency)
+            if mock.should_fail(service, self.path):
+                if len(self.path) % 2:
+                    self._send(429, b"{}", "application/json", {"Retry-After": "0"})
+                else:
+                    self._send(503, b"{}", "application/json")
+                return
+            status, body, content_type = mock.respond(service, url.path, params)
+            headers = {}
+            if status == 200 and content_type == "application/json":
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                headers = {"ETag": etag, "Last-Modified": LAST_MODIFIED}
+                if self.headers.get("If-None-Match") == etag:
+                    with mock.lock:
+                        mock.not_modified += 1
+                    self._send(304, b"", content_type, headers)
+                    return
+            self._send(status, body, content_type, headers)
+        finally:
+            with mock.lock:
+                mock.active -= 1
+
+
+class MockUpstreamServer:
+    """Threaded local server standing in for every collector upstream"""
+
+    def __init__(
+            self,
+            latency: float = 0.0,
+            error_rate: float = 0.0,
+            fail_first: bool = False,
+            handshake_latency: float = 0.0,
+            translate_page: Optional[str] = None,
+            seed: int = 42
+    ):
+        self.latency = latency
+        self.translate_page = translate_page
+        self.handshake_latency = handshake_latency
+        self.error_rate = error_rate
+        self.fail_first = fail_first
+        self._seen = set()
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.active = 0
+        self.max_active = 0
+        self.connections = 0
+        self.not_modified = 0
+        self.gzipped = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def should_fail(self, service: str, path: str) -> bool:
+        with self.lock:
+            if self.fail_first and path not in self._seen:
+                self._seen.add(path)
+                fail = True
+            else:
+                fail = self.rng.random() < self.error_rate
+            if fail:
+                self.errors[service] += 1
+            return fail
+
+    def respond(self, service: str, path: str, params: Dict):
+        if service == "translate":
+            if self.translate_page is not None:
+                return 200, self.translate_page.encode(), "text/html; charset=utf-8"
+            text = params.get("q", [""])[0]
+            return 200, f'<html><div class="t0">tr {text}</div></html>'.encode(), "text/html; charset=utf-8"
+        if service == "dictionary":
+            word = path.rsplit("/", 1)[-1]
+            entry = [{
+                "word": word,
+                "phonetic": f"/{word}/",
+                "meanings": [{"definitions": [{"example": f"I use the word {word} every day."}]}]
+            }]
+            return 200, json.dumps(entry).encode(), "application/json"
+        if service == "pexels":
+            query = params.get("query", [""])[0].replace(" ", "-")
+            photos = {"photos": [{"src": {"medium": f"https://images.example/{query}.jpg"}}]}
+            return 200, json.dumps(photos).encode(), "application/json"
+        if service == "datamuse":
+            topic = (params.get("topics") or params.get("ml") or params.get("rel_syn") or ["word"])[0]
+            words = [{"word": f"{topic}{chr(97 + i)}"} for i in range(10)]
+            return 200, json.dumps(words).encode(), "application/json"
+        return 404, b"{}", "application/json"
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def upstreams(self, rate: float = 1000, burst: int = 1000, **kwargs) -> Dict[str, Upstream]:
+        """collector upstreams pointing at this server, each limited to `rate` requests/sec"""
+        paths = {"datamuse": "/datamuse", "dictionary": "/dictionary", "translate": "/translate/m", "pexels": "/pexels"}
+        return {
+            name: Upstream(name, self.url + path, rate=rate, burst=burst, **kwargs)
+            for name, path in paths.items()
+        }
+
+    def start(self) -> "MockUpstreamServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockUpstreamServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,108 @@
+# collector/pipeline.py
+"""
+WordCollector.process_word'ün eşzamanlı karşılığı.
+
+Her kelime için üç bağımsız arama (çeviri, sözlük -> fonetik + örnek cümle
+ve çevirisi, Pexels resmi) aynı anda bir iş parçacığı havuzuna verilir;
+aynı anda en fazla `max_in_flight` kelime işlenir, girdi tembel okunur.
+Atlanan ve hata alan kelimeler `on_outcome(kelime, durum, neden)` ile
+bildirilir (collector.ledger durumları); önbelleğe yazılmış sözlük
+ayrıntıları silinir.
+Hız limitleri ve tekrar denemeler upstream'lerde (collector.upstreams)
+olduğu için havuz büyüse de servislere giden istek hızı değişmez.
+"""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from .ledger import FAILED, SKIPPED
+
+LOOKUPS = ("translation", "dictionary", "image")
+
+
+class CollectorPipeline:
+    """Fans the per-word lookups of a WordCollector out over a thread pool"""
+
+    def __init__(
+            self,
+            collector,
+            max_in_flight: int = 16,
+            workers: Optional[int] = None,
+            on_outcome: Optional[Callable[[str, str, Optional[str]], None]] = None
+    ):
+        self.collector = collector
+        self.max_in_flight = max_in_flight
+        self.workers = workers or max_in_flight * len(LOOKUPS)
+        self.on_outcome = on_outcome
+
+    def _report(self, word: str, status: str, reason: Optional[str] = None) -> None:
+        if self.on_outcome is not None:
+            self.on_outcome(word, status, reason)
+
+    def _submit(self, executor: ThreadPoolExecutor, word: str) -> Dict[str, Future]:
+        return {
+            "translation": executor.submit(self.collector.translate, word),
+            "dictionary": executor.submit(self.collector.get_dictionary_details, word),
+            "image": executor.submit(self.collector.get_image_url, word),
+        }
+
+    def _finish(self, word: str, futures: Dict[str, Future]):
+        try:
+            phonetic, example = futures["dictionary"].result()
+            result = self.collector.build_word(
+                word,
+                futures["translation"].result(),
+                phonetic,
+                example,
+                futures["image"].result()
+            )
+        except Exception as e:
+            self.collector.logger.error(f"Error processing word {word}: {str(e)}")
+            # Sözlük araması çeviriyle aynı anda bitip önbelleğe yazmış olabilir;
+            # işlenemeyen kelimenin ayrıntıları önbellekte kalmasın
+            self.collector.discard_details(word)
+            self._report(word, FAILED, str(e))
+            return None
+        if result is None:
+            self.collector.discard_details(word)
+            self._report(word, SKIPPED, "no translation")
+        return result
+
+    def run(self, words: Iterable[str]) -> Iterator:
+        """Yield a Word for every word that could be processed, in completion order"""
+        pending: Dict[str, Dict[str, Future]] = {}
+        words = iter(words)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="collector") as executor:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < self.max_in_flight:
+                    raw = next(words, None)
+                    if raw is None:
+                        exhausted = True
+                        break
+                    reason = self.collector.skip_reason(raw)
+                    if reason is not None:
+                        self._report(raw, SKIPPED, reason)
+                        continue
+                    word = self.collector.normalize_word(raw)
+                    if word not in pending:
+                        pending[word] = self._submit(executor, word)
+
+                if not pending:
+                    return
+
+                finished = [
+                    word for word, futures in pending.items()
+                    if all(future.done() for future in futures.values())
+                ]
+                if not finished:
+                    wait(
+                        [future for futures in pending.values() for future in futures.values() if not future.done()],
+                        return_when=FIRST_COMPLETED
+                    )
+                    continue
+
+                for word in finished:
+                    result = self._finish(word, pending.pop(word))
+                    if result is not None:
+                        yield result
@@ -0,0 +1,50 @@
+# collector/retry.py
+import random
+import time
+from typing import Callable, Optional, Tuple, Type
+
+import requests
+
+
+class RetryableError(Exception):
+    """A failed upstream call worth retrying (429, 5xx); `retry_after` is the server's hint in seconds"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+RETRY_ON: Tuple[Type[BaseException], ...] = (
+    RetryableError,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+
+def call_with_retry(
+        fn: Callable,
+        *args,
+        attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        retry_on: Tuple[Type[BaseException], ...] = RETRY_ON,
+        rng: random.Random = random,
+        sleep: Callable[[float], None] = time.sleep,
+        **kwargs
+):
+    """fn(*args, **kwargs), retried with full-jitter exponential backoff.
+
+    Waits uniform(0, min(max_delay, base_delay * 2**n)) between attempts, or the
+    server's Retry-After when it is longer. The last error is re-raised.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn(*args, **kwargs)
+        except retry_on as e:
+            if attempt == attempts - 1:
+                raise
+            delay = rng.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            retry_after = getattr(e, "retry_after", None)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, max_delay))
+            sleep(delay)
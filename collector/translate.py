@@ -0,0 +1,33 @@
+# collector/translate.py
+"""
+Google Translate mobil sayfasından (GOOGLE_TRANSLATE_URL) çeviri ayıklama.
+
+Sayfa translate upstream'inin oturumuyla istenir (hız limiti, keep-alive,
+429/5xx için RetryableError ve tekrar deneme); burada yalnızca HTML çözülür.
+Güncel sayfada sonuç div.result-container, eski sayfada div.t0 içindedir.
+İkisi de yoksa (sayfa yapısı değişmiş olabilir) TranslationNotFound.
+"""
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+# Sırayla denenir
+RESULT_ELEMENTS = ({"class": "result-container"}, {"class": "t0"})
+
+
+class TranslationNotFound(ValueError):
+    """The translate page had no result element"""
+
+
+def translation_params(text: str, source: str = "en", target: str = "tr") -> Dict[str, str]:
+    return {"sl": source, "tl": target, "q": text}
+
+
+def parse_translation(html: str, text: str) -> str:
+    """Translated text from a mobile Google Translate page for `text`"""
+    soup = BeautifulSoup(html, "html.parser")
+    for attrs in RESULT_ELEMENTS:
+        element = soup.find("div", attrs)
+        if element is not None:
+            return element.get_text(strip=True)
+    raise TranslationNotFound(f"No translation found for {text}")
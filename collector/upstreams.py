@@ -0,0 +1,151 @@
+# collector/upstreams.py
+"""
+word_collector'ın konuştuğu dış servisler. Her Upstream kendi token
+bucket'ına sahiptir; aynı servise giden tüm iş parçacıkları bu limiti paylaşır.
+
+Adres ve hızlar ortam değişkenleriyle değiştirilebilir (yerel mock sunucu,
+farklı kota): COLLECTOR_<AD>_URL, COLLECTOR_<AD>_RATE, COLLECTOR_<AD>_BURST.
+
+Her Upstream'in keep-alive bağlantı havuzlu bir requests.Session'ı vardır;
+her aramada yeniden TCP/TLS el sıkışması yapılmaz. get_json(cache=...)
+yanıtı ETag / Last-Modified ile önbelleğe yazar, sonraki istekte
+If-None-Match / If-Modified-Since gönderir; 304 gelirse önbellekteki gövde
+kullanılır.
+"""
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import TokenBucket
+from .retry import RetryableError, call_with_retry
+
+# Mobil sayfa; çeviri collector.translate ile ayıklanır
+GOOGLE_TRANSLATE_URL = "https://translate.google.com/m"
+
+
+class RateLimited(Exception):
+    """No token became available within the upstream's max_wait"""
+
+
+@dataclass
+class Upstream:
+    name: str
+    base_url: str
+    rate: float  # requests per second
+    burst: int = 1
+    timeout: float = 10.0  # read timeout
+    connect_timeout: float = 3.05
+    # Token için en fazla bu kadar beklenir; None = gerektiği kadar
+    max_wait: Optional[float] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    # Havuzdaki en fazla açık bağlantı (pipeline'daki eşzamanlı istek sayısı)
+    pool_size: int = 16
+    # False: her istek yeni bağlantı açar (eski requests.get davranışı, karşılaştırma için)
+    keep_alive: bool = True
+    limiter: TokenBucket = field(init=False, repr=False)
+    session: requests.Session = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.limiter = TokenBucket(self.rate, self.burst)
+        self.session = requests.Session()
+        # Tekrar denemeler call_with_retry'da; urllib3 kendi başına denemesin
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        self.session.headers.update(self.headers)
+
+    def _acquire(self) -> None:
+        if not self.limiter.acquire(timeout=self.max_wait):
+            raise RateLimited(self.name)
+
+    def _get(self, path: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        self._acquire()
+        url = f"{self.base_url}{path}"
+        timeout = (self.connect_timeout, self.timeout)
+        if self.keep_alive:
+            response = self.session.get(url, headers=headers, timeout=timeout, **kwargs)
+        else:
+            response = requests.get(url, headers={**self.headers, **(headers or {})}, timeout=timeout, **kwargs)
+        if response.status_code == 429 or response.status_code >= 500:
+            retry_after = response.headers.get("Retry-After")
+            raise RetryableError(
+                f"{self.name} returned {response.status_code}",
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None
+            )
+        return response
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        """Rate-limited GET of base_url + path, retried on 429/5xx and connection errors"""
+        return call_with_retry(self._get, path, **kwargs)
+
+    def get_json(self, path: str, cache=None, max_age: float = 0, **kwargs) -> Any:
+        """Decoded JSON body; with a CacheStore, revalidated through ETag / Last-Modified.
+
+        Cached bodies younger than max_age seconds are returned without a request.
+        """
+        if cache is None:
+            return self.get(path, **kwargs).json()
+
+        namespace = f"http:{self.name}"
+        key = requests.Request("GET", f"{self.base_url}{path}", params=kwargs.get("params")).prepare().url
+        cached = cache.get(namespace, key)
+        headers = {}
+        if cached is not None:
+            if time.time() - cached["fetched_at"] < max_age:
+                return cached["body"]
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self.get(path, headers=headers, **kwargs)
+        if response.status_code == 304:
+            # Koşullu başlık yalnızca önbellekte girdi varken gönderilir; yoksa
+            # 304'ün boş gövdesi JSON diye çözülmeye çalışılmasın
+            if cached is None:
+                raise ValueError(f"{self.name} returned 304 for {path} without a cached response")
+            cached["fetched_at"] = time.time()
+            cache.put(namespace, key, cached)
+            return cached["body"]
+
+        body = response.json()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified or max_age):
+            cache.put(namespace, key, {
+                "body": body,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time()
+            })
+        return body
+
+
+def _upstream(name: str, base_url: str, rate: float, burst: int, **kwargs) -> Upstream:
+    prefix = f"COLLECTOR_{name.upper()}"
+    return Upstream(
+        name=name,
+        base_url=os.getenv(f"{prefix}_URL", base_url),
+        rate=float(os.getenv(f"{prefix}_RATE", rate)),
+        burst=int(os.getenv(f"{prefix}_BURST", burst)),
+        **kwargs
+    )
+
+
+def default_upstreams() -> Dict[str, Upstream]:
+    return {
+        "datamuse": _upstream("datamuse", "https://api.datamuse.com", rate=10, burst=10),
+        "dictionary": _upstream("dictionary", "https://api.dictionaryapi.dev/api/v2", rate=5, burst=5),
+        "translate": _upstream("translate", GOOGLE_TRANSLATE_URL, rate=5, burst=5),
+        # Pexels ücretsiz kotası saatte 200 istek; kota bitince resim atlanır,
+        # kelimenin geri kalanı beklemez
+        "pexels": _upstream(
+            "pexels", "https://api.pexels.com/v1", rate=200 / 3600, burst=200, max_wait=0,
+            headers={"Authorization": os.getenv("PEXELS_API_KEY", "x")}
+        ),
+    }
@@ -0,0 +1,28 @@
+"""user_words composite indexes
+
+Revision ID: 3a7c1e9b2d45
+Revises: f106c79f900c
+Create Date: 2026-10-18 10:12:31.412907
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7c1e9b2d45'
+down_revision: Union[str, None] = 'f106c79f900c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_user_next_review', 'user_words', ['user_id', 'next_review'])
+    op.create_index('idx_user_learned_reviewed', 'user_words', ['user_id', 'is_learned', 'last_reviewed'])
+    op.create_index('idx_user_mistakes', 'user_words', ['user_id', 'mistakes_count'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_mistakes', table_name='user_words')
+    op.drop_index('idx_user_learned_reviewed', table_name='user_words')
+    op.drop_index('idx_user_next_review', table_name='user_words')
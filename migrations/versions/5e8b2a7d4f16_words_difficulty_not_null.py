@@ -0,0 +1,36 @@
+"""words.difficulty_level NOT NULL
+
+Revision ID: 5e8b2a7d4f16
+Revises: c51e0a7f9b28
+Create Date: 2026-10-18 14:02:31.118204
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8b2a7d4f16'
+down_revision: Union[str, None] = 'c51e0a7f9b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NULL seviyeler keyset sayfalamasını (difficulty_level, id) bozuyordu
+    op.execute("UPDATE words SET difficulty_level = 1 WHERE difficulty_level IS NULL")
+    op.alter_column(
+        'words', 'difficulty_level',
+        existing_type=sa.Integer(),
+        nullable=False,
+        server_default='1'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'words', 'difficulty_level',
+        existing_type=sa.Integer(),
+        nullable=True,
+        server_default=None
+    )
@@ -0,0 +1,32 @@
+"""user_words unique (user_id, word_id)
+
+Revision ID: 8d2f4b6a1c03
+Revises: 3a7c1e9b2d45
+Create Date: 2026-10-18 11:04:52.118634
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f4b6a1c03'
+down_revision: Union[str, None] = '3a7c1e9b2d45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the oldest row of every duplicated (user_id, word_id) pair
+    op.execute("""
+        DELETE newer FROM user_words newer
+        JOIN user_words older
+          ON older.user_id = newer.user_id
+         AND older.word_id = newer.word_id
+         AND older.id < newer.id
+    """)
+    op.create_unique_constraint('uq_user_word', 'user_words', ['user_id', 'word_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_user_word', 'user_words', type_='unique')
@@ -0,0 +1,24 @@
+"""words (difficulty_level, id) index
+
+Revision ID: c51e0a7f9b28
+Revises: 8d2f4b6a1c03
+Create Date: 2026-10-18 11:47:09.530271
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c51e0a7f9b28'
+down_revision: Union[str, None] = '8d2f4b6a1c03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_difficulty_id', 'words', ['difficulty_level', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_difficulty_id', table_name='words')
@@ -114,7 +114,7 @@ class DatabaseSetup:
                             english VARCHAR(100) UNIQUE NOT NULL,
                             turkish VARCHAR(100) NOT NULL,
                             phonetic VARCHAR(100),
-                            difficulty_level INT DEFAULT 1,
+                            difficulty_level INT NOT NULL DEFAULT 1,
                             part_of_speech VARCHAR(20),
                             example_sentence TEXT,
                             example_sentence_translation TEXT,
@@ -122,7 +122,8 @@ class DatabaseSetup:
                             image_url VARCHAR(255),
                             tags VARCHAR(255),
                             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                            INDEX idx_difficulty_id (difficulty_level, id)
                         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
                     """)
 
@@ -147,9 +148,13 @@ class DatabaseSetup:
                             updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
                             FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
                             FOREIGN KEY (word_id) REFERENCES words(id) ON DELETE CASCADE,
+                            UNIQUE KEY uq_user_word (user_id, word_id),
                             INDEX idx_user_word (user_id, word_id),
                             INDEX idx_next_review (next_review),
-                            INDEX idx_last_reviewed (last_reviewed)
+                            INDEX idx_last_reviewed (last_reviewed),
+                            INDEX idx_user_next_review (user_id, next_review),
+                            INDEX idx_user_learned_reviewed (user_id, is_learned, last_reviewed),
+                            INDEX idx_user_mistakes (user_id, mistakes_count)
                         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
                     """)
 
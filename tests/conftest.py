@@ -1,8 +1,9 @@
 # tests/conftest.py
 import pytest
+from contextlib import contextmanager
 from typing import Generator, Dict
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime, timedelta
 import os
@@ -14,6 +15,10 @@ from app.models.user import User
 from app.models.word import Word
 from app.models.user_word import UserWord
 from app.utils.security import create_access_token, get_password_hash
+from app.utils.auth_cache import clear_auth_caches
+from app.utils.catalog import invalidate_word_catalog
+from app.utils import metrics
+from app.utils.query_detector import findings_summary
 
 # Load environment variables
 load_dotenv()
@@ -180,8 +185,68 @@ def test_user_words(db, test_user, test_words) -> list:
     return [db.refresh(user_word) or user_word for user_word in user_words]
 
 
+@pytest.fixture
+def count_queries():
+    """Record SQL statements issued against the test database inside a with block"""
+    @contextmanager
+    def _count_queries():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return _count_queries
+
+
 @pytest.fixture(autouse=True)
 def cleanup_db(db):
     """Clean up database after each test"""
+    # Fixture'lar kelimeleri her testte yeniden oluşturuyor
+    invalidate_word_catalog()
+    # Kullanıcılar her testte silinip aynı username ile yeniden oluşturuluyor
+    clear_auth_caches()
     yield
-    db.rollback()
\ No newline at end of file
+    db.rollback()
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(n): fail if a request made by the test issues more than n SQL statements"
+    )
+
+
+@pytest.fixture(autouse=True)
+def query_detector(request, monkeypatch):
+    """Every request is checked for repeated statements (raises NPlusOneDetected) and
+    against the test's query_budget marker"""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "QUERY_DETECTOR_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(settings, "QUERY_DETECTOR_RAISE", True)
+
+    requests = []
+    observer = lambda route, stats: requests.append((route, stats))
+    metrics.request_observers.append(observer)
+    try:
+        yield
+    finally:
+        metrics.request_observers.remove(observer)
+
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        return
+    budget = marker.args[0]
+    over_budget = [(route, stats) for route, stats in requests if stats.statements > budget]
+    if over_budget:
+        pytest.fail("\n".join(
+            f"{route} issued {stats.statements} SQL statements (budget {budget})"
+            + ("\n" + findings_summary(list(stats.detector.findings.values())) if stats.detector else "")
+            for route, stats in over_budget
+        ))
@@ -0,0 +1,109 @@
+# tests/test_async_db.py
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.database import get_db, run_db
+from app.main import app
+from app.models.user import User
+from app.models.user_word import UserWord
+from app.utils.review_queue import get_review_queue
+
+# Test veritabanının senkron sürücüsüne karşılık gelen async sürücü
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite"
+}
+
+
+@pytest.fixture
+def async_client(db: Session) -> TestClient:
+    """Test client whose endpoints receive an AsyncSession (USE_ASYNC_DB path)"""
+    url = db.bind.url.set(drivername=ASYNC_DRIVERS[db.bind.dialect.name])
+    # TestClient her istekte yeni bir event loop açabiliyor; havuzlanmış
+    # bağlantılar loop'a bağlı olduğu için NullPool kullan
+    async_engine = create_async_engine(url, poolclass=NullPool)
+    session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    async def get_async_test_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_async_test_db
+    yield TestClient(app)
+    del app.dependency_overrides[get_db]
+
+
+def test_run_db_calls_sync_session_directly(db: Session):
+    def count_users(session: Session, username: str) -> int:
+        assert session is db
+        return session.query(User).filter(User.username == username).count()
+
+    assert asyncio.run(run_db(db, count_users, "nobody")) == 0
+
+
+def test_async_next_words(
+        async_client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        db: Session
+):
+    response = async_client.get(
+        "/api/v1/words/next-words",
+        headers={"Authorization": f"Bearer {test_user['token']}"}
+    )
+
+    assert response.status_code == 200
+    expected = get_review_queue(db, test_user["id"], 10)
+    assert [item["id"] for item in response.json()] == [word.id for word in expected]
+
+
+def test_async_review_is_persisted(
+        async_client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        db: Session
+):
+    word_id = test_user_words[0].word_id
+    response = async_client.post(
+        "/api/v1/words/review",
+        headers={"Authorization": f"Bearer {test_user['token']}"},
+        json={"word_id": word_id, "quality": 4, "response_time": 1200, "was_correct": True}
+    )
+
+    assert response.status_code == 200
+    db.rollback()
+    user_word = db.query(UserWord).filter(
+        UserWord.user_id == test_user["id"],
+        UserWord.word_id == word_id
+    ).one()
+    assert user_word.times_reviewed == 1
+    assert user_word.retention_level == response.json()["retention_level"]
+
+
+def test_async_update_user_and_search(
+        async_client: TestClient,
+        test_user: dict,
+        test_words: list
+):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+
+    response = async_client.put("/api/v1/users/me", headers=headers, json={"full_name": "Async User"})
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Async User"
+
+    response = async_client.get("/api/v1/words/search?query=hello", headers=headers)
+    assert response.status_code == 200
+    assert response.json()[0]["english"] == "hello"
+
+
+def test_async_unknown_token_is_rejected(async_client: TestClient, test_user: dict):
+    response = async_client.get(
+        "/api/v1/auth/me",
+        headers={"Authorization": "Bearer not-a-token"}
+    )
+    assert response.status_code == 401
@@ -0,0 +1,132 @@
+# tests/test_auth_cache.py
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+from app.utils.auth_cache import token_cache, user_cache, verify_token_cached
+from app.utils.security import create_access_token
+
+
+def users_selects(statements: list) -> list:
+    return [s for s in statements if "FROM users" in s]
+
+
+def test_token_verification_is_memoized(test_user: dict):
+    token = test_user["token"]
+
+    assert verify_token_cached(token)["sub"] == test_user["username"]
+    hits = token_cache.stats()["hits"]
+    assert verify_token_cached(token)["sub"] == test_user["username"]
+    assert token_cache.stats()["hits"] == hits + 1
+
+
+def test_invalid_and_expired_tokens_are_not_cached():
+    expired = create_access_token({"sub": "someone"}, expires_delta=timedelta(seconds=-1))
+
+    assert verify_token_cached("not-a-token") is None
+    assert verify_token_cached(expired) is None
+    assert token_cache.stats()["size"] == 0
+
+
+def test_current_user_served_from_cache(
+        client: TestClient,
+        test_user: dict,
+        count_queries
+):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    with count_queries() as statements:
+        response = client.get("/api/v1/auth/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["username"] == test_user["username"]
+    assert users_selects(statements) == []
+    assert user_cache.stats()["hits"] >= 1
+
+
+def test_cached_user_can_be_updated(
+        client: TestClient,
+        test_user: dict,
+        db: Session
+):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    client.get("/api/v1/auth/me", headers=headers)
+
+    response = client.post("/api/v1/users/me/daily-goal", headers=headers, json={"goal": 25})
+    assert response.status_code == 200
+
+    db.expire_all()
+    assert db.query(User).filter(User.id == test_user["id"]).one().daily_goal == 25
+    assert client.get("/api/v1/auth/me", headers=headers).json()["daily_goal"] == 25
+
+
+def test_profile_update_invalidates_cache(client: TestClient, test_user: dict):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    client.get("/api/v1/auth/me", headers=headers)
+
+    response = client.put("/api/v1/users/me", headers=headers, json={"full_name": "Renamed"})
+    assert response.status_code == 200
+
+    assert user_cache.get(test_user["username"]) is None
+    assert client.get("/api/v1/auth/me", headers=headers).json()["full_name"] == "Renamed"
+
+
+def test_reset_password_invalidates_cache(client: TestClient, test_user: dict):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    client.get("/api/v1/auth/me", headers=headers)
+
+    response = client.post(
+        "/api/v1/auth/reset-password",
+        headers=headers,
+        json={
+            "old_password": "testpassword",
+            "new_password": "newpassword123",
+            "confirm_password": "newpassword123"
+        }
+    )
+    assert response.status_code == 200
+    assert user_cache.get(test_user["username"]) is None
+
+    login = client.post(
+        "/api/v1/auth/login",
+        data={"username": test_user["username"], "password": "newpassword123"}
+    )
+    assert login.status_code == 200
+
+
+def test_deleted_user_is_rejected(client: TestClient, test_user: dict):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    client.get("/api/v1/auth/me", headers=headers)
+
+    assert client.delete("/api/v1/users/me", headers=headers).status_code == 204
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+
+
+def test_is_active_change_invalidates_cache(
+        client: TestClient,
+        test_user: dict,
+        db: Session
+):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    client.get("/api/v1/auth/me", headers=headers)
+    assert user_cache.get(test_user["username"]) is not None
+
+    user = db.query(User).filter(User.id == test_user["id"]).one()
+    user.is_active = False
+    db.commit()
+
+    assert user_cache.get(test_user["username"]) is None
+
+
+def test_cache_stats_endpoint(client: TestClient, test_user: dict):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    client.get("/api/v1/auth/me", headers=headers)
+    client.get("/api/v1/auth/me", headers=headers)
+
+    stats = client.get("/cache-stats").json()
+    assert stats["users"]["hits"] >= 1
+    assert stats["tokens"]["hits"] >= 1
+    assert set(stats) == {"tokens", "users", "user_statistics"}
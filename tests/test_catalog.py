@@ -0,0 +1,141 @@
+# tests/test_catalog.py
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.word import Word
+from app.models.user_word import UserWord
+from app.utils.catalog import WordCatalog, WordRecord, get_word_catalog
+
+# get_current_user + user_words (kelime ayrıntıları katalogdan)
+WORD_LIST_QUERY_BUDGET = 2
+
+
+def test_catalog_loads_lazily(db: Session, test_words: list):
+    catalog = WordCatalog(refresh_interval=0)
+    assert not catalog.loaded
+
+    catalog.ensure_fresh(db)
+
+    assert catalog.loaded
+    assert len(catalog) == db.query(Word).count()
+    record = catalog.records[test_words[0].id]
+    assert isinstance(record, WordRecord)
+    assert record.english == test_words[0].english
+    assert not hasattr(record, "__dict__")
+
+
+def test_catalog_refresh_picks_up_new_and_updated_words(db: Session, test_words: list):
+    catalog = WordCatalog(refresh_interval=0).ensure_fresh(db)
+    version = catalog.version
+
+    db.add(Word(english="catalog-new", turkish="yeni", difficulty_level=1))
+    test_words[0].turkish = "selam"
+    db.commit()
+    catalog.ensure_fresh(db)
+
+    assert catalog.version > version
+    assert catalog.records[test_words[0].id].turkish == "selam"
+    assert any(record.english == "catalog-new" for record in catalog.records.values())
+
+
+def test_catalog_refresh_drops_deleted_words(db: Session, test_words: list):
+    catalog = WordCatalog(refresh_interval=0).ensure_fresh(db)
+    deleted_id = test_words[-1].id
+
+    db.delete(test_words[-1])
+    db.commit()
+    catalog.ensure_fresh(db)
+
+    assert deleted_id not in catalog.records
+    assert len(catalog) == db.query(Word).count()
+
+
+def test_catalog_refresh_picks_up_update_in_same_second(db: Session, test_words: list):
+    same_second = datetime(2030, 1, 1, 12, 0, 0)
+    test_words[0].updated_at = same_second
+    db.commit()
+    catalog = WordCatalog(refresh_interval=0).ensure_fresh(db)
+    version = catalog.version
+
+    # MAX(updated_at) ve satır sayısı değişmiyor
+    test_words[1].turkish = "aynı saniye"
+    test_words[1].updated_at = same_second
+    db.commit()
+    catalog.ensure_fresh(db)
+
+    assert catalog.records[test_words[1].id].turkish == "aynı saniye"
+    assert catalog.version > version
+
+
+def test_catalog_unchanged_refresh_keeps_version(db: Session, test_words: list, count_queries):
+    catalog = WordCatalog(refresh_interval=0).ensure_fresh(db)
+    version = catalog.version
+
+    with count_queries() as statements:
+        catalog.ensure_fresh(db)
+
+    # COUNT + yüksek su işaretindeki satırlar
+    assert len(statements) == 2
+    assert catalog.version == version
+
+
+def test_lookup_refreshes_for_unknown_ids(db: Session, test_words: list):
+    catalog = WordCatalog(refresh_interval=3600).ensure_fresh(db)
+
+    word = Word(english="catalog-late", turkish="geç", difficulty_level=2)
+    db.add(word)
+    db.commit()
+
+    records = catalog.lookup(db, [test_words[0].id, word.id, -1])
+    assert records[word.id].english == "catalog-late"
+    assert -1 not in records
+
+
+def test_difficult_words_use_catalog(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        db: Session,
+        count_queries
+):
+    for user_word in test_user_words:
+        user_word.mistakes_count = 3
+    db.commit()
+    get_word_catalog(db)
+
+    with count_queries() as statements:
+        response = client.get(
+            "/api/v1/words/difficult-words",
+            headers={"Authorization": f"Bearer {test_user['token']}"}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == len(test_user_words)
+    assert {item["word"]["english"] for item in data} == {uw.word.english for uw in test_user_words}
+    assert len(statements) <= WORD_LIST_QUERY_BUDGET, statements
+
+
+def test_learned_words_use_catalog(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        db: Session,
+        count_queries
+):
+    db.query(UserWord).filter(UserWord.user_id == test_user["id"]).update({"is_learned": True})
+    db.commit()
+    get_word_catalog(db)
+
+    with count_queries() as statements:
+        response = client.get(
+            "/api/v1/words/learned-words",
+            headers={"Authorization": f"Bearer {test_user['token']}"}
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()) == len(test_user_words)
+    assert response.json()[0]["english"]
+    assert len(statements) <= WORD_LIST_QUERY_BUDGET, statements
@@ -0,0 +1,589 @@
+import io
+import json
+import os
+import random
+import sqlite3
+import time
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("mysql.connector")
+
+from collector.bulk_import import BulkImporter
+from collector.cache_store import CacheStore, migrate_json_cache
+from collector.db_writer import WordWriter
+from collector.ledger import FAILED, SKIPPED, SUCCEEDED, WordLedger
+from collector.mock_server import MockUpstreamServer
+from collector.pipeline import CollectorPipeline
+from collector.rate_limit import TokenBucket
+from collector.retry import RetryableError, call_with_retry
+from collector.translate import TranslationNotFound
+from collector.upstreams import Upstream
+from word_collector import Word, WordCollector
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_token_bucket_spends_burst_then_waits_for_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        assert bucket.acquire()
+    assert clock.now == 0
+
+    bucket.acquire()
+    assert clock.now == pytest.approx(0.5)
+    bucket.acquire()
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_token_bucket_gives_up_after_timeout():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire(timeout=0)
+    assert not bucket.acquire(timeout=0)
+    assert not bucket.acquire(timeout=0.5)
+    assert bucket.acquire(timeout=1)
+
+
+def test_retry_uses_full_jitter_and_retry_after():
+    delays = []
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RetryableError("busy", retry_after=3)
+        if len(calls) < 4:
+            raise RetryableError("busy")
+        return "ok"
+
+    result = call_with_retry(flaky, attempts=4, base_delay=1, rng=random.Random(0), sleep=delays.append)
+
+    assert result == "ok"
+    assert len(delays) == 3
+    assert delays[0] >= 3
+    assert 0 <= delays[1] <= 2
+    assert 0 <= delays[2] <= 4
+
+
+def test_retry_reraises_after_last_attempt():
+    delays = []
+
+    def failing():
+        raise RetryableError("down")
+
+    with pytest.raises(RetryableError):
+        call_with_retry(failing, attempts=3, sleep=delays.append)
+    assert len(delays) == 2
+
+    def broken():
+        raise ValueError("not retryable")
+
+    with pytest.raises(ValueError):
+        call_with_retry(broken, sleep=delays.append)
+    assert len(delays) == 2
+
+
+@pytest.fixture
+def mock_upstream():
+    with MockUpstreamServer(latency=0.02) as server:
+        yield server
+
+
+def make_collector(server, tmp_path, **upstream_kwargs):
+    return WordCollector(upstreams=server.upstreams(**upstream_kwargs), cache_dir=str(tmp_path))
+
+
+def test_pipeline_matches_sequential_processing(mock_upstream, tmp_path):
+    words = ["apple", "river", "garden", "window", "bright"]
+    sequential = make_collector(mock_upstream, tmp_path / "seq")
+    expected = {word: sequential.process_word(word) for word in words}
+
+    concurrent = make_collector(mock_upstream, tmp_path / "pipe")
+    results = {word.english: word for word in CollectorPipeline(concurrent, max_in_flight=4).run(words)}
+
+    assert results == expected
+    assert results["apple"].turkish == "tr apple"
+    assert results["apple"].phonetic == "/apple/"
+    assert results["apple"].example_sentence == "I use the word apple every day."
+    assert results["apple"].image_url.startswith("https://images.example/")
+
+
+def test_pipeline_bounds_words_in_flight(mock_upstream, tmp_path):
+    collector = make_collector(mock_upstream, tmp_path)
+    consumed = []
+
+    def words():
+        for i in range(20):
+            consumed.append(i)
+            yield "word" + "abcdefghijklmnopqrst"[i]
+
+    pipeline = CollectorPipeline(collector, max_in_flight=2)
+    first = next(pipeline.run(words()))
+
+    assert first is not None
+    # İlk sonuç gelene kadar en fazla max_in_flight kelime okunmuş olmalı
+    assert len(consumed) <= 2
+    # Kelime başına en fazla 3 arama + örnek cümle çevirisi
+    assert mock_upstream.max_active <= 2 * 4
+
+
+def test_pipeline_respects_upstream_rate(mock_upstream, tmp_path):
+    collector = make_collector(mock_upstream, tmp_path, rate=20, burst=1)
+    start = time.monotonic()
+    results = list(CollectorPipeline(collector, max_in_flight=8).run(["alpha", "bravo", "charlie", "delta", "echo"]))
+    elapsed = time.monotonic() - start
+
+    assert len(results) == 5
+    # Her kelime 2 çeviri isteği yapar: 10 istek, 20/s, burst 1 -> en az ~0.45 s
+    assert mock_upstream.requests["translate"] == 10
+    assert elapsed >= 0.45
+
+
+def test_pipeline_retries_upstream_errors(tmp_path):
+    with MockUpstreamServer(fail_first=True) as server:
+        collector = make_collector(server, tmp_path)
+        words = ["apple", "river", "garden", "window", "bright", "silver", "orange", "planet"]
+        results = list(CollectorPipeline(collector, max_in_flight=4).run(words))
+
+    # Her farklı URL bir kez 429/503 aldı, tekrar denemede başardı
+    assert server.errors["translate"] == server.requests["translate"] // 2
+    assert {word.english for word in results} == set(words)
+
+
+TRANSLATE_PAGE = os.path.join(os.path.dirname(__file__), "fixtures", "google_translate_m.html")
+
+
+def test_translate_parses_mobile_page(tmp_path):
+    with open(TRANSLATE_PAGE, encoding="utf-8") as f:
+        page = f.read()
+    with MockUpstreamServer(translate_page=page, fail_first=True) as server:
+        collector = make_collector(server, tmp_path)
+        assert collector.translate("apple") == "elma"
+        # İlk istek 429/503 aldı, upstream tekrar denedi
+        assert (server.errors["translate"], server.requests["translate"]) == (1, 2)
+        collector.close()
+
+    # Sayfa yapısı değişince anlaşılır hata
+    with MockUpstreamServer(translate_page="<html><body><div class=\"error\">Try again</div></body></html>") as server:
+        collector = make_collector(server, tmp_path / "changed")
+        with pytest.raises(TranslationNotFound, match="apple"):
+            collector.translate("apple")
+        collector.close()
+
+
+WORDS_DDL = """
+CREATE TABLE words (
+    id INTEGER PRIMARY KEY,
+    english VARCHAR(100) UNIQUE NOT NULL,
+    turkish VARCHAR(100) NOT NULL,
+    phonetic VARCHAR(100),
+    difficulty_level INTEGER,
+    part_of_speech VARCHAR(20),
+    example_sentence TEXT,
+    example_sentence_translation TEXT,
+    image_url VARCHAR(255),
+    audio_url VARCHAR(255),
+    tags VARCHAR(255)
+)
+"""
+
+
+def make_word(english, turkish="kelime"):
+    return Word(
+        english=english, turkish=turkish, phonetic=f"/{english}/", difficulty_level=1,
+        part_of_speech="noun", example_sentence="", example_sentence_translation="",
+        image_url=None, audio_url=None, tags=["basic", "noun"]
+    )
+
+
+class CountingConnection:
+    """sqlite3 connection that counts commits and can fail the next executemany"""
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.commits = 0
+        self.fail_next = False
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def __init__(self):
+                self.cursor = connection.conn.cursor()
+
+            def executemany(self, sql, rows):
+                if connection.fail_next:
+                    connection.fail_next = False
+                    raise sqlite3.OperationalError("connection lost")
+                return self.cursor.executemany(sql, rows)
+
+            def close(self):
+                self.cursor.close()
+
+        return Cursor()
+
+    def commit(self):
+        self.commits += 1
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        self.conn.close()
+
+
+@pytest.fixture
+def words_db(tmp_path):
+    path = str(tmp_path / "words.db")
+    conn = sqlite3.connect(path)
+    conn.execute(WORDS_DDL)
+    conn.close()
+    connections = []
+
+    def connect():
+        connections.append(CountingConnection(path))
+        return connections[-1]
+
+    def rows():
+        conn = sqlite3.connect(path)
+        result = conn.execute("SELECT english, turkish, tags FROM words ORDER BY english").fetchall()
+        conn.close()
+        return result
+
+    return connect, connections, rows
+
+
+def test_writer_flushes_full_batches_in_one_transaction(words_db):
+    connect, connections, rows = words_db
+    writer = WordWriter(connect, dialect="sqlite", batch_size=3, flush_interval=None)
+
+    for name in ["apple", "bread", "cloud", "drum"]:
+        writer.add(make_word(name))
+
+    assert [row[0] for row in rows()] == ["apple", "bread", "cloud"]
+    writer.close()
+
+    assert len(rows()) == 4
+    assert len(connections) == 1
+    assert connections[0].commits == 2
+    assert writer.written == 4 and writer.batches == 2
+
+
+def test_writer_upserts_existing_words(words_db):
+    connect, _, rows = words_db
+    with WordWriter(connect, dialect="sqlite", flush_interval=None) as writer:
+        writer.add(make_word("apple", "elma"))
+    with WordWriter(connect, dialect="sqlite", flush_interval=None) as writer:
+        writer.add(make_word("apple", "elma ağacı"))
+
+    assert rows() == [("apple", "elma ağacı", "basic,noun")]
+
+
+def test_writer_flushes_on_interval(words_db):
+    connect, _, rows = words_db
+    writer = WordWriter(connect, dialect="sqlite", batch_size=100, flush_interval=0.1)
+    writer.add(make_word("apple"))
+
+    deadline = time.monotonic() + 2
+    while not rows() and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert [row[0] for row in rows()] == ["apple"]
+    writer.close()
+
+
+def test_writer_reconnects_after_failed_batch(words_db):
+    connect, connections, rows = words_db
+    writer = WordWriter(connect, dialect="sqlite", flush_interval=None)
+    writer.add(make_word("apple"))
+    writer.flush()
+
+    connections[0].fail_next = True
+    writer.add(make_word("bread"))
+    assert writer.flush() == 1
+
+    assert len(connections) == 2
+    assert [row[0] for row in rows()] == ["apple", "bread"]
+    writer.close()
+
+    with pytest.raises(RuntimeError):
+        writer.add(make_word("cloud"))
+
+
+def test_cache_store_namespaces_and_ttl(tmp_path):
+    clock = FakeClock()
+    store = CacheStore(str(tmp_path / "cache.db"), clock=clock)
+
+    store.put("phonetic", "apple", "/ˈæp.əl/")
+    store.put_many("example", {"apple": {"english": "An apple.", "turkish": "Bir elma."}, "river": {}}, ttl=10)
+
+    assert store.get("phonetic", "apple") == "/ˈæp.əl/"
+    assert store.get("example", "phonetic") is None
+    assert store.get_many("example", ["apple", "river", "cloud"]) == {
+        "apple": {"english": "An apple.", "turkish": "Bir elma."}, "river": {}
+    }
+
+    clock.now = 11
+    assert not store.contains("example", "apple")
+    assert store.get("example", "apple", "missing") == "missing"
+    assert store.stats() == {"phonetic": 1}
+    assert store.compact() == 2
+    store.close()
+
+
+def test_migrate_json_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    (cache_dir / "phonetic_apple.json").write_text(json.dumps({"phonetic": "/apple/"}))
+    (cache_dir / "example_apple.json").write_text(json.dumps({"english": "An apple.", "turkish": "Bir elma."}))
+    (cache_dir / "example_broken.json").write_text("{")
+
+    store = CacheStore(str(cache_dir / "collector.db"))
+    assert migrate_json_cache(store, str(cache_dir)) == {"phonetic": 1, "example": 1}
+
+    collector = WordCollector(upstreams={}, cache_dir=str(cache_dir))
+    assert collector.get_phonetic("apple") == "/apple/"
+    assert collector.get_example_sentence("apple")["english"] == "An apple."
+    # İşlenmiş sayılmak defterin işi; önbellekteki kelime yine işlenebilir
+    assert collector.normalize_word("apple") == "apple"
+    collector.close()
+    store.close()
+
+
+def test_ledger_statuses_and_retries(tmp_path):
+    ledger = WordLedger(str(tmp_path / "ledger.db"), max_attempts=2)
+    ledger.record_many(["apple", "river"], SUCCEEDED)
+    ledger.record("bright", SKIPPED, "no translation")
+    ledger.record("cloud", FAILED, "timeout")
+
+    assert "apple" in ledger and "drum" not in ledger
+    assert ledger.status("bright") == (SKIPPED, "no translation", 1)
+    assert ledger.filter_new(["apple", "bright", "cloud", "drum", "drum"]) == ["cloud", "drum"]
+    assert ledger.failed() == [("cloud", "timeout", 1)]
+
+    ledger.record("cloud", FAILED, "timeout")
+    assert ledger.filter_new(["cloud"]) == []
+    assert ledger.failed() == []
+    assert ledger.counts() == {SUCCEEDED: 2, SKIPPED: 1, FAILED: 1}
+
+    with pytest.raises(ValueError):
+        ledger.record("drum", "done")
+    ledger.close()
+
+
+def test_ledger_imports_text_file_without_overwriting(tmp_path):
+    text = tmp_path / "processed_words.txt"
+    text.write_text("apple\nriver\n\napple\ncloud\n")
+    ledger = WordLedger(str(tmp_path / "ledger.db"))
+    ledger.record("cloud", FAILED, "timeout")
+
+    assert ledger.import_text_file(str(text)) == 4
+    assert ledger.counts() == {SUCCEEDED: 2, FAILED: 1}
+    assert ledger.status("cloud")[0] == FAILED
+    ledger.close()
+
+
+def test_pipeline_reports_skipped_and_failed_words(tmp_path):
+    outcomes = {}
+    with MockUpstreamServer(error_rate=1.0) as server:
+        collector = make_collector(server, tmp_path)
+        pipeline = CollectorPipeline(collector, on_outcome=lambda word, status, reason: outcomes.setdefault(word, status))
+        # Her istek hata alır; çeviri tekrar denemeleri tükenince kelime failed olur
+        results = list(pipeline.run(["x", "well-known", "apple"]))
+
+    assert results == []
+    assert outcomes == {"x": SKIPPED, "well-known": SKIPPED, "apple": FAILED}
+
+
+def test_pipeline_discards_cached_details_of_failed_words(mock_upstream, tmp_path):
+    upstreams = mock_upstream.upstreams()
+    # Çeviri 404 alır; sözlük araması yine de tamamlanır
+    upstreams["translate"] = Upstream("translate", mock_upstream.url + "/missing", rate=1000, burst=1000)
+    collector = WordCollector(upstreams=upstreams, cache_dir=str(tmp_path))
+    outcomes = {}
+    pipeline = CollectorPipeline(collector, on_outcome=lambda word, status, reason: outcomes.setdefault(word, status))
+
+    assert list(pipeline.run(["apple"])) == []
+    assert outcomes == {"apple": FAILED}
+    assert mock_upstream.requests["dictionary"] == 1
+    assert not collector.cache.contains("example", "apple")
+    assert not collector.cache.contains("phonetic", "apple")
+    collector.close()
+
+
+def test_failed_word_is_retried_and_succeeds(mock_upstream, tmp_path):
+    ledger = WordLedger(str(tmp_path / "ledger.db"))
+    upstreams = mock_upstream.upstreams()
+    upstreams["translate"] = Upstream("translate", mock_upstream.url + "/missing", rate=1000, burst=1000)
+    collector = WordCollector(upstreams=upstreams, cache_dir=str(tmp_path / "cache"), ledger=ledger)
+    pipeline = CollectorPipeline(collector, on_outcome=ledger.record)
+
+    assert list(pipeline.run(ledger.filter_new(["apple"]))) == []
+    assert ledger.status("apple")[:2] == (FAILED, "translate returned 404")
+
+    # Önceki sürümlerden kalmış önbellek girdisi de yeniden denemeyi engellemez
+    collector.cache.put("example", "apple", {"english": "An apple.", "turkish": "Bir elma."})
+    collector.upstreams = mock_upstream.upstreams()
+    retry = ledger.filter_new([word for word, _, _ in ledger.failed()])
+    words = list(pipeline.run(retry))
+    ledger.record_many([word.english for word in words], SUCCEEDED)
+
+    assert [(word.english, word.turkish) for word in words] == [("apple", "tr apple")]
+    assert ledger.status("apple")[0] == SUCCEEDED
+    assert ledger.failed() == []
+    collector.close()
+
+
+@pytest.fixture
+def importer_factory(words_db, tmp_path):
+    path = str(tmp_path / "words.db")
+
+    def factory(upstreams=None, **kwargs):
+        writer = WordWriter(lambda: sqlite3.connect(path), dialect="sqlite", flush_interval=None)
+        ledger = WordLedger(str(tmp_path / "ledger.db"))
+        collector = WordCollector(upstreams=upstreams, cache_dir=str(tmp_path / "cache"), writer=writer, ledger=ledger)
+        return BulkImporter(collector, writer, ledger, out=io.StringIO(), **kwargs), collector
+
+    return factory
+
+
+def write_jsonl(path, records):
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+    return str(path)
+
+
+def test_bulk_import_jsonl_dedupes_and_fills_defaults(words_db, importer_factory, tmp_path):
+    _, _, rows = words_db
+    source = write_jsonl(tmp_path / "words.jsonl", [
+        {"english": "Apple", "turkish": "elma", "tags": "fruit,basic"},
+        {"english": "river", "turkish": "nehir", "example_sentence": "A long river."},
+        {"english": "apple", "turkish": "elma 2"},
+        {"english": "broken"},
+        {"english": "cloud", "turkish": "bulut"},
+    ])
+    with open(source, "a") as f:
+        f.write("not json\n")
+
+    importer, collector = importer_factory(batch_size=2)
+    stats = importer.run(source)
+
+    assert (stats.read, stats.imported, stats.duplicates, stats.invalid) == (6, 3, 1, 2)
+    assert [row[:2] for row in rows()] == [("apple", "elma"), ("cloud", "bulut"), ("river", "nehir")]
+    assert rows()[0][2] == "fruit,basic"
+    assert collector.ledger.filter_new(["apple", "cloud", "drum"]) == ["drum"]
+
+    # Tabloda olanlar ikinci çalıştırmada atlanır
+    again, _ = importer_factory()
+    stats = again.run(source)
+    assert stats.imported == 0 and stats.duplicates == 4
+    collector.close()
+
+
+def test_bulk_import_resumes_from_checkpoint(words_db, importer_factory, tmp_path):
+    _, _, rows = words_db
+    source = write_jsonl(tmp_path / "words.jsonl", [
+        {"english": f"word{chr(97 + i)}", "turkish": f"kelime{i}"} for i in range(10)
+    ])
+    checkpoint = str(tmp_path / "import.checkpoint.json")
+
+    importer, _ = importer_factory(batch_size=3)
+    original = importer._process
+    calls = []
+
+    def crash_on_third_chunk(*args):
+        calls.append(1)
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        original(*args)
+
+    importer._process = crash_on_third_chunk
+    with pytest.raises(KeyboardInterrupt):
+        importer.run(source, checkpoint)
+    assert len(rows()) == 6
+
+    resumed, _ = importer_factory(batch_size=3)
+    stats = resumed.run(source, checkpoint)
+
+    assert (stats.read, stats.imported, stats.duplicates) == (10, 10, 0)
+    assert len(rows()) == 10
+    assert not os.path.exists(checkpoint)
+
+
+def test_bulk_import_enriches_plain_word_list(words_db, importer_factory, mock_upstream, tmp_path):
+    _, _, rows = words_db
+    source = tmp_path / "words.txt"
+    source.write_text("apple\nriver\napple\nx\n")
+
+    importer, collector = importer_factory(upstreams=mock_upstream.upstreams())
+    # Önbellekte olup words tablosunda olmayan kelime tekrar sayılmaz
+    collector.cache.put("example", "river", {"english": "A long river.", "turkish": "Uzun bir nehir."})
+    stats = importer.run(str(source))
+
+    assert (stats.imported, stats.duplicates, stats.invalid) == (2, 1, 1)
+    assert [row[:2] for row in rows()] == [("apple", "tr apple"), ("river", "tr river")]
+    assert collector.ledger.status("x")[0] == SKIPPED
+
+
+def test_upstream_reuses_connections(tmp_path):
+    words = ["apple", "river", "garden", "window"]
+    with MockUpstreamServer() as server:
+        collector = make_collector(server, tmp_path)
+        for word in words:
+            collector.process_word(word)
+
+    # Sıralı işlemede servis başına tek bağlantı yeter
+    assert server.connections == len(collector.upstreams) - 1
+    assert server.gzipped == sum(server.requests.values())
+
+    with MockUpstreamServer() as server:
+        collector = make_collector(server, tmp_path / "no-keep-alive", keep_alive=False)
+        for word in words:
+            collector.process_word(word)
+
+    assert server.connections == sum(server.requests.values())
+
+
+def test_get_json_revalidates_with_etag(mock_upstream, tmp_path):
+    cache = CacheStore(str(tmp_path / "cache.db"))
+    upstream = mock_upstream.upstreams()["dictionary"]
+
+    first = upstream.get_json("/entries/en/apple", cache=cache)
+    again = upstream.get_json("/entries/en/apple", cache=cache)
+    assert again == first
+    assert mock_upstream.not_modified == 1
+    assert mock_upstream.requests["dictionary"] == 2
+
+    # max_age içindeki yanıt hiç istenmez
+    upstream.get_json("/entries/en/apple", cache=cache, max_age=60)
+    assert mock_upstream.requests["dictionary"] == 2
+    cache.close()
+
+
+def test_get_json_rejects_unexpected_not_modified(mock_upstream, tmp_path):
+    cache = CacheStore(str(tmp_path / "cache.db"))
+    upstream = mock_upstream.upstreams()["dictionary"]
+    upstream.get_json("/entries/en/apple", cache=cache)
+    etag = cache.get("http:dictionary", mock_upstream.url + "/dictionary/entries/en/apple")["etag"]
+
+    # Önbellekte girdi yokken gelen 304 (ör. araya giren vekil sunucu)
+    upstream.session.headers["If-None-Match"] = etag
+    empty = CacheStore(str(tmp_path / "empty.db"))
+    with pytest.raises(ValueError, match="304"):
+        upstream.get_json("/entries/en/apple", cache=empty)
+    cache.close()
+    empty.close()
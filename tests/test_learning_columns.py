@@ -0,0 +1,102 @@
+# tests/test_learning_columns.py
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.word import Word
+from app.models.user_word import UserWord
+from app.utils import learning, learning_columns
+from app.utils.learning_columns import UserWordColumns, load_user_word_columns
+
+
+def random_user_words(count: int, seed: int = 42) -> list:
+    """Transient UserWord/Word objects with randomized review history"""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    parts_of_speech = ["noun", "verb", "adjective", "adverb", None]
+
+    user_words = []
+    for i in range(count):
+        reviewed = rng.random() > 0.1
+        user_words.append(UserWord(
+            word=Word(english=f"word-{i}", turkish=f"kelime-{i}", part_of_speech=rng.choice(parts_of_speech)),
+            times_reviewed=rng.randint(0, 10),
+            consecutive_correct=rng.randint(0, 6),
+            confidence_level=rng.randint(0, 100),
+            is_learned=rng.random() > 0.7,
+            mistakes_count=rng.randint(0, 8),
+            # Gün sınırlarından uzak dur: referans uygulama utcnow()'ı kendisi çağırıyor
+            last_reviewed=now - timedelta(days=rng.randint(0, 40), hours=rng.randint(1, 22)) if reviewed else None
+        ))
+    return user_words
+
+
+def test_retention_scores_match_reference():
+    user_words = random_user_words(500)
+    columns = UserWordColumns.from_user_words(user_words)
+
+    expected = [learning.calculate_retention_score(uw) for uw in user_words]
+    assert learning_columns.calculate_retention_scores(columns).tolist() == pytest.approx(expected)
+
+
+def test_problem_areas_match_reference():
+    user_words = random_user_words(500, seed=7)
+    columns = UserWordColumns.from_user_words(user_words)
+
+    assert learning_columns.identify_problem_areas(columns) == learning.identify_problem_areas(user_words)
+
+
+def test_best_review_time_matches_reference():
+    user_words = random_user_words(500, seed=11)
+    columns = UserWordColumns.from_user_words(user_words)
+    review_times = [uw.last_reviewed for uw in user_words if uw.last_reviewed]
+
+    assert learning_columns.calculate_best_review_time(columns) == learning.calculate_best_review_time(review_times)
+
+
+def test_analyze_learning_patterns_matches_reference():
+    user_words = random_user_words(1000, seed=3)
+    columns = UserWordColumns.from_user_words(user_words)
+
+    expected = learning.analyze_learning_patterns(user_words)
+    actual = learning_columns.analyze_learning_patterns(columns)
+
+    assert actual["average_retention"] == pytest.approx(expected["average_retention"])
+    assert actual["learning_rate"] == pytest.approx(expected["learning_rate"])
+    assert actual["problem_areas"] == expected["problem_areas"]
+    assert actual["best_time_to_review"] == expected["best_time_to_review"]
+
+
+def test_analyze_learning_patterns_empty():
+    columns = UserWordColumns.from_user_words([])
+    assert learning_columns.analyze_learning_patterns(columns) == learning.analyze_learning_patterns([])
+
+
+def test_load_user_word_columns(db: Session, test_user: dict, test_user_words: list):
+    columns = load_user_word_columns(db, test_user["id"])
+
+    assert len(columns) == len(test_user_words)
+    assert sorted(columns.pos_labels) == sorted({uw.word.part_of_speech for uw in test_user_words})
+
+
+def test_learning_patterns_endpoint_uses_columns(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        db: Session
+):
+    response = client.get(
+        "/api/v1/users/me/learning-patterns",
+        headers={"Authorization": f"Bearer {test_user['token']}"}
+    )
+
+    assert response.status_code == 200
+    user_words = db.query(UserWord).filter(UserWord.user_id == test_user["id"]).all()
+    expected = learning.analyze_learning_patterns(user_words)
+    data = response.json()
+    assert data["average_retention"] == pytest.approx(expected["average_retention"])
+    assert data["learning_rate"] == pytest.approx(expected["learning_rate"])
+    assert data["best_time_to_review"] == expected["best_time_to_review"]
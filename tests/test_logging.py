@@ -0,0 +1,72 @@
+# tests/test_logging.py
+import io
+import json
+import logging
+
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.utils import log
+from app.utils.log import JsonFormatter, RateLimitFilter, setup_logging
+
+
+def make_record(msg: str = "hot path", level: int = logging.DEBUG, **extra) -> logging.LogRecord:
+    record = logging.makeLogRecord({"name": "app.test", "msg": msg, "levelno": level, "lineno": 1, **extra})
+    record.levelname = logging.getLevelName(level)
+    return record
+
+
+def test_json_formatter_includes_extra_fields():
+    entry = json.loads(JsonFormatter().format(make_record("Login attempt", login="alice")))
+
+    assert entry["message"] == "Login attempt"
+    assert entry["logger"] == "app.test"
+    assert entry["login"] == "alice"
+
+
+def test_rate_limit_filter_samples_hot_path(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(log.time, "monotonic", lambda: now[0])
+    sampler = RateLimitFilter(rate=1, burst=2)
+
+    assert [sampler.filter(make_record()) for _ in range(5)] == [True, True, False, False, False]
+    # WARNING ve üstü örneklenmez
+    assert sampler.filter(make_record(level=logging.WARNING))
+
+    now[0] += 1
+    record = make_record()
+    assert sampler.filter(record)
+    assert record.suppressed == 3
+
+
+def test_setup_logging_applies_module_levels(monkeypatch):
+    stream = io.StringIO()
+    monkeypatch.setattr(settings, "LOG_LEVELS", {"app.test.verbose": "DEBUG"})
+    listener = setup_logging(stream)
+    try:
+        logging.getLogger("app.test.verbose").debug("shown", extra={"step": 1})
+        logging.getLogger("app.test.quiet").debug("hidden")
+        listener.stop()
+        log._listener = None
+    finally:
+        logging.getLogger("app.test.verbose").setLevel(logging.NOTSET)
+        setup_logging()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(line["message"], line["step"]) for line in lines] == [("shown", 1)]
+
+
+def test_login_does_not_log_password_hash(
+        client: TestClient,
+        test_user: dict,
+        caplog
+):
+    with caplog.at_level(logging.DEBUG):
+        response = client.post(
+            "/api/v1/auth/login",
+            data={"username": test_user["username"], "password": "testpassword"}
+        )
+
+    assert response.status_code == 200
+    for record in caplog.records:
+        assert "$2b$" not in json.dumps(vars(record), default=str)
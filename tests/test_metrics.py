@@ -0,0 +1,92 @@
+# tests/test_metrics.py
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.utils import metrics
+from app.utils.metrics import Histogram, RequestStats, clear_metrics
+
+
+def server_timing(response) -> dict:
+    """{metric: (dur, desc)} parsed from the Server-Timing header"""
+    timings = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, *params = entry.split(";")
+        fields = dict(param.split("=", 1) for param in params)
+        timings[name] = (float(fields["dur"]), fields.get("desc", "").strip('"'))
+    return timings
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("demo_seconds", "Demo", (0.1, 1.0), ("route",))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(("/demo",), value)
+
+    lines = histogram.render()
+
+    assert 'demo_seconds_bucket{route="/demo",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{route="/demo",le="1.0"} 3' in lines
+    assert 'demo_seconds_bucket{route="/demo",le="+Inf"} 4' in lines
+    assert 'demo_seconds_count{route="/demo"} 4' in lines
+    assert 'demo_seconds_sum{route="/demo"} 4.05' in lines
+
+
+def test_server_timing_counts_statements(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        count_queries
+):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+
+    with count_queries() as statements:
+        response = client.get("/api/v1/words/difficult-words", headers=headers)
+
+    assert response.status_code == 200
+    timings = server_timing(response)
+    assert timings["db"][1] == f"{len(statements)} statements"
+    assert timings["db"][0] >= timings["db-slowest"][0] > 0
+    assert timings["app"][0] >= timings["db"][0]
+    assert timings["app"][0] >= timings["serialize"][0] > 0
+
+
+def test_metrics_endpoint_exposes_route_histograms(client: TestClient, test_user: dict):
+    clear_metrics()
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    for _ in range(3):
+        client.get("/api/v1/auth/me", headers=headers)
+    client.get("/api/v1/words/progress/9999", headers=headers)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/auth/me"} 3' in body
+    # Path parametreleri etikete girmez
+    assert 'route="/api/v1/words/progress/{word_id}"' in body
+    assert "progress/9999" not in body
+    assert re.search(r'http_request_serialize_seconds_sum\{method="GET",route="/api/v1/auth/me"\} [0-9.e-]+', body)
+    assert re.search(r'app_cache_hits\{name="users"\} \d+', body)
+    assert re.search(r'password_hasher_pending\{name="default"\} 0', body)
+
+
+def test_failed_statement_leaves_nothing_on_connection(db: Session):
+    stats = RequestStats()
+    token = metrics._current.set(stats)
+    try:
+        with pytest.raises(DBAPIError):
+            db.execute(text("SELECT * FROM no_such_table"))
+        db.rollback()
+        db.execute(text("SELECT 1"))
+    finally:
+        metrics._current.reset(token)
+
+    # Yalnızca tamamlanan ifade sayılır; havuzdaki bağlantıda zaman kalmaz
+    assert stats.statements == 1
+    assert 0 <= stats.db_time < 1
+    assert "query_start" not in db.connection().info
@@ -0,0 +1,91 @@
+# tests/test_password_policy.py
+import pytest
+from fastapi.testclient import TestClient
+from passlib.hash import argon2
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.user import User
+from app.utils import security
+from app.utils.security import build_password_context
+
+
+def stored_hash(db: Session, user_id: int) -> str:
+    db.expire_all()
+    return db.query(User.password_hash).filter(User.id == user_id).scalar()
+
+
+def login(client: TestClient, username: str, password: str = "testpassword"):
+    return client.post("/api/v1/auth/login", data={"username": username, "password": password})
+
+
+@pytest.mark.parametrize("rounds", [4, 13])
+def test_login_rehashes_to_configured_rounds(
+        client: TestClient,
+        test_user: dict,
+        db: Session,
+        monkeypatch,
+        rounds: int
+):
+    assert stored_hash(db, test_user["id"]).startswith("$2b$12$")
+    monkeypatch.setattr(security, "pwd_context", build_password_context("bcrypt", bcrypt_rounds=rounds))
+
+    assert login(client, test_user["username"]).status_code == 200
+    assert stored_hash(db, test_user["id"]).startswith(f"$2b${rounds:02d}$")
+
+    # Yeni hash ile giriş devam eder ve tekrar yazılmaz
+    rehashed = stored_hash(db, test_user["id"])
+    assert login(client, test_user["username"]).status_code == 200
+    assert stored_hash(db, test_user["id"]) == rehashed
+
+
+def test_failed_login_does_not_rehash(
+        client: TestClient,
+        test_user: dict,
+        db: Session,
+        monkeypatch
+):
+    original = stored_hash(db, test_user["id"])
+    monkeypatch.setattr(security, "pwd_context", build_password_context("bcrypt", bcrypt_rounds=4))
+
+    assert login(client, test_user["username"], "wrongpassword").status_code == 401
+    assert stored_hash(db, test_user["id"]) == original
+
+
+def test_rehash_can_be_disabled(
+        client: TestClient,
+        test_user: dict,
+        db: Session,
+        monkeypatch
+):
+    original = stored_hash(db, test_user["id"])
+    monkeypatch.setattr(security, "pwd_context", build_password_context("bcrypt", bcrypt_rounds=4))
+    monkeypatch.setattr(settings, "PASSWORD_REHASH_ON_LOGIN", False)
+
+    assert login(client, test_user["username"]).status_code == 200
+    assert stored_hash(db, test_user["id"]) == original
+
+
+def test_unknown_scheme_is_rejected():
+    with pytest.raises(ValueError):
+        build_password_context("md5_crypt")
+
+
+@pytest.mark.skipif(argon2.has_backend(), reason="argon2-cffi is installed")
+def test_argon2_requires_backend():
+    with pytest.raises(RuntimeError):
+        build_password_context("argon2")
+
+
+@pytest.mark.skipif(not argon2.has_backend(), reason="argon2-cffi is not installed")
+def test_bcrypt_hashes_migrate_to_argon2(
+        client: TestClient,
+        test_user: dict,
+        db: Session,
+        monkeypatch
+):
+    context = build_password_context("argon2", argon2_time_cost=1, argon2_memory_cost=1024)
+    monkeypatch.setattr(security, "pwd_context", context)
+
+    assert login(client, test_user["username"]).status_code == 200
+    assert stored_hash(db, test_user["id"]).startswith("$argon2")
@@ -0,0 +1,53 @@
+# tests/test_password_pool.py
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.utils.password_pool import PasswordHasher, PasswordHasherBusy, password_hasher
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_hash_and_verify(workers: int):
+    hasher = PasswordHasher(workers=workers, queue_limit=4)
+
+    async def roundtrip():
+        hashed = await hasher.hash("secret-password")
+        return await hasher.verify("secret-password", hashed), await hasher.verify("wrong", hashed)
+
+    assert asyncio.run(roundtrip()) == (True, False)
+    assert hasher.pending == 0
+
+
+def test_full_queue_is_rejected():
+    hasher = PasswordHasher(workers=1, queue_limit=1)
+    release = threading.Event()
+
+    async def storm():
+        blocking = asyncio.create_task(hasher._run(release.wait))
+        await asyncio.sleep(0.01)
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.verify("secret", "$2b$12$invalid")
+        release.set()
+        await blocking
+
+    asyncio.run(storm())
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.pending == 0
+
+
+def test_login_returns_503_when_queue_is_full(
+        client: TestClient,
+        test_user: dict,
+        monkeypatch
+):
+    monkeypatch.setattr(password_hasher, "queue_limit", 0)
+
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": test_user["username"], "password": "testpassword"}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,95 @@
+# tests/test_query_detector.py
+import logging
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.user_word import UserWord
+from app.utils import metrics
+from app.utils.learning_columns import UserWordColumns, analyze_learning_patterns
+from app.utils.metrics import RequestStats
+from app.utils.query_detector import NPlusOneDetected, QueryDetector, fingerprint
+
+
+@contextmanager
+def detected_request():
+    """Run the block as if it were a sampled request to analyze_learning_patterns"""
+    scope = {"type": "http", "path": "/test", "endpoint": analyze_learning_patterns}
+    stats = RequestStats(scope, QueryDetector(scope))
+    token = metrics._current.set(stats)
+    try:
+        yield stats
+    finally:
+        metrics._current.reset(token)
+
+
+def lazy_load_words(db: Session, user_id: int) -> UserWordColumns:
+    # Kimlik haritası boşken her uw.word ayrı bir SELECT üretir
+    db.expunge_all()
+    user_words = db.query(UserWord).filter(UserWord.user_id == user_id).all()
+    return UserWordColumns.from_user_words(user_words)
+
+
+def test_fingerprint_ignores_parameters_and_in_list_length():
+    two = "SELECT words.id FROM words WHERE words.id IN (%(id_1_1)s, %(id_1_2)s) AND words.level = 2"
+    three = "SELECT words.id\nFROM words WHERE words.id IN (?, ?, ?) AND words.level = 3"
+
+    assert fingerprint(two) == fingerprint(three)
+    assert fingerprint("SELECT 1 FROM users") != fingerprint("SELECT 1 FROM words")
+
+
+def test_lazy_load_loop_raises_with_location(
+        db: Session,
+        test_user: dict,
+        test_user_words: list,
+        monkeypatch
+):
+    monkeypatch.setattr(settings, "QUERY_DETECTOR_REPEAT_THRESHOLD", 2)
+
+    with detected_request(), pytest.raises(NPlusOneDetected) as error:
+        lazy_load_words(db, test_user["id"])
+
+    message = str(error.value)
+    assert "app/utils/learning_columns.py" in message
+    assert "analyze_learning_patterns" in message
+
+
+def test_detector_logs_when_not_raising(
+        db: Session,
+        test_user: dict,
+        test_user_words: list,
+        monkeypatch,
+        caplog
+):
+    monkeypatch.setattr(settings, "QUERY_DETECTOR_REPEAT_THRESHOLD", 2)
+    monkeypatch.setattr(settings, "QUERY_DETECTOR_RAISE", False)
+
+    with caplog.at_level(logging.WARNING), detected_request() as stats:
+        lazy_load_words(db, test_user["id"])
+
+    [finding] = stats.detector.findings.values()
+    assert finding.count == len(test_user_words)
+    assert finding.location.startswith("app/utils/learning_columns.py:")
+    assert any(record.getMessage().startswith("Repeated SQL statement") for record in caplog.records)
+
+
+def test_slow_statements_are_logged_with_endpoint(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        monkeypatch,
+        caplog
+):
+    monkeypatch.setattr(settings, "QUERY_DETECTOR_SLOW_MS", 1e-6)
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+
+    with caplog.at_level(logging.WARNING):
+        assert client.get("/api/v1/words/difficult-words", headers=headers).status_code == 200
+
+    slow = [record for record in caplog.records if record.getMessage() == "Slow SQL statement"]
+    assert slow
+    assert all(record.endpoint.endswith("get_difficult_words") for record in slow)
+    assert all(record.location.startswith("app/") for record in slow)
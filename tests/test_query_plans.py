@@ -0,0 +1,91 @@
+# tests/test_query_plans.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session, Query
+
+from app.models.word import Word
+from app.models.user_word import UserWord
+from app.utils.review_queue import (
+    due_words_query,
+    learned_words_query,
+    difficult_words_query,
+    new_words_query
+)
+
+
+def explain(db: Session, query: Query) -> list:
+    """Run EXPLAIN for an ORM query and return the plan rows as dicts"""
+    compiled = query.statement.compile(dialect=db.bind.dialect)
+    result = db.connection().exec_driver_sql(f"EXPLAIN {compiled}", compiled.params)
+    return [dict(row._mapping) for row in result]
+
+
+def user_words_plan(plan: list) -> dict:
+    """Pick the plan row that reads the user_words table"""
+    return next(row for row in plan if row["table"] == "user_words")
+
+
+def assert_index_scan(plan: list, index_name: str):
+    row = user_words_plan(plan)
+    assert row["key"] == index_name, plan
+    assert row["type"] in ("range", "ref"), plan
+    for plan_row in plan:
+        assert "Using filesort" not in (plan_row["Extra"] or ""), plan
+
+
+@pytest.fixture
+def review_history(db: Session, test_user: dict, test_words: list) -> int:
+    """Seed enough rows for the optimizer to prefer the composite indexes"""
+    if db.bind.dialect.name != "mysql":
+        pytest.skip("EXPLAIN plans are only checked on MySQL")
+
+    db.query(Word).filter(Word.english.like("plan-word-%")).delete(synchronize_session=False)
+    db.commit()
+
+    words = [
+        Word(english=f"plan-word-{i}", turkish=f"plan-kelime-{i}", difficulty_level=1 + i % 3)
+        for i in range(300)
+    ]
+    db.add_all(words)
+    db.flush()
+
+    now = datetime.utcnow()
+    db.add_all([
+        UserWord(
+            user_id=test_user["id"],
+            word_id=word.id,
+            next_review=now + timedelta(hours=i - 150),
+            last_reviewed=now - timedelta(hours=i),
+            is_learned=(i % 4 == 0),
+            mistakes_count=i % 7
+        )
+        for i, word in enumerate(words)
+    ])
+    db.commit()
+    db.execute(text("ANALYZE TABLE user_words"))
+    return test_user["id"]
+
+
+def test_due_queue_uses_next_review_index(db: Session, review_history: int):
+    plan = explain(db, due_words_query(db, review_history).limit(10))
+    assert_index_scan(plan, "idx_user_next_review")
+
+
+def test_learned_words_uses_learned_index(db: Session, review_history: int):
+    plan = explain(db, learned_words_query(db, review_history).limit(50))
+    assert_index_scan(plan, "idx_user_learned_reviewed")
+
+
+def test_difficult_words_uses_mistakes_index(db: Session, review_history: int):
+    plan = explain(db, difficult_words_query(db, review_history).limit(10))
+    assert_index_scan(plan, "idx_user_mistakes")
+
+
+def test_new_words_walks_difficulty_index(db: Session, review_history: int):
+    plan = explain(db, new_words_query(db, review_history, after_level=1, after_id=0).limit(10))
+    words_row = next(row for row in plan if row["table"] == "words")
+    assert words_row["key"] == "idx_difficulty_id", plan
+    for plan_row in plan:
+        assert "Using filesort" not in (plan_row["Extra"] or ""), plan
@@ -0,0 +1,129 @@
+# tests/test_review_queue.py
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.word import Word
+from app.models.user_word import UserWord
+from app.utils.learning import get_due_words, calculate_priority_score
+from app.utils.catalog import get_word_catalog
+from app.utils.review_queue import priority_due_words_query
+
+# get_current_user + the review queue query (word details come from the catalog)
+NEXT_WORDS_QUERY_BUDGET = 2
+
+
+def create_due_words(db: Session, user_id: int, count: int) -> list:
+    """Create `count` words that are all due for the given user"""
+    db.query(UserWord).filter(UserWord.user_id == user_id).delete()
+    db.query(Word).filter(Word.english.like("queue-word-%")).delete(synchronize_session=False)
+    db.commit()
+
+    now = datetime.utcnow()
+    words = [
+        Word(
+            english=f"queue-word-{i}",
+            turkish=f"sıra-kelime-{i}",
+            difficulty_level=1,
+            part_of_speech="noun"
+        )
+        for i in range(count)
+    ]
+    db.add_all(words)
+    db.flush()
+
+    user_words = [
+        UserWord(
+            user_id=user_id,
+            word_id=word.id,
+            next_review=now - timedelta(hours=i + 1)
+        )
+        for i, word in enumerate(words)
+    ]
+    db.add_all(user_words)
+    db.commit()
+    return user_words
+
+
+def test_next_words_single_query(
+        client: TestClient,
+        test_user: dict,
+        db: Session,
+        count_queries
+):
+    """Review queue must not issue one Word lookup per due card"""
+    create_due_words(db, test_user["id"], 50)
+    get_word_catalog(db)
+
+    with count_queries() as statements:
+        response = client.get(
+            "/api/v1/words/next-words?limit=50",
+            headers={"Authorization": f"Bearer {test_user['token']}"}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 50
+    assert data[0]["english"].startswith("queue-word-")
+    assert data[0]["part_of_speech"] == "noun"
+    assert "retention_level" in data[0]
+    assert len(statements) <= NEXT_WORDS_QUERY_BUDGET
+
+
+@pytest.mark.query_budget(3)
+def test_next_words_ordered_by_priority(
+        client: TestClient,
+        test_user: dict,
+        db: Session
+):
+    """Words with more mistakes and lower confidence come first, even when less overdue"""
+    user_words = create_due_words(db, test_user["id"], 5)
+    for i, user_word in enumerate(user_words):
+        # queue-word-0 en az gecikmiş ama en çok hata yapılmış kelime
+        user_word.mistakes_count = (4 - i) * 3
+        user_word.confidence_level = i * 20
+    db.commit()
+
+    response = client.get(
+        "/api/v1/words/next-words?limit=5",
+        headers={"Authorization": f"Bearer {test_user['token']}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["english"] for item in data] == [f"queue-word-{i}" for i in range(5)]
+    # next_review sırası bunun tersi olurdu
+    next_reviews = [item["next_review"] for item in data]
+    assert next_reviews == sorted(next_reviews, reverse=True)
+
+
+def test_priority_queue_matches_python_scorer(
+        test_user: dict,
+        db: Session
+):
+    """SQL priority ranking must agree with utils.learning.calculate_priority_score"""
+    rng = random.Random(20241115)
+    user_words = create_due_words(db, test_user["id"], 60)
+
+    now = datetime.utcnow()
+    for user_word in user_words:
+        # Stay clear of day boundaries so both sides see the same whole days overdue
+        user_word.next_review = now - timedelta(days=rng.randint(0, 30), hours=rng.randint(1, 22))
+        user_word.retention_level = rng.randint(0, 7)
+        user_word.mistakes_count = rng.randint(0, 12)
+        user_word.confidence_level = rng.randint(0, 100)
+    db.commit()
+
+    limit = 15
+    all_user_words = db.query(UserWord).filter(UserWord.user_id == test_user["id"]).all()
+    expected = [calculate_priority_score(uw) for uw in get_due_words(all_user_words, limit)]
+
+    rows = priority_due_words_query(db, test_user["id"]).limit(limit).all()
+    actual = [float(priority) for _, priority in rows]
+
+    assert actual == pytest.approx(expected)
+    for user_word, priority in rows:
+        assert float(priority) == pytest.approx(calculate_priority_score(user_word))
@@ -0,0 +1,135 @@
+# tests/test_search.py
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.utils.search import WordSearchIndex, fold, get_search_index
+
+# get_current_user + user_words IN (indeks ve katalog zaten yüklü)
+SEARCH_QUERY_BUDGET = 2
+
+
+def build_index() -> WordSearchIndex:
+    return WordSearchIndex([
+        (1, "hello", "merhaba"),
+        (2, "shell", "kabuk"),
+        (3, "hell", "cehennem"),
+        (4, "Istanbul", "İstanbul"),
+        (5, "island", "ada"),
+        (6, "world", "dünya"),
+    ])
+
+
+def test_fold_turkish_i():
+    assert fold("İSTANBUL") == "istanbul"
+    assert fold("ılık") == "ilik"
+    assert fold("Işık") == fold("ışık") == "işik"
+
+
+def test_index_ranks_exact_then_prefix_then_infix():
+    total, ids = build_index().search("hell")
+    assert total == 3
+    assert ids == [3, 1, 2]
+
+
+def test_index_infix_match():
+    assert build_index().search("orl") == (1, [6])
+
+
+def test_index_turkish_case_insensitive():
+    index = build_index()
+    assert index.search("istanbul")[1] == [4]
+    assert index.search("İSTAN")[1] == [4]
+    assert index.search("ünya")[1] == [6]
+
+
+def test_index_short_query_scans():
+    total, ids = build_index().search("is")
+    assert total == 2
+    assert set(ids) == {4, 5}
+
+
+def test_index_pagination():
+    index = build_index()
+    total, first = index.search("hell", limit=2)
+    _, rest = index.search("hell", limit=2, offset=2)
+    assert total == 3
+    assert first + rest == [3, 1, 2]
+
+
+def test_index_no_match():
+    assert build_index().search("xyz") == (0, [])
+    assert build_index().search("   ") == (0, [])
+
+
+def test_search_infix_and_turkish(
+        client: TestClient,
+        test_user: dict,
+        test_words: list
+):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+
+    response = client.get("/api/v1/words/search?query=put", headers=headers)
+    assert response.status_code == 200
+    assert [w["english"] for w in response.json()] == ["computer"]
+
+    response = client.get("/api/v1/words/search?query=DÜNYA", headers=headers)
+    assert [w["english"] for w in response.json()] == ["world"]
+
+
+@pytest.mark.query_budget(3)
+def test_search_returns_learning_status(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list
+):
+    response = client.get(
+        "/api/v1/words/search?query=hello",
+        headers={"Authorization": f"Bearer {test_user['token']}"}
+    )
+
+    assert response.status_code == 200
+    status = response.json()[0]["learning_status"]
+    assert status is not None
+    assert "retention_level" in status
+
+
+def test_search_pagination_params(
+        client: TestClient,
+        test_user: dict,
+        test_words: list
+):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+
+    response = client.get("/api/v1/words/search?query=o&limit=1", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    total = int(response.headers["X-Total-Count"])
+    assert total > 1
+
+    response = client.get(f"/api/v1/words/search?query=o&limit=1&offset={total}", headers=headers)
+    assert response.json() == []
+    assert int(response.headers["X-Total-Count"]) == total
+
+    response = client.get("/api/v1/words/search?query=o&limit=0", headers=headers)
+    assert response.status_code == 422
+
+
+def test_search_query_budget(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        db: Session,
+        count_queries
+):
+    get_search_index(db)
+
+    with count_queries() as statements:
+        response = client.get(
+            "/api/v1/words/search?query=r",
+            headers={"Authorization": f"Bearer {test_user['token']}"}
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()) == len(test_user_words)
+    assert len(statements) <= SEARCH_QUERY_BUDGET, statements
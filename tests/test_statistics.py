@@ -0,0 +1,109 @@
+# tests/test_statistics.py
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.user_word import UserWord
+from app.utils.learning import identify_problem_areas
+from app.utils.statistics import get_problem_areas, user_statistics_cache
+
+# get_current_user + progress summary + problem areas
+PERFORMANCE_ANALYSIS_QUERY_BUDGET = 3
+
+
+def add_mistakes(db: Session, user_words: list) -> None:
+    parts_of_speech = ["noun", "verb", "noun"]
+    for i, user_word in enumerate(user_words):
+        user_word.word.part_of_speech = parts_of_speech[i % 3]
+        user_word.mistakes_count = 3 + i
+    db.commit()
+
+
+def test_problem_areas_match_reference(db: Session, test_user: dict, test_user_words: list):
+    """Aggregate query must agree with utils.learning.identify_problem_areas"""
+    add_mistakes(db, test_user_words)
+
+    user_words = db.query(UserWord).filter(UserWord.user_id == test_user["id"]).all()
+    assert get_problem_areas(db, test_user["id"]) == identify_problem_areas(user_words)
+
+
+@pytest.mark.query_budget(3)
+def test_performance_analysis_constant_queries(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        db: Session,
+        count_queries
+):
+    """performance-analysis must not lazy-load Word per card"""
+    add_mistakes(db, test_user_words)
+
+    with count_queries() as statements:
+        response = client.get(
+            "/api/v1/learning/performance-analysis",
+            headers={"Authorization": f"Bearer {test_user['token']}"}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_words"] == len(test_user_words)
+    assert data["problem_areas"] == ["noun", "verb"]
+    assert len(statements) <= PERFORMANCE_ANALYSIS_QUERY_BUDGET
+
+
+@pytest.fixture
+def statistics_cache(monkeypatch):
+    """Enable the per-user statistics cache for a single test"""
+    monkeypatch.setattr(user_statistics_cache, "ttl", 60)
+    user_statistics_cache.clear()
+    yield user_statistics_cache
+    user_statistics_cache.clear()
+
+
+def test_user_statistics_aggregate(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        count_queries
+):
+    with count_queries() as statements:
+        response = client.get(
+            "/api/v1/users/me/statistics",
+            headers={"Authorization": f"Bearer {test_user['token']}"}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    learned = sum(1 for uw in test_user_words if uw.is_learned)
+    assert data["total_words_learned"] == learned
+    assert data["words_in_progress"] == len(test_user_words) - learned
+    assert data["average_retention"] == pytest.approx(
+        sum(uw.retention_level for uw in test_user_words) / len(test_user_words)
+    )
+    # get_current_user + one aggregate query
+    assert len(statements) <= 2
+
+
+def test_user_statistics_cache_invalidation(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        statistics_cache,
+        count_queries
+):
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    first = client.get("/api/v1/users/me/statistics", headers=headers).json()
+
+    with count_queries() as statements:
+        cached = client.get("/api/v1/users/me/statistics", headers=headers).json()
+    assert cached == first
+    assert len(statements) == 0  # statistics and the user snapshot both cached
+    assert statistics_cache.stats()["hits"] >= 1
+
+    # Removing a word must drop the cached entry
+    word_id = test_user_words[0].word_id
+    assert client.delete(f"/api/v1/words/remove-from-learning/{word_id}", headers=headers).status_code == 200
+
+    after_remove = client.get("/api/v1/users/me/statistics", headers=headers).json()
+    total_before = first["total_words_learned"] + first["words_in_progress"]
+    assert after_remove["total_words_learned"] + after_remove["words_in_progress"] == total_before - 1
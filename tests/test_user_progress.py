@@ -6,8 +6,10 @@ from datetime import datetime, timedelta
 
 from app.models.user import User
 from app.models.user_word import UserWord
+from app.utils.progress import reset_user_progress
 
 
+@pytest.mark.query_budget(2)
 def test_user_statistics(
         client: TestClient,
         test_user: dict,
@@ -85,6 +87,7 @@ def test_reset_progress(
         assert user_word.mistakes_count == 0
 
 
+@pytest.mark.query_budget(2)
 def test_learning_patterns(
         client: TestClient,
         test_user: dict,
@@ -129,4 +132,39 @@ def test_update_user_profile(
     # Veritabanında güncellendiğini kontrol et
     user = db.query(User).filter(User.id == test_user["id"]).first()
     assert user.full_name == update_data["full_name"]
-    assert user.daily_goal == update_data["daily_goal"]
\ No newline at end of file
+    assert user.daily_goal == update_data["daily_goal"]
+
+def test_reset_progress_reports_count(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list
+):
+    """İlerleme sıfırlama sayısı testi"""
+    response = client.post(
+        "/api/v1/users/me/reset-progress",
+        headers={"Authorization": f"Bearer {test_user['token']}"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["reset_count"] == len(test_user_words)
+
+
+def test_reset_progress_in_chunks(
+        test_user: dict,
+        test_user_words: list,
+        db: Session
+):
+    """Parçalı (chunked) sıfırlama testi"""
+    for user_word in test_user_words:
+        user_word.retention_level = 4
+        user_word.mistakes_count = 2
+        user_word.is_learned = True
+    db.commit()
+
+    assert reset_user_progress(db, test_user["id"], chunk_size=2) == len(test_user_words)
+
+    user_words = db.query(UserWord).filter(UserWord.user_id == test_user["id"]).all()
+    for user_word in user_words:
+        assert user_word.retention_level == 0
+        assert user_word.mistakes_count == 0
+        assert not user_word.is_learned
@@ -68,6 +68,7 @@ def test_search_words(
     assert "learning_status" in data[0]
 
 
+@pytest.mark.query_budget(5)
 def test_add_to_learning(
         client: TestClient,
         test_user: dict,
@@ -95,6 +96,7 @@ def test_add_to_learning(
     assert "message" in data
 
 
+@pytest.mark.query_budget(3)
 def test_get_difficult_words(client: TestClient, test_user: dict, test_user_words: list, db: Session):
     """Test getting difficult words"""
     headers = {"Authorization": f"Bearer {test_user['token']}"}
@@ -156,6 +158,7 @@ def test_retention_level_progress(client: TestClient, test_user: dict, test_word
     progress_data = progress_response.json()
     assert progress_data["retention_level"] > 0
 
+@pytest.mark.query_budget(3)
 def test_get_learned_words(
         client: TestClient,
         test_user: dict,
@@ -185,4 +188,80 @@ def test_bulk_add_words(client: TestClient, test_user: dict, test_words: list):
     assert response.status_code == 200
     data = response.json()
     assert "added_count" in data
-    assert "skipped_count" in data
\ No newline at end of file
+    assert "skipped_count" in data
+
+def test_bulk_add_skips_existing_and_unknown(
+        client: TestClient,
+        test_user: dict,
+        test_user_words: list,
+        test_words: list,
+        db: Session,
+        count_queries
+):
+    """Toplu eklemede var olan, tekrarlanan ve bilinmeyen kelimeler atlanmalı"""
+    new_word = Word(english="bulk", turkish="toplu", difficulty_level=1, part_of_speech="noun")
+    db.add(new_word)
+    db.commit()
+
+    existing_id = test_user_words[0].word_id
+    unknown_id = max(w.id for w in test_words + [new_word]) + 1000
+    word_ids = [new_word.id, new_word.id, existing_id, unknown_id]
+
+    with count_queries() as statements:
+        response = client.post(
+            "/api/v1/words/bulk-add",
+            headers={"Authorization": f"Bearer {test_user['token']}"},
+            json={"word_ids": word_ids}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["added_count"] == 1
+    assert data["skipped_count"] == 3
+    # get_current_user + one IN lookup + one multi-row INSERT
+    assert len(statements) <= 3
+
+    count = db.query(UserWord).filter(
+        UserWord.user_id == test_user["id"],
+        UserWord.word_id == new_word.id
+    ).count()
+    assert count == 1
+
+
+def test_next_learning_words_keyset_pagination(
+        client: TestClient,
+        test_user: dict,
+        test_words: list,
+        db: Session
+):
+    """Yeni kelimeler sayfa sayfa, öğrenilenler hariç ve tekrarsız gelmeli"""
+    db.query(UserWord).filter(UserWord.user_id == test_user["id"]).delete()
+    db.add(UserWord(user_id=test_user["id"], word_id=test_words[0].id))
+    db.commit()
+
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    first_page = client.get("/api/v1/words/next-learning-words?limit=1", headers=headers).json()
+    assert len(first_page) == 1
+
+    last = first_page[-1]
+    second_page = client.get(
+        f"/api/v1/words/next-learning-words?limit=10&after_level={last['difficulty_level']}&after_id={last['id']}",
+        headers=headers
+    ).json()
+
+    seen = [w["id"] for w in first_page + second_page]
+    assert test_words[0].id not in seen
+    assert sorted(seen) == sorted(w.id for w in test_words[1:])
+    levels = [(w["difficulty_level"], w["id"]) for w in first_page + second_page]
+    assert levels == sorted(levels)
+
+
+def test_next_learning_words_rejects_half_cursor(
+        client: TestClient,
+        test_user: dict
+):
+    """after_level ve after_id birlikte verilmeli; yoksa ilk sayfa tekrar dönerdi"""
+    headers = {"Authorization": f"Bearer {test_user['token']}"}
+    for query in ("after_level=1", "after_id=5"):
+        response = client.get(f"/api/v1/words/next-learning-words?{query}", headers=headers)
+        assert response.status_code == 422
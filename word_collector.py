@@ -1,18 +1,26 @@
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 import logging
 import os
-import json
 import time
 import random
 from datetime import datetime
-import requests
-from deep_translator import GoogleTranslator
-import mysql.connector
 from dotenv import load_dotenv
 
+from collector.cache_store import DEFAULT_FILENAME as CACHE_FILENAME, CacheStore
+from collector.db_writer import WordWriter, mysql_connection_factory
+from collector.ledger import FAILED, SUCCEEDED, WordLedger
+from collector.pipeline import CollectorPipeline
+from collector.translate import parse_translation, translation_params
+from collector.upstreams import RateLimited, Upstream, default_upstreams
+
 load_dotenv()
 
+# Bu süreden genç yanıtlar yeniden istenmez; sonra ETag ile doğrulanır.
+# Datamuse listeleri nadiren değişir, Pexels saatlik kotası dardır.
+DATAMUSE_MAX_AGE = 24 * 3600
+PEXELS_MAX_AGE = 7 * 24 * 3600
+
 
 @dataclass
 class Word:
@@ -29,14 +37,33 @@ class Word:
 
 
 class WordCollector:
-    def __init__(self):
-        self.translator = GoogleTranslator(source='en', target='tr')
-        self.cache_dir = "cache"
-        os.makedirs(self.cache_dir, exist_ok=True)
+    def __init__(
+            self,
+            upstreams: Optional[Dict[str, Upstream]] = None,
+            cache_dir: str = "cache",
+            writer: Optional[WordWriter] = None,
+            ledger: Optional[WordLedger] = None
+    ):
+        # Dış servisler (adres + hız limiti); testler yerel mock sunucuyu verir
+        self.upstreams = upstreams or default_upstreams()
+        self.cache_dir = cache_dir
+        # Fonetik ve örnek cümleler tek SQLite dosyasında (collector.cache_store)
+        self.cache = CacheStore(os.path.join(self.cache_dir, CACHE_FILENAME))
         self.logger = self.setup_logger()
         self.common_words = self.load_common_words()
-        self.pexels_api_key = 'x'
-        self.image_cache = {}
+        self._writer = writer
+        self._ledger = ledger
+
+    def translate(self, text: str) -> str:
+        """Translate English text to Turkish through the rate-limited translate upstream"""
+        return self._translate(text.strip())
+
+    def _translate(self, text: str) -> str:
+        # 429/5xx upstream'de RetryableError olarak tekrar denenir
+        response = self.upstreams['translate'].get('', params=translation_params(text))
+        if response.status_code != 200:
+            raise ValueError(f"translate returned {response.status_code}")
+        return parse_translation(response.text, text)
 
     def setup_logger(self):
         """Setup logging configuration"""
@@ -80,22 +107,21 @@ class WordCollector:
             for topic in topics:
                 # Her topic için farklı API endpointlerini kullanalım
                 endpoints = [
-                    f"https://api.datamuse.com/words?topics={topic}&max={limit}",
-                    f"https://api.datamuse.com/words?ml={topic}&max={limit}",
-                    f"https://api.datamuse.com/words?rel_syn={topic}&max={limit}"
+                    f"/words?topics={topic}&max={limit}",
+                    f"/words?ml={topic}&max={limit}",
+                    f"/words?rel_syn={topic}&max={limit}"
                 ]
 
-                for url in endpoints:
-                    response = requests.get(url)
-                    if response.status_code == 200:
-                        data = response.json()
+                for path in endpoints:
+                    # Hız limiti upstream'in token bucket'ında
+                    data = self.upstreams['datamuse'].get_json(path, cache=self.cache, max_age=DATAMUSE_MAX_AGE)
+                    if isinstance(data, list):
                         for word_data in data:
                             word = word_data.get('word', '')
                             # Kelime uzunluğu kontrolünü biraz genişletelim
                             if (word.isalpha() and 2 <= len(word) <= 15 and
                                     ' ' not in word):  # Tek kelime olsun
                                 words.add(word)
-                    time.sleep(0.1)  # Rate limiting
         except Exception as e:
             self.logger.error(f"Error fetching words from Datamuse API: {str(e)}")
         return list(words)
@@ -180,24 +206,27 @@ class WordCollector:
             phonetic = phonetic.replace(old, new)
         return f"/{phonetic}/"
 
-    def get_phonetic(self, word: str) -> str:
-        """Get phonetic transcription"""
-        cache_file = os.path.join(self.cache_dir, f'phonetic_{word}.json')
+    def get_dictionary_entry(self, word: str) -> Optional[Dict]:
+        """First dictionaryapi.dev entry for a word, or None"""
+        data = self.upstreams['dictionary'].get_json(f"/entries/en/{word}", cache=self.cache)
+        if isinstance(data, list) and len(data) > 0:
+            return data[0]
+        return None
 
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                return json.load(f)['phonetic']
+    def get_phonetic(self, word: str, entry: Optional[Dict] = None) -> str:
+        """Get phonetic transcription"""
+        cached = self.cache.get('phonetic', word)
+        if cached is not None:
+            return cached
 
         try:
-            url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-            response = requests.get(url)
-            data = response.json()
+            if entry is None:
+                entry = self.get_dictionary_entry(word)
 
-            if isinstance(data, list) and len(data) > 0:
-                phonetic = data[0].get('phonetic', '')
+            if entry is not None:
+                phonetic = entry.get('phonetic', '')
                 if phonetic:
-                    with open(cache_file, 'w') as f:
-                        json.dump({'phonetic': phonetic}, f)
+                    self.cache.put('phonetic', word, phonetic)
                     return phonetic
 
         except Exception as e:
@@ -205,13 +234,27 @@ class WordCollector:
 
         return self.generate_basic_phonetic(word)
 
+    def get_dictionary_details(self, word: str) -> Tuple[str, Dict[str, str]]:
+        """Phonetic and example sentence from a single dictionary lookup"""
+        entry = None
+        cached = all(self.cache.contains(kind, word) for kind in ('phonetic', 'example'))
+        if not cached:
+            try:
+                entry = self.get_dictionary_entry(word)
+            except Exception as e:
+                self.logger.error(f"Error fetching dictionary entry for {word}: {str(e)}")
+                # İki yardımcı da tekrar denemesin; varsayılanlara düşsünler
+                entry = {}
+        return self.get_phonetic(word, entry), self.get_example_sentence(word, entry)
+
+    def discard_details(self, word: str) -> None:
+        """Drop the cached phonetic and example of a word that could not be processed"""
+        for kind in ('phonetic', 'example'):
+            self.cache.delete(kind, word)
+
     def get_image_url(self, word: str) -> Optional[str]:
         """Get image URL from Pexels API"""
         try:
-            headers = {
-                'Authorization': self.pexels_api_key
-            }
-
             part_of_speech = self.guess_part_of_speech(word)
             search_modifiers = {
                 'noun': f"object {word}",
@@ -221,13 +264,14 @@ class WordCollector:
             }
 
             modified_query = search_modifiers.get(part_of_speech, word)
-            url = f'https://api.pexels.com/v1/search?query={modified_query}&per_page=1&orientation=square'
-            response = requests.get(url, headers=headers)
-            data = response.json()
+            path = f'/search?query={modified_query}&per_page=1&orientation=square'
+            data = self.upstreams['pexels'].get_json(path, cache=self.cache, max_age=PEXELS_MAX_AGE)
 
             if data.get('photos') and len(data['photos']) > 0:
                 return data['photos'][0]['src']['medium']
 
+        except RateLimited:
+            self.logger.warning(f"Pexels quota exhausted, skipping image for {word}")
         except Exception as e:
             self.logger.error(f"Error getting image for {word}: {str(e)}")
 
@@ -237,31 +281,27 @@ class WordCollector:
         """Get audio URL"""
         return f"https://translate.google.com/translate_tts?ie=UTF-8&q={word}&tl=en&client=tw-ob"
 
-    def get_example_sentence(self, word: str) -> Dict[str, str]:
+    def get_example_sentence(self, word: str, entry: Optional[Dict] = None) -> Dict[str, str]:
         """Get example sentence"""
-        cache_file = os.path.join(self.cache_dir, f'example_{word}.json')
-
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                return json.load(f)
+        cached = self.cache.get('example', word)
+        if cached is not None:
+            return cached
 
         try:
-            url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-            response = requests.get(url)
-            data = response.json()
+            if entry is None:
+                entry = self.get_dictionary_entry(word)
 
-            if isinstance(data, list) and len(data) > 0:
-                for meaning in data[0].get('meanings', []):
+            if entry is not None:
+                for meaning in entry.get('meanings', []):
                     for definition in meaning.get('definitions', []):
                         if 'example' in definition:
                             example = definition['example']
-                            translation = self.translator.translate(example)
+                            translation = self.translate(example)
                             result = {
                                 'english': example,
                                 'turkish': translation
                             }
-                            with open(cache_file, 'w') as f:
-                                json.dump(result, f)
+                            self.cache.put('example', word, result)
                             return result
 
         except Exception as e:
@@ -270,7 +310,7 @@ class WordCollector:
         default_example = f"This is a {word}."
         return {
             'english': default_example,
-            'turkish': self.translator.translate(default_example)
+            'turkish': self.translate(default_example)
         }
 
     def calculate_difficulty(self, word: str) -> int:
@@ -340,110 +380,94 @@ class WordCollector:
 
         return tags
 
-    def process_word(self, word: str) -> Optional[Word]:
-        """Process a single word"""
-        # Eğer kelime daha önce işlenmişse atla
-        if os.path.exists(os.path.join(self.cache_dir, f'example_{word}.json')):
+    def skip_reason(self, word: str) -> Optional[str]:
+        """Why a raw word should not be processed, or None"""
+        # İşlenmiş kelimeler defterden (ledger.filter_new) ayıklanır; önbellek
+        # yalnızca aramaları kısaltır, hata alan kelimenin de girdisi olabilir
+        if not word.isalpha() or len(word) < 2:
+            return "not a word"
+
+        return None
+
+    def normalize_word(self, word: str) -> Optional[str]:
+        """Lower-cased word, or None when it should not be processed"""
+        if self.skip_reason(word) is not None:
             return None
 
+        return word.lower().strip()
+
+    def build_word(
+            self,
+            word: str,
+            translation: str,
+            phonetic: str,
+            example: Dict[str, str],
+            image_url: Optional[str]
+    ) -> Optional[Word]:
+        """Combine the upstream lookups of a normalized word into a Word"""
+        if not translation or translation == word:
+            return None
+
+        difficulty = self.calculate_difficulty(word)
+        return Word(
+            english=word,
+            turkish=translation,
+            phonetic=phonetic,
+            difficulty_level=difficulty,
+            part_of_speech=self.guess_part_of_speech(word),
+            example_sentence=example['english'],
+            example_sentence_translation=example['turkish'],
+            image_url=image_url,
+            audio_url=self.get_audio_url(word),
+            tags=self.generate_tags(word, difficulty)
+        )
+
+    def process_word(self, word: str) -> Optional[Word]:
+        """Process a single word, one lookup after another"""
         try:
-            # Önce basit kontrollerden geçirelim
-            if not word.isalpha() or len(word) < 2:
+            word = self.normalize_word(word)
+            if word is None:
                 return None
 
-            # Kelimeyi normalize edelim
-            word = word.lower().strip()
-
-            translation = self.translator.translate(word)
+            translation = self.translate(word)
             if not translation or translation == word:
                 return None
 
-            phonetic = self.get_phonetic(word)
-            difficulty = self.calculate_difficulty(word)
-            part_of_speech = self.guess_part_of_speech(word)
-            example = self.get_example_sentence(word)
-
-            # Örnek cümle kontrolü
-            if example['english'] == f"This is a {word}.":
-                # Varsayılan örnek cümle gelmiş, başka bir tane deneyelim
-                time.sleep(1)
-                example = self.get_example_sentence(word)
-
+            phonetic, example = self.get_dictionary_details(word)
             image_url = self.get_image_url(word)
-            audio_url = self.get_audio_url(word)
-            tags = self.generate_tags(word, difficulty)
-
-            return Word(
-                english=word,
-                turkish=translation,
-                phonetic=phonetic,
-                difficulty_level=difficulty,
-                part_of_speech=part_of_speech,
-                example_sentence=example['english'],
-                example_sentence_translation=example['turkish'],
-                image_url=image_url,
-                audio_url=audio_url,
-                tags=tags
-            )
+            return self.build_word(word, translation, phonetic, example, image_url)
 
         except Exception as e:
             self.logger.error(f"Error processing word {word}: {str(e)}")
+            if word is not None:
+                self.discard_details(word)
             return None
 
+    @property
+    def writer(self) -> WordWriter:
+        """Batched database writer, connected on first use"""
+        if self._writer is None:
+            self._writer = WordWriter(mysql_connection_factory())
+        return self._writer
+
+    @property
+    def ledger(self) -> WordLedger:
+        """Processed-word ledger, opened on first use"""
+        if self._ledger is None:
+            self._ledger = WordLedger()
+        return self._ledger
+
     def save_to_database(self, word: Word) -> None:
-        """Save word to database"""
-        try:
-            conn = mysql.connector.connect(
-                host=os.getenv('DB_HOST'),
-                user=os.getenv('DB_USER'),
-                password=os.getenv('DB_PASSWORD'),
-                database=os.getenv('DB_NAME'),
-                ssl_disabled=True
-            )
-            cursor = conn.cursor()
-
-            sql = """
-            INSERT INTO words (
-                english, turkish, phonetic, difficulty_level,
-                part_of_speech, example_sentence, example_sentence_translation,
-                image_url, audio_url, tags
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON DUPLICATE KEY UPDATE
-                turkish = VALUES(turkish),
-                phonetic = VALUES(phonetic),
-                difficulty_level = VALUES(difficulty_level),
-                part_of_speech = VALUES(part_of_speech),
-                example_sentence = VALUES(example_sentence),
-                example_sentence_translation = VALUES(example_sentence_translation),
-                image_url = VALUES(image_url),
-                audio_url = VALUES(audio_url),
-                tags = VALUES(tags)
-            """
-
-            values = (
-                word.english,
-                word.turkish,
-                word.phonetic,
-                word.difficulty_level,
-                word.part_of_speech,
-                word.example_sentence,
-                word.example_sentence_translation,
-                word.image_url,
-                word.audio_url,
-                ','.join(word.tags)
-            )
-
-            cursor.execute(sql, values)
-            conn.commit()
-            self.logger.info(f"Successfully saved word: {word.english}")
+        """Queue word for the next batched database write"""
+        self.writer.add(word)
 
-        except Exception as e:
-            self.logger.error(f"Database error for word {word.english}: {str(e)}")
-        finally:
-            if 'cursor' in locals() and cursor:
-                cursor.close()
-            if 'conn' in locals() and conn.is_connected():
-                conn.close()
+    def close(self) -> None:
+        """Write any buffered words and release the database, ledger and cache connections"""
+        if self._writer is not None:
+            self._writer.close()
+        if self._ledger is not None:
+            self._ledger.close()
+        self.cache.close()
 
     def collect_words_from_all_sources(self, count_per_source=20) -> List[str]:
         words = set()
@@ -465,78 +489,73 @@ class WordCollector:
 
         return list(words)
 
-    def reset_processed_words():
-        if os.path.exists('processed_words.txt'):
-            os.remove('processed_words.txt')
-    def save_progress(self, processed_words: List[str]):
-        """Save processed words to file"""
-        with open('processed_words.txt', 'a') as f:
-            for word in processed_words:
-                f.write(f"{word}\n")
-
-    def load_processed_words(self) -> Set[str]:
-        """Load previously processed words"""
-        processed = set()
-        if os.path.exists('processed_words.txt'):
-            with open('processed_words.txt', 'r') as f:
-                processed.update(line.strip() for line in f)
-        return processed
-
 
 def main():
     collector = WordCollector()
+    ledger = collector.ledger
+    # Atlanan ve hata alan kelimeler nedeniyle deftere yazılır
+    pipeline = CollectorPipeline(collector, on_outcome=ledger.record)
 
-    while True:
-        try:
-            processed_words = collector.load_processed_words()
-
-            # Her seferinde farklı sayıda kelime deneyelim
-            count = random.randint(50, 200)
-            words = collector.collect_words_from_all_sources(count_per_source=count)
+    # İlk çalıştırmada eski düz metin ilerleme dosyası deftere aktarılır
+    if not ledger.counts() and os.path.exists('processed_words.txt'):
+        print(f"Imported {ledger.import_text_file('processed_words.txt')} words from processed_words.txt")
 
-            # Kelime listesini karıştıralım
-            random.shuffle(words)
+    try:
+        while True:
+            try:
+                # Her seferinde farklı sayıda kelime deneyelim
+                count = random.randint(50, 200)
+                words = collector.collect_words_from_all_sources(count_per_source=count)
 
-            # İşlenmemiş kelimeleri al
-            new_words = [w for w in words if w not in processed_words]
-            print(f"\nFound {len(new_words)} new words to process")
+                # Kelime listesini karıştıralım
+                random.shuffle(words)
 
-            if not new_words:
-                print("No new words to process. Trying different sources...")
-                # Farklı bir API endpoint'i deneyelim
-                extra_words = collector.get_words_from_datamuse(limit=100)
-                new_words = [w for w in extra_words if w not in processed_words]
+                # İşlenmemiş kelimeleri al; önceki turlarda hata alanlar yeniden denenir
+                retry_words = [word for word, _, _ in ledger.failed(limit=10)]
+                new_words = ledger.filter_new(retry_words + words)
+                print(f"\nFound {len(new_words)} new words to process")
 
                 if not new_words:
-                    print("Still no new words. Waiting before next attempt...")
-                    time.sleep(5)
-                    continue
-
-            newly_processed = []
-            for word in new_words[:50]:  # Her seferde en fazla 50 kelime işleyelim
-                print(f"\nProcessing word: {word}")
-                processed_word = collector.process_word(word)
-
-                if processed_word:
+                    print("No new words to process. Trying different sources...")
+                    # Farklı bir API endpoint'i deneyelim
+                    extra_words = collector.get_words_from_datamuse(limit=100)
+                    new_words = ledger.filter_new(extra_words)
+
+                    if not new_words:
+                        print("Still no new words. Waiting before next attempt...")
+                        time.sleep(5)
+                        continue
+
+                newly_processed = []
+                failed_writes = collector.writer.failed
+                # Kelimeler eşzamanlı işlenir; hız limitleri upstream'lerde
+                for processed_word in pipeline.run(new_words[:50]):  # Her seferde en fazla 50 kelime işleyelim
                     collector.save_to_database(processed_word)
-                    newly_processed.append(word)
-                    print(f"Successfully processed and saved: {word}")
-
-                time.sleep(1)  # API rate limiting
+                    newly_processed.append(processed_word.english)
+                    print(f"Successfully processed: {processed_word.english}")
+
+                # İlerleme kaydından önce kalan kelimeler veritabanına yazılsın
+                collector.writer.flush()
+                if collector.writer.failed > failed_writes:
+                    # Upsert tekrarlanabilir; turun kelimeleri sonra yeniden denenir
+                    ledger.record_many(newly_processed, FAILED, "database write failed")
+                else:
+                    ledger.record_many(newly_processed, SUCCEEDED)
+
+                print(f"\nProcessed {len(newly_processed)} new words")
+
+            except KeyboardInterrupt:
+                print("\nScript stopped by user.")
+                break
+            except Exception as e:
+                print(f"\nAn error occurred: {str(e)}")
+                print("Retrying in 30 seconds...")
+                time.sleep(2)
+    finally:
+        # Ctrl+C dahil her çıkışta tampondaki kelimeler yazılır
+        collector.close()
 
-            collector.save_progress(newly_processed)
 
-            print(f"\nProcessed {len(newly_processed)} new words")
-            print("\nWaiting before next batch...")
-            time.sleep(5)
-
-        except KeyboardInterrupt:
-            print("\nScript stopped by user.")
-            break
-        except Exception as e:
-            print(f"\nAn error occurred: {str(e)}")
-            print("Retrying in 30 seconds...")
-            time.sleep(2)
 if __name__ == "__main__":
     try:
         print("Starting continuous word collection. Press Ctrl+C to stop.")